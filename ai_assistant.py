@@ -1,7 +1,7 @@
 import json
 import asyncio
 import os
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable
 import openai
 from rich.console import Console
 from groot.config import config
@@ -11,11 +11,21 @@ from groot.command_generator import CommandGenerator
 
 console = Console()
 
+def openai_chat(request: Dict[str, Any]) -> str:
+    """Send a chat completion request to OpenAI and return the reply text."""
+    response = openai.ChatCompletion.create(**request)
+    return response.choices[0].message.content
+
 class AIAssistant:
     """Enhanced AI assistant for Kubernetes and cloud troubleshooting."""
 
-    def __init__(self, api_key: str = None):
-        """Initialize the AI assistant."""
+    def __init__(self, api_key: str = None, llm: Callable[[Dict[str, Any]], str] = None):
+        """Initialize the AI assistant.
+
+        llm sends a chat request (model, messages, temperature, max_tokens)
+        and returns the reply text; it defaults to openai_chat. Replace it
+        to record, replay or stub LLM traffic.
+        """
         # Use API key from config or parameter
         self.api_key = api_key or config.get("openai_api_key")
         if not self.api_key:
@@ -23,6 +33,8 @@ class AIAssistant:
         else:
             openai.api_key = self.api_key
 
+        self.llm = llm or openai_chat
+
         # Initialize components
         self.nlp_engine = NLPEngine()
         self.knowledge_base = KnowledgeBase()
@@ -130,6 +142,15 @@ class AIAssistant:
 
                 messages.append({"role": "system", "content": yaml_context})
 
+            # Add the resource's logs, condensed into templates
+            if self.context.get("log_summary"):
+                log_context = "Here are the resource's recent logs, grouped into templates (<*> marks variable parts):\n\n"
+                log_context += self.context["log_summary"] + "\n\n"
+                for template in self.context.get("log_templates", [])[:5]:
+                    log_context += f"Example of \"{template['template']}\":\n{template['examples'][0]}\n\n"
+
+                messages.append({"role": "system", "content": log_context})
+
             # Add parsed query information
             query_info = f"""
             The user's query has been parsed as follows:
@@ -149,15 +170,13 @@ class AIAssistant:
             # Add the current query
             messages.append({"role": "user", "content": query})
 
-            # Get response from OpenAI
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=messages,
-                temperature=0.7,
-                max_tokens=2000
-            )
-
-            return response.choices[0].message.content
+            # Get response from the LLM
+            return self.llm({
+                "model": "gpt-4",
+                "messages": messages,
+                "temperature": 0.7,
+                "max_tokens": 2000
+            })
 
         except Exception as e:
             console.print(f"[red]Error getting AI response: {e}[/red]")
@@ -188,18 +207,16 @@ class AIAssistant:
             Include what it is, why it's important, and how it works. 
             Provide a simple example if applicable."""
 
-            # Get response from OpenAI
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=[
+            # Get response from the LLM
+            return self.llm({
+                "model": "gpt-4",
+                "messages": [
                     {"role": "system", "content": "You are Groot, an AI assistant specialized in Kubernetes. Explain concepts clearly and concisely."},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.7,
-                max_tokens=1000
-            )
-
-            return response.choices[0].message.content
+                "temperature": 0.7,
+                "max_tokens": 1000
+            })
 
         except Exception as e:
             console.print(f"[red]Error explaining concept: {e}[/red]")
@@ -220,18 +237,16 @@ class AIAssistant:
             4. How they interact with each other (if applicable)
             """
 
-            # Get response from OpenAI
-            response = openai.ChatCompletion.create(
-                model="gpt-4",
-                messages=[
+            # Get response from the LLM
+            return self.llm({
+                "model": "gpt-4",
+                "messages": [
                     {"role": "system", "content": "You are Groot, an AI assistant specialized in Kubernetes. Provide clear, accurate comparisons."},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.7,
-                max_tokens=1500
-            )
-
-            return response.choices[0].message.content
+                "temperature": 0.7,
+                "max_tokens": 1500
+            })
 
         except Exception as e:
             console.print(f"[red]Error comparing resources: {e}[/red]")
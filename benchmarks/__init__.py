@@ -0,0 +1,8 @@
+"""
+Benchmarks for Groot CLI hot paths.
+
+python -m groot.benchmarks runs the whole suite and writes the results as
+JSON; pass --compare with an earlier results file to check for regressions.
+Each bench_* module can also be run on its own, e.g.
+python -m groot.benchmarks.bench_raw_json.
+"""
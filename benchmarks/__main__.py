@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: times and traces allocations of Groot CLI's hot paths.
+
+Runs analyze_resources and check_k8s_status against synthetic clusters of
+several sizes (saved as snapshots, so no API server or network is involved),
+NLPEngine.parse_query on a query corpus, KnowledgeBase.search,
+CommandGenerator.generate_commands and AIAssistant prompt building with a
+stubbed LLM. Results are written as JSON; --compare flags regressions
+against an earlier results file and exits with status 1 if there are any.
+
+    python -m groot.benchmarks --output after.json --compare before.json
+
+With --cassette, every command of a session recorded with groot --record is
+also timed end to end (scan_namespace, process_nl_query, ...), replaying the
+cluster's and the LLM's responses with --cassette-latency.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+from typing import Any, Callable, Dict, List
+from unittest import mock
+
+from groot.benchmarks.harness import compare, format_bytes, load, measure, save
+
+# Natural language queries as users type them
+QUERIES = [
+    "why is my pod crashing in namespace payments",
+    "my deployment checkout keeps restarting",
+    "show me all pods in the kube-system namespace",
+    "how do I fix ImagePullBackOff",
+    "what is a statefulset",
+    "service frontend cannot connect to the database",
+    "list deployments in namespace search",
+    "my pods are pending and won't schedule",
+    "compare deployment vs statefulset",
+    "explain how ingress works on gke",
+    "the api is slow, high latency on pod api-7d9f",
+    "pvc stuck in pending in namespace data",
+    "forbidden error when accessing secrets with rbac",
+    "how to scale deployment web to 5 replicas",
+    "get logs of pod worker-0 in the last 30 minutes",
+    "why is my eks node not ready",
+    "top 10 pods by memory in namespace analytics",
+    "configmap changes are not picked up by my deployment",
+    "troubleshoot network policy blocking traffic to service billing",
+    "how does the hpa autoscale my deployment on aks"
+]
+
+def _parsed(query: str, action: str, resource_types: List[str] = (), issue_types: List[str] = (),
+            cloud_providers: List[str] = (), namespace: str = None, requires_code: bool = False) -> Dict[str, Any]:
+    """A parse result in the shape NLPEngine.parse_query returns."""
+    return {
+        "original_query": query,
+        "intent": {"action": action, "confidence": 0.8},
+        "entities": {
+            "resource_type": list(resource_types),
+            "resource_name": [],
+            "namespace": namespace,
+            "cloud_provider": list(cloud_providers),
+            "issue_type": list(issue_types),
+            "time_period": None,
+            "count": None
+        },
+        "context": {
+            "is_question": query.startswith(("why", "how", "what")),
+            "requires_explanation": action == "explain",
+            "requires_code": requires_code,
+            "requires_comparison": action == "compare"
+        }
+    }
+
+# Parse results of QUERIES, fixed so the knowledge base, command and prompt
+# benchmarks don't depend on the spaCy model
+PARSED_QUERIES = [
+    _parsed(QUERIES[0], "troubleshoot", ["pod"], ["crash"], namespace="payments"),
+    _parsed(QUERIES[1], "troubleshoot", ["deployment"], ["crash"]),
+    _parsed(QUERIES[2], "list", ["pod", "namespace"], namespace="kube-system"),
+    _parsed(QUERIES[3], "troubleshoot", ["pod"], ["crash"], requires_code=True),
+    _parsed(QUERIES[4], "explain", ["statefulset"]),
+    _parsed(QUERIES[5], "troubleshoot", ["service"], ["network"]),
+    _parsed(QUERIES[6], "list", ["deployment", "namespace"], namespace="search"),
+    _parsed(QUERIES[7], "troubleshoot", ["pod"], ["scaling"]),
+    _parsed(QUERIES[8], "compare", ["deployment", "statefulset"]),
+    _parsed(QUERIES[9], "explain", ["ingress"], ["network"], ["gcp"]),
+    _parsed(QUERIES[10], "troubleshoot", ["pod"], ["performance"]),
+    _parsed(QUERIES[11], "troubleshoot", ["pvc", "pod"], ["storage"], namespace="data"),
+    _parsed(QUERIES[12], "troubleshoot", ["secret"], ["security"]),
+    _parsed(QUERIES[13], "update", ["deployment"], ["scaling"], requires_code=True),
+    _parsed(QUERIES[14], "list", ["pod"]),
+    _parsed(QUERIES[15], "troubleshoot", ["node"], cloud_providers=["aws"]),
+    _parsed(QUERIES[16], "list", ["pod"], ["performance"], namespace="analytics"),
+    _parsed(QUERIES[17], "troubleshoot", ["configmap", "deployment"], ["configuration"]),
+    _parsed(QUERIES[18], "troubleshoot", ["service"], ["network"]),
+    _parsed(QUERIES[19], "explain", ["deployment"], ["scaling"], ["azure"])
+]
+
+class SkipBenchmark(Exception):
+    """Raised by a benchmark's setup when it can't run here."""
+
+class _StubLLM:
+    """Stands in for the LLM: returns a canned answer, keeping the request it was sent."""
+
+    def __init__(self):
+        self.request = None
+
+    def __call__(self, request: Dict[str, Any]) -> str:
+        self.request = request
+        return "Check the pod's events and previous container logs."
+
+def _knowledge_base(workdir: str):
+    """A knowledge base holding the built-in entries, as created on first run."""
+    from groot.knowledge_base import KnowledgeBase
+    return KnowledgeBase(os.path.join(workdir, "knowledge_base"))
+
+def _scanner(pods: int, seed: int, workdir: str):
+    """A scanner serving a synthetic cluster of about pods pods from a snapshot file."""
+    from groot.k8s_scanner import K8sScanner
+    from groot.loadtest.generator import SyntheticCluster
+
+    path = SyntheticCluster(pods, seed=seed).write_snapshot(os.path.join(workdir, f"cluster-{pods}.grs"))
+    # Blocking I/O keeps the measured work on one thread
+    return K8sScanner(snapshot=path, io_mode="blocking")
+
+def bench_analyze_resources(loop, pods: int, seed: int, workdir: str) -> Callable[[], Any]:
+    scanner = _scanner(pods, seed, workdir)
+
+    def run():
+        # Analyze every object each run rather than reusing the previous run's results
+        scanner._analysis_cache = {}
+        return loop.run_until_complete(scanner.analyze_resources("all"))
+    return run
+
+def bench_check_k8s_status(loop, pods: int, seed: int, workdir: str) -> Callable[[], Any]:
+    try:
+        from groot import cli
+        from rich.console import Console
+    except ImportError as e:
+        raise SkipBenchmark(f"groot.cli can't be imported: {e}")
+
+    # Only the scanner is needed; the constructor would also load the NLP model
+    groot_cli = cli.GrootCLI.__new__(cli.GrootCLI)
+    groot_cli.scanner = _scanner(pods, seed, workdir)
+    groot_cli.cluster_context = {}
+    devnull = open(os.devnull, "w")
+
+    def run():
+        with mock.patch.object(cli, "console", Console(file=devnull, width=160, force_terminal=True)):
+            return loop.run_until_complete(groot_cli.check_k8s_status())
+    return run
+
+def bench_parse_query(loop, **_) -> Callable[[], Any]:
+    try:
+        import spacy
+        from groot.nlp_engine import NLPEngine
+    except ImportError as e:
+        raise SkipBenchmark(f"groot.nlp_engine can't be imported: {e}")
+    if not spacy.util.is_package("en_core_web_lg"):
+        raise SkipBenchmark("spaCy model en_core_web_lg is not installed")
+
+    engine = NLPEngine()
+    return lambda: [engine.parse_query(query) for query in QUERIES]
+
+def bench_knowledge_base_search(loop, workdir: str, **_) -> Callable[[], Any]:
+    kb = _knowledge_base(workdir)
+    return lambda: [kb.search(parsed) for parsed in PARSED_QUERIES]
+
+def bench_generate_commands(loop, **_) -> Callable[[], Any]:
+    from groot.command_generator import CommandGenerator
+
+    generator = CommandGenerator()
+    context = {"current_namespace": "default"}
+    return lambda: [generator.generate_commands(parsed, context) for parsed in PARSED_QUERIES]
+
+def bench_ai_prompt(loop, workdir: str, **_) -> Callable[[], Any]:
+    try:
+        from groot import ai_assistant
+        from groot.command_generator import CommandGenerator
+    except ImportError as e:
+        raise SkipBenchmark(f"groot.ai_assistant can't be imported: {e}")
+
+    kb = _knowledge_base(workdir)
+    generator = CommandGenerator()
+    context = {"current_namespace": "default"}
+    inputs = [(parsed["original_query"], parsed, kb.search(parsed), generator.generate_commands(parsed, context),
+               generator.generate_yaml_examples(parsed) if parsed["context"]["requires_code"] else [])
+              for parsed in PARSED_QUERIES]
+
+    # Only prompt building is measured; the constructor would also load the NLP model
+    assistant = ai_assistant.AIAssistant.__new__(ai_assistant.AIAssistant)
+    assistant.api_key = "benchmark"
+    assistant.llm = _StubLLM()
+    assistant.context = {}
+    assistant.conversation_history = []
+    for query, *_ in inputs[:5]:
+        assistant._update_conversation_history(query, "A previous answer. " * 40)
+
+    return lambda: [loop.run_until_complete(assistant._generate_ai_response(*arguments)) for arguments in inputs]
+
+def replay_benchmarks(path: str, latency: Any) -> Dict[str, Callable[[], Any]]:
+    """Setups of one benchmark per command of a recorded session, replayed from its cassette."""
+    from groot.cassette import Cassette
+    from groot.rate_limiter import RequestScheduler
+
+    commands = Cassette(path).metadata.get("commands") or []
+    session = {}
+
+    def start(loop):
+        """Open the CLI and run the session once, keeping the assistant's state before each command."""
+        try:
+            from groot import cli
+            import spacy
+            from rich.console import Console
+        except ImportError as e:
+            raise SkipBenchmark(f"groot.cli can't be imported: {e}")
+        if not spacy.util.is_package("en_core_web_lg"):
+            raise SkipBenchmark("spaCy model en_core_web_lg is not installed")
+
+        # Output is rendered to /dev/null from here on
+        cli.console = Console(file=open(os.devnull, "w"), width=160, force_terminal=True)
+        cassette = Cassette(path, "replay", latency)
+        groot_cli = cli.GrootCLI(cassette=cassette)
+        states = []
+        for command in commands:
+            assistant = groot_cli.ai_assistant
+            states.append((list(assistant.conversation_history), dict(assistant.context)))
+            loop.run_until_complete(groot_cli.process_command(command))
+        session.update(cli=groot_cli, cassette=cassette, states=states)
+
+    def setup(index: int):
+        def bench(loop, **_) -> Callable[[], Any]:
+            if "cli" not in session:
+                start(loop)
+            groot_cli, cassette = session["cli"], session["cassette"]
+            history, context = session["states"][index]
+
+            def run():
+                # Start each run like a new session: a full request budget and the recorded conversation so far
+                scanner = groot_cli.scanner
+                scanner.scheduler = RequestScheduler(scanner.scheduler.qps, scanner.scheduler.burst)
+                cassette.rewind()
+                groot_cli.ai_assistant.conversation_history = list(history)
+                groot_cli.ai_assistant.context = dict(context)
+                return loop.run_until_complete(groot_cli.process_command(commands[index]))
+            return run
+        return bench
+
+    return {f"cli[{command}]": setup(index) for index, command in enumerate(commands)}
+
+# Benchmarks run once per cluster size, and once in total
+SIZED_BENCHMARKS = {
+    "analyze_resources": bench_analyze_resources,
+    "check_k8s_status": bench_check_k8s_status
+}
+BENCHMARKS = {
+    "nlp_engine.parse_query": bench_parse_query,
+    "knowledge_base.search": bench_knowledge_base_search,
+    "command_generator.generate_commands": bench_generate_commands,
+    "ai_assistant.prompt": bench_ai_prompt
+}
+
+def run_suite(sizes: List[int], repeat: int, seed: int, only: str = None, cassette: str = None,
+              cassette_latency: Any = None) -> Dict[str, Dict[str, Any]]:
+    """Run every benchmark whose name contains only, returning results by name."""
+    loop = asyncio.new_event_loop()
+
+    cases = []
+    for name, setup in SIZED_BENCHMARKS.items():
+        for pods in sizes:
+            cases.append((f"{name}[pods={pods}]", setup, {"pods": pods}))
+    for name, setup in BENCHMARKS.items():
+        cases.append((name, setup, {}))
+    if cassette:
+        for name, setup in replay_benchmarks(cassette, cassette_latency).items():
+            cases.append((name, setup, {}))
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="groot-bench-") as workdir:
+        for name, setup, kwargs in cases:
+            if only and only not in name:
+                continue
+
+            print(f"{name:<45}", end="", flush=True)
+            try:
+                func = setup(loop, seed=seed, workdir=workdir, **kwargs)
+                results[name] = measure(func, repeat)
+            except SkipBenchmark as e:
+                results[name] = {"skipped": str(e)}
+                print(f"skipped: {e}")
+                continue
+
+            result = results[name]
+            print(f"{result['min'] * 1000:10.2f} ms  (median {result['median'] * 1000:.2f} ms)"
+                  f"  peak {format_bytes(result['peak_bytes'])}")
+    loop.close()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Groot CLI hot paths")
+    parser.add_argument("--sizes", default="500,2000,5000", help="Comma-separated cluster sizes in pods")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic clusters")
+    parser.add_argument("--only", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--cassette", help="Cassette of a session recorded with groot --record to replay")
+    parser.add_argument("--cassette-latency", help="Delay of replayed responses: 'recorded' or seconds (default: none)")
+    parser.add_argument("--output", default="groot-benchmarks.json", help="Where to write the results")
+    parser.add_argument("--compare", help="Results file of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown or growth counted as a regression")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    results = run_suite(sizes, args.repeat, args.seed, args.only, args.cassette, args.cassette_latency)
+    save(args.output, results, {"sizes": sizes, "repeat": args.repeat, "seed": args.seed,
+                                "cassette": args.cassette, "cassette_latency": args.cassette_latency})
+    print(f"\nResults written to {args.output}")
+
+    if not args.compare:
+        return
+
+    baseline = load(args.compare)
+    rows = compare(baseline["results"], results, args.threshold)
+    print(f"\nCompared with {args.compare} ({baseline['environment'].get('groot_version')}, "
+          f"{baseline['environment'].get('created', '')[:19]}):")
+    for name, metric, old, new, change, regressed in rows:
+        if metric == "min":
+            old_text, new_text = f"{old * 1000:.2f} ms", f"{new * 1000:.2f} ms"
+        else:
+            old_text, new_text = format_bytes(old), format_bytes(new)
+        flag = "  REGRESSION" if regressed else ""
+        print(f"  {name:<45} {metric:<10} {old_text:>12} -> {new_text:>12}  {change:+7.1%}{flag}")
+
+    if any(row[-1] for row in rows):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: kubernetes client model deserialization vs the raw JSON fast path.
+
+Decodes a synthetic 10k-pod PodList both ways and runs the scanner's pod
+checks over the result.
+"""
+
+import argparse
+import json
+import time
+
+from kubernetes import client
+
+from groot.k8s_scanner import K8sScanner
+from groot.utils.k8s_objects import ObjectView, loads
+
+def make_pod(i: int) -> dict:
+    """Build one realistic pod manifest."""
+    name = f"app-{i % 200}-{i:06d}"
+    crashing = i % 50 == 0
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": f"team-{i % 40}",
+            "uid": f"00000000-0000-0000-0000-{i:012d}",
+            "resourceVersion": str(100000 + i),
+            "creationTimestamp": "2024-05-01T12:00:00Z",
+            "labels": {"app": f"app-{i % 200}", "pod-template-hash": "5d8f9c7b6"},
+            "ownerReferences": [{"apiVersion": "apps/v1", "kind": "ReplicaSet", "name": f"app-{i % 200}-5d8f9c7b6",
+                                 "uid": f"rs-{i % 200}", "controller": True}]
+        },
+        "spec": {
+            "nodeName": f"node-{i % 300}",
+            "containers": [{
+                "name": "main",
+                "image": "registry.example.com/app:1.2.3",
+                "env": [{"name": f"VAR_{j}", "value": "x" * 20} for j in range(10)],
+                "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                "resources": {"limits": {"cpu": "500m", "memory": "256Mi"}} if i % 3 else {},
+                "volumeMounts": [{"name": "config", "mountPath": "/etc/app"}]
+            }],
+            "volumes": [{"name": "config", "configMap": {"name": "app-config"}}]
+        },
+        "status": {
+            "phase": "Pending" if crashing else "Running",
+            "podIP": "10.0.0.1",
+            "startTime": "2024-05-01T12:00:05Z",
+            "conditions": [{"type": "Ready", "status": "True", "lastTransitionTime": "2024-05-01T12:00:10Z"}],
+            "containerStatuses": [{
+                "name": "main",
+                "image": "registry.example.com/app:1.2.3",
+                "imageID": "sha256:abc",
+                "ready": not crashing,
+                "restartCount": 15 if crashing else 0,
+                "state": {"waiting": {"reason": "CrashLoopBackOff"}} if crashing else
+                         {"running": {"startedAt": "2024-05-01T12:00:08Z"}}
+            }]
+        }
+    }
+
+def make_pod_list(count: int) -> bytes:
+    """Serialize a PodList of count pods as the API server would."""
+    return json.dumps({
+        "kind": "PodList",
+        "apiVersion": "v1",
+        "metadata": {"resourceVersion": "123456"},
+        "items": [make_pod(i) for i in range(count)]
+    }).encode()
+
+def time_it(func, repeat: int) -> float:
+    """Return the best wall time of func over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare model and raw JSON decoding of a large PodList")
+    parser.add_argument("--pods", type=int, default=10000, help="Number of pods in the fixture")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per variant; the best is reported")
+    args = parser.parse_args()
+
+    data = make_pod_list(args.pods)
+    api_client = client.ApiClient()
+    scanner = K8sScanner()
+
+    def models():
+        # Same work as ApiClient.deserialize, whose signature differs between client versions
+        pod_list = api_client._ApiClient__deserialize(json.loads(data), "V1PodList")
+        for pod in pod_list.items:
+            scanner._check_pod(pod)
+
+    def raw():
+        for item in loads(data)["items"]:
+            scanner._check_pod(ObjectView(item))
+
+    model_time = time_it(models, args.repeat)
+    raw_time = time_it(raw, args.repeat)
+
+    print(f"{args.pods} pods, {len(data) / 1e6:.1f} MB of JSON")
+    print(f"  kubernetes models: {model_time * 1000:8.1f} ms")
+    print(f"  raw JSON views:    {raw_time * 1000:8.1f} ms")
+    print(f"  speedup:           {model_time / raw_time:8.1f}x")
+
+if __name__ == "__main__":
+    main()
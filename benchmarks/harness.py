@@ -0,0 +1,120 @@
+"""
+Timing, allocation tracking and result comparison for the benchmark suite.
+"""
+
+import datetime
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import groot
+
+def measure(func: Callable[[], Any], repeat: int = 5, warmup: int = 1, min_time: float = 0.05) -> Dict[str, Any]:
+    """Time func over repeat samples after warmup runs, then trace the allocations of one more run.
+
+    Fast functions are called several times per sample, so that a sample
+    takes at least min_time seconds; times are per call. Timed runs are made
+    without tracemalloc, which slows allocation-heavy code several times
+    over. peak_bytes is the most memory held at once during the traced run,
+    allocated_bytes what it still held at the end.
+    """
+    for _ in range(warmup):
+        func()
+
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= min_time or number >= 10000:
+            break
+        number *= 10
+
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = func()
+        after, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "runs": repeat,
+        "calls_per_run": number,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "peak_bytes": peak - before,
+        "allocated_bytes": after - before
+    }
+
+def environment() -> Dict[str, Any]:
+    """What the results were measured on."""
+    return {
+        "groot_version": groot.__version__,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat()
+    }
+
+def save(path: str, results: Dict[str, Dict[str, Any]], parameters: Dict[str, Any]):
+    """Write results as JSON."""
+    with open(path, "w") as f:
+        json.dump({"environment": environment(), "parameters": parameters, "results": results}, f, indent=2, sort_keys=True)
+
+def load(path: str) -> Dict[str, Any]:
+    """Read results written by save."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+def compare(baseline: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]],
+            threshold: float = 0.10) -> List[Tuple[str, str, float, float, float, bool]]:
+    """Compare two result sets benchmark by benchmark.
+
+    Times are compared by their minimum, the least noisy statistic, and
+    memory by peak_bytes. Returns (benchmark, metric, baseline, current,
+    change, regressed) rows, where change is the relative difference and
+    regressed means it grew by more than threshold. Benchmarks skipped in
+    either run are left out.
+    """
+    rows = []
+    for name in sorted(set(baseline) & set(current)):
+        before, after = baseline[name], current[name]
+        if "skipped" in before or "skipped" in after:
+            continue
+
+        for metric in ("min", "peak_bytes"):
+            old, new = before.get(metric), after.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            rows.append((name, metric, old, new, change, change > threshold))
+    return rows
+
+def format_bytes(count: Optional[float]) -> str:
+    if count is None:
+        return "-"
+    for unit in ("B", "KB", "MB"):
+        if abs(count) < 1024:
+            return f"{count:.0f} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GB"
@@ -0,0 +1,241 @@
+"""Record and replay of Kubernetes API and LLM traffic for Groot CLI.
+
+A cassette file holds request/response pairs. In record mode, Groot talks to
+the cluster and the LLM as usual and every exchange is captured with how
+long it took; in replay mode, the same requests are answered from the file
+without a network, optionally after the recorded (or a fixed) delay. That
+makes end-to-end timings of commands repeatable offline.
+
+Kubernetes traffic is captured at the HTTP level of the API client, so
+typed, raw JSON, table and log responses as well as API errors are all
+replayed exactly. Streaming requests (watches, followed logs) are not
+recorded. Files ending in .gz are gzip compressed.
+"""
+
+import datetime
+import gzip
+import hashlib
+import json
+import threading
+import time
+import urllib.parse
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from kubernetes.client.rest import ApiException
+    k8s_available = True
+except ImportError:
+    k8s_available = False
+
+CASSETTE_VERSION = 1
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode for a request the cassette holds no response to."""
+
+def _key(request: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(request, sort_keys=True, default=str).encode()).hexdigest()
+
+class _ReplayResponse:
+    """A recorded HTTP response, with the parts of urllib3's HTTPResponse the API client uses."""
+
+    def __init__(self, status: int, reason: str, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.data = body
+        self._position = 0
+
+    def getheaders(self) -> Dict[str, str]:
+        return self.headers
+
+    def getheader(self, name: str, default: str = None) -> Optional[str]:
+        for header, value in self.headers.items():
+            if header.lower() == name.lower():
+                return value
+        return default
+
+    def read(self, amt: int = None, decode_content: bool = None) -> bytes:
+        end = len(self.data) if amt is None else self._position + amt
+        chunk = self.data[self._position:end]
+        self._position += len(chunk)
+        return chunk
+
+    def stream(self, amt: int = 2 ** 16, decode_content: bool = None):
+        while True:
+            chunk = self.read(amt)
+            if not chunk:
+                return
+            yield chunk
+
+    def release_conn(self):
+        pass
+
+    def close(self):
+        pass
+
+class Cassette:
+    """Request/response pairs of a session, recorded to or replayed from a file.
+
+    mode is "record" or "replay". In replay mode, latency None answers
+    immediately, "recorded" waits as long as the original request took, and
+    a number waits that many seconds per request. A request made several
+    times is answered with its recorded responses in order, repeating the
+    last one; rewind() starts over, e.g. between benchmark runs.
+    """
+
+    def __init__(self, path: str, mode: str = "replay", latency: Any = None):
+        """Open a cassette; replay mode reads the file, record mode starts empty."""
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.metadata: Dict[str, Any] = {}
+        self.interactions: List[Dict[str, Any]] = []
+        self._responses: Dict[str, List[Dict[str, Any]]] = {}
+        self._played: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if mode == "replay":
+            self._load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def _load(self):
+        opener = gzip.open if self.path.endswith(".gz") else open
+        with opener(self.path, "rt", encoding="utf-8") as f:
+            document = json.load(f)
+
+        if document.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"{self.path} is not a version {CASSETTE_VERSION} cassette")
+
+        self.metadata = document.get("metadata") or {}
+        self.interactions = document.get("interactions") or []
+        for interaction in self.interactions:
+            self._responses.setdefault(interaction["key"], []).append(interaction)
+
+    def save(self):
+        """Write the recorded interactions to the file."""
+        if not self.recording:
+            return
+
+        opener = gzip.open if self.path.endswith(".gz") else open
+        with self._lock:
+            document = {
+                "version": CASSETTE_VERSION,
+                "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                "metadata": self.metadata,
+                "interactions": list(self.interactions)
+            }
+        with opener(self.path, "wt", encoding="utf-8") as f:
+            json.dump(document, f)
+
+    def rewind(self):
+        """Replay every request's responses from the first again."""
+        with self._lock:
+            self._played = {}
+
+    def _record(self, channel: str, request: Dict[str, Any], response: Dict[str, Any], duration: float):
+        with self._lock:
+            self.interactions.append({
+                "channel": channel,
+                "key": _key(request),
+                "request": request,
+                "response": response,
+                "duration": duration
+            })
+
+    def _replay(self, channel: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        """The next recorded response to a request, after the simulated latency."""
+        key = _key(request)
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                raise CassetteMiss(f"No recorded {channel} response to {request.get('path') or request.get('model')}")
+            index = self._played.get(key, 0)
+            self._played[key] = index + 1
+            interaction = responses[min(index, len(responses) - 1)]
+
+        if self.latency == "recorded":
+            time.sleep(interaction["duration"])
+        elif self.latency:
+            time.sleep(float(self.latency))
+        return interaction["response"]
+
+    def wrap_rest_client(self, rest_client: Any):
+        """Route a kubernetes RESTClientObject's requests through the cassette."""
+        request_func = rest_client.request
+
+        def request(method, url, query_params=None, headers=None, body=None, post_params=None,
+                    _preload_content=True, _request_timeout=None):
+            query = [(str(name), str(value)) for name, value in query_params or []]
+            streaming = any(name in ("watch", "follow") and value.lower() == "true" for name, value in query)
+            key = {
+                "method": method,
+                "path": urllib.parse.urlsplit(url).path,
+                "query": sorted(query),
+                "accept": (headers or {}).get("Accept"),
+                "body": body
+            }
+
+            if self.replaying:
+                if streaming:
+                    raise ApiException(status=0, reason="Streaming requests are not recorded in cassettes")
+                try:
+                    recorded = self._replay("k8s", key)
+                except CassetteMiss as e:
+                    raise ApiException(status=0, reason=str(e))
+                if not recorded["status"]:
+                    raise ApiException(status=0, reason=recorded["reason"])
+
+                body = recorded["body"]
+                response = _ReplayResponse(recorded["status"], recorded["reason"], recorded["headers"],
+                                           body.encode("utf-8") if not _preload_content else body)
+                if not 200 <= response.status <= 299:
+                    raise ApiException(http_resp=response)
+                return response
+
+            if streaming:
+                return request_func(method, url, query_params, headers, body, post_params, _preload_content, _request_timeout)
+
+            started = time.perf_counter()
+            try:
+                response = request_func(method, url, query_params, headers, body, post_params, _preload_content, _request_timeout)
+            except ApiException as e:
+                body_text = e.body.decode("utf-8", "replace") if isinstance(e.body, bytes) else e.body or ""
+                self._record("k8s", key, {"status": e.status or 0, "reason": e.reason, "headers": dict(e.headers or {}),
+                                          "body": body_text}, time.perf_counter() - started)
+                raise
+
+            # Loaded responses hold the decoded text, unloaded ones the raw bytes
+            data = response.data
+            body = data.decode("utf-8", "replace") if isinstance(data, bytes) else data
+            response_headers = dict(getattr(response, "urllib3_response", response).headers or {})
+            self._record("k8s", key, {"status": response.status, "reason": response.reason, "headers": response_headers,
+                                      "body": body}, time.perf_counter() - started)
+            if _preload_content:
+                return response
+            # The body of an unloaded response has been read, so hand out a copy
+            return _ReplayResponse(response.status, response.reason, response_headers, data)
+
+        rest_client.request = request
+
+    def wrap_llm(self, llm: Callable[[Dict[str, Any]], str]) -> Callable[[Dict[str, Any]], str]:
+        """Wrap an LLM hook, which takes a chat request and returns the reply text."""
+        def wrapped(request: Dict[str, Any]) -> str:
+            if self.replaying:
+                return self._replay("llm", request)["content"]
+
+            started = time.perf_counter()
+            content = llm(request)
+            self._record("llm", request, {"content": content}, time.perf_counter() - started)
+            return content
+
+        return wrapped
@@ -1,4 +1,5 @@
 import asyncio
+import datetime
 import sys
 import os
 import json
@@ -12,20 +13,33 @@ from rich.syntax import Syntax
 from rich import box
 import click
 
-from groot.k8s_scanner import K8sScanner
-from groot.ai_assistant import AIAssistant
+from groot.k8s_scanner import K8sScanner, OWNER_GRAPH_KINDS
+from groot.fleet import FleetScanner
+from groot.ai_assistant import AIAssistant, openai_chat
+from groot.cassette import Cassette
 from groot.nlp_engine import NLPEngine
 from groot.config import config
+from groot.log_miner import mine_logs
+from groot.event_index import EventIndex, event_last_seen
+from groot.resilience import ScanResult
+from groot.utils.helpers import format_age, parse_duration
 
 console = Console()
 
 class GrootCLI:
     """Enhanced Groot CLI with comprehensive Kubernetes troubleshooting capabilities."""
 
-    def __init__(self):
+    def __init__(self, context: str = None, snapshot: str = None, cassette: Cassette = None):
         self.running = True
-        self.scanner = K8sScanner()
-        self.ai_assistant = AIAssistant()
+        self.cassette = cassette
+        self.scanner = K8sScanner(context=context, snapshot=snapshot, cassette=cassette)
+        self.fleet = None
+        self.ai_assistant = AIAssistant(llm=cassette.wrap_llm(openai_chat) if cassette else None)
+        if cassette and cassette.recording:
+            cassette.metadata["llm"] = bool(self.ai_assistant.api_key)
+        elif cassette:
+            # Replayed answers don't need an API key, and a session recorded without one has none
+            self.ai_assistant.api_key = "cassette" if cassette.metadata.get("llm") else None
         self.nlp_engine = NLPEngine()
         self.current_namespace = config.get("default_namespace", "default")
         self.cluster_context = {}
@@ -49,8 +63,12 @@ class GrootCLI:
         help_table.add_row("scan namespace [name]", "Scan resources in a namespace")
         help_table.add_row("analyze [resource] [name]", "Analyze a specific resource")
         help_table.add_row("custom-resource [type] [name]", "Analyze a custom resource")
-        help_table.add_row("logs [pod] [namespace]", "Get logs for a pod")
-        help_table.add_row("events [namespace]", "Get events in a namespace")
+        help_table.add_row("get [type] [namespace]", "List resources of any type, including custom resources")
+        help_table.add_row("fleet [namespace]", "Show pod health across all kubeconfig contexts")
+        help_table.add_row("snapshot save [file] [namespace]", "Save the cluster to a snapshot file for offline analysis with --snapshot")
+        help_table.add_row("api-stats", "Show API request rate limiting, retry and circuit breaker stats")
+        help_table.add_row("logs [pod] [namespace] [-f]", "Get logs for a pod, -f to follow them")
+        help_table.add_row("events [namespace] [--since 2h]", "Get events in a namespace, --since to include archived events")
         help_table.add_row("explain [concept]", "Explain a Kubernetes concept")
         help_table.add_row("compare [resource1] [resource2]", "Compare two Kubernetes resources")
         help_table.add_row("best-practices [resource]", "Show best practices for a resource")
@@ -73,6 +91,9 @@ class GrootCLI:
         if not parts:
             return "Please enter a command or question."
 
+        if self.cassette and self.cassette.recording:
+            self.cassette.metadata.setdefault("commands", []).append(command)
+
         cmd = parts[0].lower()
 
         if cmd == "help":
@@ -98,16 +119,58 @@ class GrootCLI:
 
             return await self.analyze_resource(resource_type, name, namespace)
 
-        elif cmd == "logs" and len(parts) >= 2:
-            pod = parts[1]
+        elif cmd == "custom-resource" and len(parts) >= 3:
+            resource_type = parts[1]
+            name = parts[2]
+            namespace = parts[3] if len(parts) > 3 else self.current_namespace
+
+            return await self.analyze_resource(resource_type, name, namespace)
+
+        elif cmd == "get" and len(parts) >= 2:
+            resource_type = parts[1]
             namespace = parts[2] if len(parts) > 2 else self.current_namespace
 
+            return await self.list_resources(resource_type, namespace)
+
+        elif cmd == "fleet":
+            namespace = parts[1] if len(parts) > 1 else "all"
+
+            return await self.fleet_status(namespace)
+
+        elif cmd == "snapshot" and len(parts) >= 3 and parts[1] == "save":
+            namespace = parts[3] if len(parts) > 3 else "all"
+
+            return await self.save_snapshot(parts[2], namespace)
+
+        elif cmd == "api-stats":
+            return self.show_api_stats()
+
+        elif cmd == "logs" and len(parts) >= 2:
+            follow = "-f" in parts or "--follow" in parts
+            args = [part for part in parts[1:] if part not in ("-f", "--follow")]
+            if not args:
+                return "Please specify a pod name."
+
+            pod = args[0]
+            namespace = args[1] if len(args) > 1 else self.current_namespace
+
+            if follow:
+                return await self.follow_pod_logs(pod, namespace)
             return await self.get_pod_logs(pod, namespace)
 
         elif cmd == "events" and len(parts) >= 1:
-            namespace = parts[1] if len(parts) > 1 else self.current_namespace
+            args = parts[1:]
+            since = None
+            if "--since" in args:
+                position = args.index("--since")
+                since = parse_duration(args[position + 1]) if position + 1 < len(args) else None
+                if since is None:
+                    return "Please give --since a duration such as 30m, 2h or 1d."
+                args = args[:position] + args[position + 2:]
+
+            namespace = args[0] if args else self.current_namespace
 
-            return await self.get_namespace_events(namespace)
+            return await self.get_namespace_events(namespace, since)
 
         elif cmd == "explain" and len(parts) >= 2:
             concept = " ".join(parts[1:])
@@ -138,19 +201,27 @@ class GrootCLI:
         """Retrieve and display the status of Kubernetes resources in a table format."""
         with console.status("[cyan]Checking Kubernetes resource status...", spinner="dots"):
             # Get resources
-            pods = await self.scanner.get_pods()
             deployments = await self.scanner.get_deployments()
-            services = await self.scanner.get_services()
+            services = await self.scanner.get_resource_table("service")
             namespaces = await self.scanner.get_namespaces()
 
+            pod_errors = []
+            snapshot = await self.scanner.get_pod_snapshot(errors=pod_errors)
+
             # Update cluster context
             self.cluster_context = {
                 "namespaces": namespaces,
-                "pod_count": len(pods),
+                "pod_count": len(snapshot),
                 "deployment_count": len(deployments),
-                "service_count": len(services)
+                "service_count": len(services["rows"])
             }
 
+        # An API brownout must not look like an empty, healthy cluster
+        status = ScanResult(errors=pod_errors, partial=bool(pod_errors)).merge_status(
+            namespaces, deployments, ScanResult(partial=services.get("partial", False), errors=services.get("errors"))
+        )
+        self._report_degraded(status, "Cluster status is")
+
         # Namespaces table
         ns_table = Table(title="📁 Namespaces", border_style="green", box=box.ROUNDED)
         ns_table.add_column("Namespace")
@@ -168,55 +239,30 @@ class GrootCLI:
         pod_table.add_column("Restarts", justify="right")
         pod_table.add_column("Age")
 
-        # Count pod statuses
-        status_counts = {"Running": 0, "Pending": 0, "Failed": 0, "Succeeded": 0, "Unknown": 0}
-
-        for pod in pods:
-            status = pod.status.phase
-            status_counts[status] = status_counts.get(status, 0) + 1
-
+        for name, namespace, status, restarts, created, _ in snapshot.rows():
             status_style = "green" if status == "Running" else "yellow" if status == "Pending" else "red"
 
-            # Get restart count
-            restarts = 0
-            if pod.status.container_statuses:
-                for container in pod.status.container_statuses:
-                    restarts += container.restart_count
-
-            # Calculate age
-            age = "Unknown"
-            if pod.metadata.creation_timestamp:
-                import datetime
-                now = datetime.datetime.now(pod.metadata.creation_timestamp.tzinfo)
-                delta = now - pod.metadata.creation_timestamp
-                days = delta.days
-                hours, remainder = divmod(delta.seconds, 3600)
-                minutes, _ = divmod(remainder, 60)
-
-                if days > 0:
-                    age = f"{days}d"
-                elif hours > 0:
-                    age = f"{hours}h"
-                else:
-                    age = f"{minutes}m"
-
             pod_table.add_row(
-                pod.metadata.name,
-                pod.metadata.namespace,
+                name,
+                namespace,
                 f"[{status_style}]{status}[/{status_style}]",
                 str(restarts),
-                age
+                format_age(created)
             )
 
         console.print(pod_table)
 
+        # Count pod statuses
+        status_counts = {"Running": 0, "Pending": 0, "Failed": 0, "Succeeded": 0, "Unknown": 0}
+        status_counts.update(snapshot.phase_counts())
+        total_pods = len(snapshot)
+
         # Pod status summary
         status_table = Table(title="Pod Status Summary", border_style="cyan", box=box.ROUNDED)
         status_table.add_column("Status")
         status_table.add_column("Count", justify="right")
         status_table.add_column("Percentage", justify="right")
 
-        total_pods = len(pods)
         for status, count in status_counts.items():
             percentage = (count / total_pods * 100) if total_pods > 0 else 0
             status_style = "green" if status == "Running" else "yellow" if status == "Pending" else "red"
@@ -236,14 +282,7 @@ class GrootCLI:
         deploy_table.add_column("Replicas", justify="right")
         deploy_table.add_column("Status")
 
-        for name, replicas, status in deployments:
-            # Extract namespace from pods
-            namespace = "unknown"
-            for pod in pods:
-                if pod.metadata.labels and pod.metadata.labels.get("app") == name:
-                    namespace = pod.metadata.namespace
-                    break
-
+        for name, namespace, replicas, status in deployments:
             status_style = "green" if "Healthy" in status else "red"
 
             deploy_table.add_row(
@@ -263,28 +302,40 @@ class GrootCLI:
         service_table.add_column("Cluster IP")
         service_table.add_column("External IP")
 
-        for svc, svc_type in services:
-            # Extract additional info
-            namespace = "unknown"
-            cluster_ip = "None"
-            external_ip = "None"
+        for row in services["rows"]:
+            cells = row["cells"]
 
-            # This is a simplification - in a real implementation, we'd get this from the service object
-
-            service_table.add_row(svc, namespace, svc_type, cluster_ip, external_ip)
+            service_table.add_row(
+                row["name"],
+                row["namespace"] or "unknown",
+                str(cells.get("Type", "")),
+                str(cells.get("Cluster-IP", "None")),
+                str(cells.get("External-IP", "None"))
+            )
 
         console.print(service_table)
 
         return ""  # Return empty string since we printed directly
 
+    def _report_degraded(self, result: ScanResult, description: str):
+        """Warn when a result is partial or stale, e.g. "<description> incomplete: <errors>"."""
+        if result.degraded:
+            state = "stale" if result.stale and not result.partial else "incomplete"
+            console.print(f"[yellow]⚠️ {description} {state}: {'; '.join(result.errors)}[/yellow]")
+
     async def scan_namespace(self, namespace: str) -> str:
         """Scan a namespace for issues."""
         with console.status(f"[cyan]Scanning namespace {namespace}...", spinner="dots"):
             # Analyze resources
             issues = await self.scanner.analyze_resources(namespace)
 
+        self._report_degraded(issues, f"Results for namespace {namespace} are")
+
         if not issues:
-            console.print(f"[green]✅ No issues found in namespace: {namespace}[/green]")
+            if issues.partial:
+                console.print(f"[yellow]No issues found in the resources that could be read in namespace: {namespace}[/yellow]")
+            else:
+                console.print(f"[green]✅ No issues found in namespace: {namespace}[/green]")
             return ""
 
         # Format issues
@@ -296,6 +347,7 @@ class GrootCLI:
 
             issue_panel = Panel(
                 f"[bold]Resource:[/bold] {issue['resource_type']}/{issue['name']}\n"
+                + (f"[bold]Workload:[/bold] {issue['workload']}\n" if "workload" in issue else "") +
                 f"[bold]Severity:[/bold] [{severity_color}]{severity.upper()}[/{severity_color}]\n"
                 f"[bold]Issue:[/bold] {issue['issue']}\n"
                 + (f"[bold]Details:[/bold] {issue['details']}\n" if "details" in issue else ""),
@@ -369,10 +421,23 @@ class GrootCLI:
                 "namespace": namespace
             }
 
-            # If it's a pod, get logs
-            if resource_type == "pod":
-                logs = await self.scanner.get_pod_logs(name, namespace)
-                context["logs"] = logs
+            # Add the owning workload and owned pods
+            kind = OWNER_GRAPH_KINDS.get(resource_type)
+            owner_graph = None
+            if kind:
+                owner_graph = await self.scanner.build_owner_graph(namespace)
+                root_kind, _, root_name = owner_graph.root_controller(kind, namespace, name)
+                if (root_kind, root_name) != (kind, name):
+                    context["workload"] = f"{root_kind.lower()}/{root_name}"
+                context["pods"] = [ref[2] for ref in owner_graph.descendants(kind, namespace, name, of_kind="Pod")]
+
+            # Get logs from every container of the pod, or of the workload's pods, condensed into templates
+            if kind:
+                log_entries = await self.scanner.aggregate_workload_logs(resource_type, name, namespace, graph=owner_graph)
+                if log_entries:
+                    miner = mine_logs(log_entries)
+                    context["log_summary"] = miner.summary()
+                    context["log_templates"] = [template.to_dict() for template in miner.top(20)]
 
             # Prepare query for AI assistant
             query = f"Analyze this Kubernetes {resource_type} named '{name}' in namespace '{namespace}'. Identify any issues, misconfigurations, or potential improvements."
@@ -394,7 +459,7 @@ class GrootCLI:
                 event_type = event.get("type", "")
                 reason = event.get("reason", "")
                 message = event.get("message", "")
-                age = event.get("lastTimestamp", "")
+                age = event_last_seen(event) or ""
 
                 events_table.add_row(event_type, reason, message, str(age))
 
@@ -434,6 +499,133 @@ class GrootCLI:
 
         return ""  # Return empty string since we printed directly
 
+    async def fleet_status(self, namespace: str) -> str:
+        """Show pod health across every kubeconfig context."""
+        if self.fleet is None:
+            self.fleet = FleetScanner()
+
+        if not self.fleet.contexts:
+            return "[yellow]No kubeconfig contexts found[/yellow]"
+
+        with console.status(f"[cyan]Scanning {len(self.fleet.contexts)} clusters...", spinner="dots"):
+            results = await self.fleet.get_status(None if namespace == "all" else namespace)
+
+        fleet_table = Table(title=f"🌐 Fleet status ({namespace})", border_style="green", box=box.ROUNDED)
+        fleet_table.add_column("Cluster")
+        fleet_table.add_column("Pods")
+        fleet_table.add_column("Running")
+        fleet_table.add_column("Restarts")
+        fleet_table.add_column("Waiting")
+        fleet_table.add_column("Time")
+
+        for result in results:
+            elapsed = f"{result['elapsed']:.1f}s"
+            if result["error"]:
+                fleet_table.add_row(result["cluster"], "", "", "", f"[red]{result['error']}[/red]", elapsed)
+                continue
+
+            status = result["result"]
+            waiting = ", ".join(f"[red]{reason}: {len(pods)}[/red]" for reason, pods in sorted(status["waiting"].items()))
+            fleet_table.add_row(
+                result["cluster"],
+                str(status["pods"]) + (" [yellow](partial)[/yellow]" if status["errors"] else ""),
+                str(status["phases"].get("Running", 0)),
+                str(status["restarts"]),
+                waiting or "[green]None[/green]",
+                elapsed
+            )
+
+        console.print(fleet_table)
+
+        return ""  # Return empty string since we printed directly
+
+    async def list_resources(self, resource_type: str, namespace: str) -> str:
+        """List resources of any type with the columns the API server prints for it."""
+        with console.status(f"[cyan]Listing {resource_type} in namespace {namespace}...", spinner="dots"):
+            table = await self.scanner.get_resource_table(resource_type, namespace)
+
+        if table.get("unresolved"):
+            # resolve_resource has already reported the unknown kind
+            return ""
+
+        if not table["rows"]:
+            if table.get("partial"):
+                return f"[red]Could not list {resource_type} in namespace {namespace}[/red]"
+            return f"[yellow]No {resource_type} found in namespace {namespace}[/yellow]"
+
+        resources_table = Table(title=f"📋 {resource_type} in namespace {namespace}", border_style="green", box=box.ROUNDED)
+        for column in table["columns"]:
+            resources_table.add_column(column)
+
+        for row in table["rows"]:
+            resources_table.add_row(*[str(row["cells"].get(column, "")) for column in table["columns"]])
+
+        console.print(resources_table)
+
+        return ""  # Return empty string since we printed directly
+
+    async def save_snapshot(self, path: str, namespace: str) -> str:
+        """Save the cluster, or one namespace, to a snapshot file."""
+        if self.scanner.snapshot_path:
+            return "[yellow]Already reading from a snapshot[/yellow]"
+
+        with console.status(f"[cyan]Saving snapshot to {path}...", spinner="dots"):
+            counts = await self.scanner.save_snapshot(path, namespace)
+
+        if not counts:
+            return "[red]Could not save a snapshot[/red]"
+
+        snapshot_table = Table(title=f"📸 Snapshot {path} ({os.path.getsize(path) / 1024 / 1024:.1f} MiB)",
+                               border_style="green", box=box.ROUNDED)
+        snapshot_table.add_column("Kind")
+        snapshot_table.add_column("Objects", justify="right")
+
+        for kind, count in counts.items():
+            snapshot_table.add_row(kind, str(count))
+
+        console.print(snapshot_table)
+
+        return f"[green]Analyze it offline with: groot --snapshot {path}[/green]"
+
+    def show_api_stats(self) -> str:
+        """Show the API request scheduler's queue depth and wait times per priority lane."""
+        stats = self.scanner.scheduler.stats()
+
+        stats_table = Table(
+            title=f"⏱️ API requests ({stats['qps']:g} QPS, burst {stats['burst']}, {stats['throttled']} throttled by server)",
+            border_style="cyan",
+            box=box.ROUNDED
+        )
+        stats_table.add_column("Lane")
+        stats_table.add_column("Requests", justify="right")
+        stats_table.add_column("Queued", justify="right")
+        stats_table.add_column("Waited", justify="right")
+        stats_table.add_column("Avg Wait", justify="right")
+        stats_table.add_column("Max Wait", justify="right")
+
+        for lane, lane_stats in stats["lanes"].items():
+            stats_table.add_row(
+                lane,
+                str(lane_stats["requests"]),
+                str(lane_stats["queued"]),
+                str(lane_stats["waited"]),
+                f"{lane_stats['avg_wait'] * 1000:.1f}ms",
+                f"{lane_stats['max_wait'] * 1000:.1f}ms"
+            )
+
+        console.print(stats_table)
+
+        resilience = self.scanner.resilience
+        console.print(
+            f"Retries: {resilience.stats['retries']}, hedged reads: {resilience.stats['hedged']} "
+            f"({resilience.stats['hedge_wins']} won), calls rejected by open circuits: {resilience.stats['rejected']}"
+        )
+        for endpoint in resilience.open_circuits():
+            breaker = resilience.breaker(endpoint)
+            console.print(f"[red]Circuit {breaker.state} for {endpoint}, retrying in {breaker.retry_in():.0f}s[/red]")
+
+        return ""  # Return empty string since we printed directly
+
     async def get_pod_logs(self, pod_name: str, namespace: str) -> str:
         """Get logs for a specific pod."""
         with console.status(f"[cyan]Getting logs for pod {pod_name}...", spinner="dots"):
@@ -444,37 +636,79 @@ class GrootCLI:
 
         return ""  # Return empty string since we printed directly
 
-    async def get_namespace_events(self, namespace: str) -> str:
-        """Get events for a namespace."""
+    async def follow_pod_logs(self, pod_name: str, namespace: str) -> str:
+        """Follow logs for a specific pod until interrupted."""
+        console.print(f"[green]📜 Following logs for pod {pod_name} (Ctrl+C to stop):[/green]")
+
+        try:
+            async for line in self.scanner.stream_pod_logs(pod_name, namespace, tail_lines=10):
+                console.print(line, markup=False, highlight=False)
+        except asyncio.CancelledError:
+            # Ctrl+C cancels the running command; on Python 3.11+ the CLI can keep going
+            task = asyncio.current_task()
+            if not hasattr(task, "uncancel"):
+                raise
+            task.uncancel()
+
+        return "[yellow]Stopped following logs[/yellow]"
+
+    async def get_namespace_events(self, namespace: str, since: datetime.timedelta = None) -> str:
+        """Get events for a namespace, optionally from the last `since` including archived ones."""
+        # Group repeated events per object and reason as they stream in
+        index = EventIndex()
         with console.status(f"[cyan]Getting events for namespace {namespace}...", spinner="dots"):
-            events = await self.scanner.get_events(namespace)
+            if since:
+                start = datetime.datetime.now(datetime.timezone.utc) - since
+                events = await self.scanner.get_events(namespace, since=start)
+                for event in events:
+                    index.add(event)
+            else:
+                errors = []
+                async for event in self.scanner.iter_events(namespace, errors=errors):
+                    index.add(event)
+                events = ScanResult(partial=bool(errors), errors=errors)
+
+        self._report_degraded(events, f"Events in namespace {namespace} are")
 
-        if not events:
+        if not len(index):
+            if events.partial:
+                return f"[red]Could not list events in namespace {namespace}[/red]"
             return f"[yellow]No events found in namespace {namespace}[/yellow]"
 
-        events_table = Table(title=f"📅 Events in namespace {namespace}", border_style="green", box=box.ROUNDED)
+        since = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(minutes=15)
+        noisiest = index.noisiest(10, since=since)
+        if noisiest:
+            noisy_table = Table(title="🔊 Noisiest objects in the last 15 minutes", border_style="yellow", box=box.ROUNDED)
+            noisy_table.add_column("Kind")
+            noisy_table.add_column("Name")
+            noisy_table.add_column("Events")
+
+            for (kind, _, name), count in noisiest:
+                noisy_table.add_row(kind or "", name or "", str(count))
+
+            console.print(noisy_table)
+
+        events_table = Table(title=f"📅 Events in namespace {namespace} ({index.events} events in {len(index)} groups)",
+                             border_style="green", box=box.ROUNDED)
         events_table.add_column("Type")
         events_table.add_column("Kind")
         events_table.add_column("Name")
         events_table.add_column("Reason")
+        events_table.add_column("Count")
         events_table.add_column("Message")
-        events_table.add_column("Age")
+        events_table.add_column("Last Seen")
 
-        for event in events:
-            event_type = event.get("type", "")
-            reason = event.get("reason", "")
-            message = event.get("message", "")
-            age = event.get("lastTimestamp", "")
-            object_kind = event.get("involvedObject", {}).get("kind", "")
-            object_name = event.get("involvedObject", {}).get("name", "")
+        for group in index.latest(50):
+            object_kind, _, object_name = group.object
 
             events_table.add_row(
-                event_type,
-                object_kind,
-                object_name,
-                reason,
-                message,
-                str(age)
+                group.type or "",
+                object_kind or "",
+                object_name or "",
+                group.reason or "",
+                str(group.count),
+                group.message or "",
+                format_age(group.last_timestamp)
             )
 
         console.print(events_table)
@@ -543,8 +777,8 @@ class GrootCLI:
                 k8s_context = {
                     "current_namespace": self.current_namespace,
                     "namespaces": await self.scanner.get_namespaces(),
-                    "pod_count": len(await self.scanner.get_pods()),
-                    "deployment_count": len(await self.scanner.get_deployments())
+                    "pod_count": await self.scanner.count_resources("pod"),
+                    "deployment_count": await self.scanner.count_resources("deployment")
                 }
             except Exception:
                 k8s_context = {"current_namespace": self.current_namespace}
@@ -586,6 +820,12 @@ class GrootCLI:
 
         return ""  # Return empty string since we printed directly
 
+    def close(self):
+        """Stop the scanner and save the cassette being recorded."""
+        self.scanner.close()
+        if self.cassette:
+            self.cassette.save()
+
     def exit_program(self):
         """Exit the program."""
         self.running = False
@@ -605,6 +845,9 @@ class GrootCLI:
         except KeyboardInterrupt:
             console.print("\n[yellow]Groot is shutting down gracefully...[/yellow]")
         finally:
+            self.scanner.close()
+            if self.fleet:
+                self.fleet.close()
             console.print("[green]Goodbye! I am Groot...[/green]")
 
 def main():
@@ -612,9 +855,15 @@ def main():
     # Set up argument parser for command-line arguments
     parser = argparse.ArgumentParser(description="Groot - Kubernetes & Cloud Troubleshooting Assistant")
     parser.add_argument("--namespace", "-n", help="Set default namespace")
+    parser.add_argument("--context", help="Kubeconfig context to use instead of the current one")
+    parser.add_argument("--snapshot", help="Read the cluster from a snapshot file instead of connecting to it")
     parser.add_argument("--command", "-c", help="Run a single command and exit")
     parser.add_argument("--web", action="store_true", help="Start the web interface")
     parser.add_argument("--query", "-q", help="Process a natural language query and exit")
+    parser.add_argument("--record", metavar="FILE", help="Record Kubernetes and LLM responses to a cassette file")
+    parser.add_argument("--replay", metavar="FILE", help="Answer Kubernetes and LLM requests from a cassette file")
+    parser.add_argument("--replay-latency", help="Delay of replayed responses: 'recorded' or seconds (default: none)")
+    parser.add_argument("args", nargs="*", help="Command to run and exit, e.g. snapshot save cluster.grs")
     args = parser.parse_args()
 
     # Start web interface if requested
@@ -623,8 +872,18 @@ def main():
         start_web_app()
         return
 
+    cassette = None
+    try:
+        if args.record:
+            cassette = Cassette(args.record, "record")
+        elif args.replay:
+            cassette = Cassette(args.replay, "replay", args.replay_latency)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error opening cassette: {e}[/red]")
+        sys.exit(1)
+
     # Run CLI
-    groot = GrootCLI()
+    groot = GrootCLI(args.context, args.snapshot, cassette)
 
     # Set default namespace if provided
     if args.namespace:
@@ -633,17 +892,28 @@ def main():
         console.print(f"[green]Default namespace set to: {args.namespace}[/green]")
 
     # Run a single command if provided
-    if args.command:
-        asyncio.run(groot.process_command(args.command))
+    command = args.command or " ".join(args.args)
+    if command:
+        response = asyncio.run(groot.process_command(command))
+        if response:
+            console.print(response)
+        groot.close()
         return
 
     # Process a query if provided
     if args.query:
+        if cassette and cassette.recording:
+            cassette.metadata.setdefault("commands", []).append(args.query)
         asyncio.run(groot.process_nl_query(args.query))
+        groot.close()
         return
 
     # Run interactive CLI
     asyncio.run(groot.run())
+    groot.close()
+
+# Console script entry point
+app = main
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""Cached Kubernetes API discovery for Groot CLI.
+
+Maps any resource name a user might type (kind, plural, singular, short name
+or plural.group) to its API path, including custom resources. The discovery
+document is persisted under ~/.groot/discovery, one file per API server, and
+refreshed lazily once it is older than the TTL or a name is not found.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from rich.console import Console
+
+console = Console()
+
+# Aggregated discovery returns every group and resource in one response (Kubernetes 1.26+)
+AGGREGATED_ACCEPT = ("application/json;g=apidiscovery.k8s.io;v=v2;as=APIGroupDiscoveryList,"
+                     "application/json;g=apidiscovery.k8s.io;v=v2beta1;as=APIGroupDiscoveryList,"
+                     "application/json")
+
+class ResourceInfo:
+    """An API resource as found by discovery."""
+
+    __slots__ = ("kind", "group", "version", "plural", "singular", "short_names", "namespaced", "verbs")
+
+    def __init__(self, kind: str, group: str, version: str, plural: str, singular: str = None,
+                 short_names: List[str] = None, namespaced: bool = True, verbs: List[str] = None):
+        """Initialize the resource info."""
+        self.kind = kind
+        self.group = group
+        self.version = version
+        self.plural = plural
+        self.singular = singular or kind.lower()
+        self.short_names = short_names or []
+        self.namespaced = namespaced
+        self.verbs = verbs or []
+
+    @property
+    def prefix(self) -> str:
+        """API path prefix, e.g. /api/v1 or /apis/cert-manager.io/v1."""
+        if not self.group:
+            return f"/api/{self.version}"
+        return f"/apis/{self.group}/{self.version}"
+
+    def names(self) -> List[str]:
+        """Every lowercase name this resource can be referred to by."""
+        names = [self.kind.lower(), self.plural, self.singular] + [name.lower() for name in self.short_names]
+        if self.group:
+            names.append(f"{self.plural}.{self.group}")
+        return names
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+class DiscoveryCache:
+    """Resource name lookup backed by a persisted discovery document."""
+
+    def __init__(self, server: str, ttl: float = 3600.0, cache_dir: str = None, min_refresh_interval: float = 60.0):
+        """Initialize the cache for one API server URL."""
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        cache_dir = cache_dir or os.path.expanduser("~/.groot/discovery")
+        self.path = os.path.join(cache_dir, hashlib.sha1(server.encode()).hexdigest()[:16] + ".json")
+        self.fetched_at = 0.0
+        self.resources: List[ResourceInfo] = []
+        self._names: Dict[str, ResourceInfo] = {}
+        self._attempted_at = 0.0
+
+        self._load()
+
+    def _load(self):
+        """Load the persisted document, if any."""
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            self._set([ResourceInfo(**resource) for resource in data.get("resources", [])], data.get("fetched_at", 0.0))
+        except Exception as e:
+            console.print(f"[red]Error loading discovery cache {self.path}: {e}[/red]")
+
+    def _save(self):
+        """Persist the document."""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'w') as f:
+                json.dump({"fetched_at": self.fetched_at, "resources": [r.to_dict() for r in self.resources]}, f)
+        except Exception as e:
+            console.print(f"[red]Error saving discovery cache {self.path}: {e}[/red]")
+
+    def _set(self, resources: List[ResourceInfo], fetched_at: float):
+        """Replace the resources and rebuild the name index."""
+        self.resources = resources
+        self.fetched_at = fetched_at
+        self._names = {}
+        # Earlier entries win, and discovery lists core and built-in groups first
+        for resource in resources:
+            for name in resource.names():
+                self._names.setdefault(name, resource)
+
+    @property
+    def stale(self) -> bool:
+        return time.time() - self.fetched_at > self.ttl
+
+    def lookup(self, name: str) -> Optional[ResourceInfo]:
+        """Find a resource by any of its names without refreshing."""
+        return self._names.get(name.lower())
+
+    def needs_refresh(self, name: str = None) -> bool:
+        """Whether a refresh is due, either because of age or because name is unknown."""
+        if time.time() - self._attempted_at < self.min_refresh_interval:
+            return False
+        return self.stale or (name is not None and self.lookup(name) is None)
+
+    def refresh(self, get_json: Callable[[str, str], Dict[str, Any]]):
+        """Fetch discovery from the API server with get_json(path, accept) and persist it.
+
+        A group whose version can't be read, such as an aggregated API whose
+        backing service is down, is skipped and keeps its previously known
+        resources, like kubectl does; the result then stays stale so the group
+        is retried on the next refresh.
+        """
+        self._attempted_at = time.time()
+
+        resources = []
+        failed = []
+        for path in ("/api", "/apis"):
+            document = get_json(path, AGGREGATED_ACCEPT)
+            if document.get("kind") == "APIGroupDiscoveryList":
+                resources.extend(self._parse_aggregated(document))
+            elif path == "/api":
+                resources.extend(self._parse_resource_list("", "v1", get_json("/api/v1", "application/json")))
+            else:
+                for group in document.get("groups") or []:
+                    version = (group.get("preferredVersion") or {}).get("version")
+                    if not version:
+                        continue
+                    try:
+                        resource_list = get_json(f"/apis/{group['name']}/{version}", "application/json")
+                    except Exception:
+                        failed.append(f"{group['name']}/{version}")
+                        resources.extend(resource for resource in self.resources if resource.group == group["name"])
+                        continue
+                    resources.extend(self._parse_resource_list(group["name"], version, resource_list))
+
+        if failed:
+            console.print(f"[yellow]Skipped API groups that could not be discovered: {', '.join(failed)}[/yellow]")
+
+        self._set(resources, 0.0 if failed else time.time())
+        self._save()
+
+    def _parse_aggregated(self, document: Dict[str, Any]) -> List[ResourceInfo]:
+        """Parse an APIGroupDiscoveryList, using each group's preferred (first) version."""
+        resources = []
+        for group in document.get("items") or []:
+            versions = group.get("versions") or []
+            if not versions:
+                continue
+
+            group_name = (group.get("metadata") or {}).get("name", "")
+            version = versions[0]
+            for resource in version.get("resources") or []:
+                response_kind = resource.get("responseKind") or {}
+                resources.append(ResourceInfo(
+                    kind=response_kind.get("kind") or resource["resource"],
+                    group=group_name,
+                    version=version["version"],
+                    plural=resource["resource"],
+                    singular=resource.get("singularResource"),
+                    short_names=resource.get("shortNames"),
+                    namespaced=resource.get("scope") == "Namespaced",
+                    verbs=resource.get("verbs")
+                ))
+        return resources
+
+    def _parse_resource_list(self, group: str, version: str, resource_list: Dict[str, Any]) -> List[ResourceInfo]:
+        """Parse a legacy APIResourceList, skipping subresources such as pods/log."""
+        resources = []
+        for resource in resource_list.get("resources") or []:
+            if "/" in resource["name"]:
+                continue
+            resources.append(ResourceInfo(
+                kind=resource["kind"],
+                group=group,
+                version=version,
+                plural=resource["name"],
+                singular=resource.get("singularName"),
+                short_names=resource.get("shortNames"),
+                namespaced=resource.get("namespaced", True),
+                verbs=resource.get("verbs")
+            ))
+        return resources
@@ -0,0 +1,271 @@
+"""Local archive of Kubernetes events for Groot CLI.
+
+The API server only keeps events for about an hour. EventRecorder watches
+events in the background and appends them to an SQLite database with one
+table per UTC day, so old days are dropped as a whole once they fall out of
+the retention window. Event JSON is stored zlib-compressed next to the
+indexed columns used for time-range and object queries.
+"""
+
+import datetime
+import json
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Callable, List, Optional
+
+from rich.console import Console
+from groot.k8s_cache import Informer
+from groot.rate_limiter import RequestScheduler
+from groot.utils.k8s_objects import ObjectView, loads
+
+console = Console()
+
+_partition_re = re.compile(r"^events_(\d{8})$")
+
+def _epoch(timestamp: Optional[datetime.datetime]) -> Optional[float]:
+    """Seconds since the epoch, treating naive timestamps as UTC."""
+    if timestamp is None:
+        return None
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+    return timestamp.timestamp()
+
+def event_time(event: Any) -> float:
+    """The time an event last happened, as seconds since the epoch."""
+    timestamp = (event.last_timestamp or event.event_time or event.first_timestamp
+                 or event.metadata.creation_timestamp)
+    return _epoch(timestamp) or time.time()
+
+class EventArchive:
+    """Day-partitioned SQLite store of events."""
+
+    def __init__(self, path: str = None, retention_days: int = 7):
+        """Initialize the archive, creating the database if needed."""
+        self.path = os.path.expanduser(path or "~/.groot/events.db")
+        self.retention_days = retention_days
+        self._partitions = set()
+        self._local = threading.local()
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._partitions.update(self.partitions())
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            # WAL lets queries run while the recorder writes
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def partitions(self) -> List[str]:
+        """Names of the day tables, oldest first."""
+        rows = self._connection().execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        return sorted(name for (name,) in rows if _partition_re.match(name))
+
+    def _partition(self, epoch: float) -> str:
+        """Name of the day table for a time, creating it if needed."""
+        day = datetime.datetime.fromtimestamp(epoch, datetime.timezone.utc).strftime("%Y%m%d")
+        table = f"events_{day}"
+
+        if table not in self._partitions:
+            connection = self._connection()
+            connection.execute(f"""CREATE TABLE IF NOT EXISTS {table} (
+                uid TEXT PRIMARY KEY,
+                namespace TEXT,
+                kind TEXT,
+                name TEXT,
+                reason TEXT,
+                type TEXT,
+                last_seen REAL,
+                count INTEGER,
+                payload BLOB
+            )""")
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_object ON {table} (namespace, kind, name, last_seen)")
+            connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_time ON {table} (last_seen)")
+            self._partitions.add(table)
+
+        return table
+
+    def write(self, events: List[Any]):
+        """Store a batch of events (ObjectViews of the raw JSON) in one transaction.
+
+        Events are keyed by uid within a day, so updates to an event's count
+        replace the earlier row.
+        """
+        rows = {}
+        for event in events:
+            epoch = event_time(event)
+            involved = event.involved_object
+            rows.setdefault(self._partition(epoch), []).append((
+                event.metadata.uid,
+                event.metadata.namespace,
+                involved.kind if involved else None,
+                involved.name if involved else None,
+                event.reason,
+                event.type,
+                epoch,
+                event.count or 1,
+                zlib.compress(json.dumps(event.to_dict(), separators=(",", ":")).encode())
+            ))
+
+        connection = self._connection()
+        with connection:
+            for table, table_rows in rows.items():
+                connection.executemany(f"INSERT OR REPLACE INTO {table} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", table_rows)
+
+    def compact(self, now: float = None):
+        """Drop day tables older than the retention window."""
+        now = now or time.time()
+        cutoff = datetime.datetime.fromtimestamp(now, datetime.timezone.utc) - datetime.timedelta(days=self.retention_days)
+        cutoff_table = f"events_{cutoff.strftime('%Y%m%d')}"
+
+        connection = self._connection()
+        for table in self.partitions():
+            if table < cutoff_table:
+                connection.execute(f"DROP TABLE {table}")
+                self._partitions.discard(table)
+        connection.commit()
+
+    def query(self, namespace: str = None, kind: str = None, name: str = None,
+              since: datetime.datetime = None, until: datetime.datetime = None,
+              limit: int = None) -> List[ObjectView]:
+        """Archived events in a time range, optionally for one object, most recent first."""
+        low = _epoch(since)
+        high = _epoch(until)
+        low_table = f"events_{datetime.datetime.fromtimestamp(low, datetime.timezone.utc).strftime('%Y%m%d')}" if low else ""
+        high_table = f"events_{datetime.datetime.fromtimestamp(high, datetime.timezone.utc).strftime('%Y%m%d')}" if high else "~"
+
+        conditions = []
+        params = []
+        for column, value in (("namespace", namespace if namespace != "all" else None), ("kind", kind), ("name", name)):
+            if value:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if low is not None:
+            conditions.append("last_seen >= ?")
+            params.append(low)
+        if high is not None:
+            conditions.append("last_seen < ?")
+            params.append(high)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        result = []
+        seen = set()
+        connection = self._connection()
+
+        # Newest partitions first, so a limit stops before reading old days
+        for table in reversed(self.partitions()):
+            if not low_table <= table <= high_table:
+                continue
+
+            sql = f"SELECT uid, payload FROM {table} {where} ORDER BY last_seen DESC"
+            if limit:
+                sql += f" LIMIT {int(limit) - len(result)}"
+
+            for uid, payload in connection.execute(sql, params):
+                # An event updated across midnight has a row in both days; keep the newest
+                if uid in seen:
+                    continue
+                seen.add(uid)
+                result.append(ObjectView(loads(zlib.decompress(payload))))
+
+            if limit and len(result) >= limit:
+                break
+
+        return result
+
+class EventRecorder:
+    """Background LIST+WATCH of events feeding an EventArchive.
+
+    Watch events are queued without blocking the watch thread; a writer
+    thread drains the queue in batches of up to batch_size and writes each
+    batch in one transaction, which keeps up with event storms. If the queue
+    is full, the oldest queued event is dropped and counted in dropped.
+    """
+
+    def __init__(self, archive: EventArchive, list_func: Callable, batch_size: int = 1000,
+                 flush_interval: float = 1.0, max_queue: int = 100000, scheduler: RequestScheduler = None):
+        """Initialize the recorder.
+
+        list_func must be a cluster-wide event list call of the kubernetes
+        client, e.g. CoreV1Api.list_event_for_all_namespaces. Its relists and
+        watch requests wait in the scheduler's background lane.
+        """
+        self.archive = archive
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.informer = Informer("event", list_func, raw=True, scheduler=scheduler)
+        self.informer.add_handler(self._on_change)
+        self.recorded = 0
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._stopped = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start watching and writing."""
+        if self._writer and self._writer.is_alive():
+            return
+
+        self._stopped.clear()
+        self._writer = threading.Thread(target=self._write_loop, name="groot-event-recorder", daemon=True)
+        self._writer.start()
+        self.informer.start()
+
+    def stop(self):
+        """Stop watching, flushing queued events."""
+        self.informer.stop()
+        self._stopped.set()
+        if self._writer:
+            self._writer.join(timeout=5)
+
+    def _on_change(self, event_type: str, obj: Any):
+        """Queue added and modified events; deletions are what the archive is for."""
+        if event_type == "DELETED":
+            return
+
+        while True:
+            try:
+                self._queue.put_nowait(obj)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def _write_loop(self):
+        """Drain the queue into the archive in batches."""
+        self.archive.compact()
+        compacted = time.time()
+
+        while not (self._stopped.is_set() and self._queue.empty()):
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self.archive.write(batch)
+                self.recorded += len(batch)
+            except Exception as e:
+                console.print(f"[red]Error archiving events: {e}[/red]")
+
+            if time.time() - compacted > 3600:
+                self.archive.compact()
+                compacted = time.time()
@@ -0,0 +1,188 @@
+"""Aggregated index of Kubernetes events for Groot CLI."""
+
+import bisect
+import datetime
+import heapq
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+# (kind, namespace, name) of an event's involvedObject
+ObjectKey = Tuple[Optional[str], Optional[str], Optional[str]]
+
+def _epoch(timestamp: Optional[datetime.datetime]) -> float:
+    """Seconds since the epoch, treating naive timestamps as UTC."""
+    if timestamp is None:
+        return 0.0
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+    return timestamp.timestamp()
+
+def event_last_seen(event: Dict[str, Any]) -> Optional[datetime.datetime]:
+    """When an event dict last happened.
+
+    events.k8s.io events often leave lastTimestamp and firstTimestamp null and
+    only set eventTime, or series.lastObservedTime once repeated.
+    """
+    series = event.get("series") or {}
+    return (event.get("lastTimestamp") or series.get("lastObservedTime") or event.get("eventTime")
+            or event.get("firstTimestamp"))
+
+def event_first_seen(event: Dict[str, Any]) -> Optional[datetime.datetime]:
+    """When an event dict first happened."""
+    return event.get("firstTimestamp") or event.get("eventTime") or event_last_seen(event)
+
+class EventGroup:
+    """All events of one involvedObject with the same reason."""
+
+    __slots__ = ("object", "reason", "type", "count", "first_timestamp", "last_timestamp", "message")
+
+    def __init__(self, obj: ObjectKey, reason: Optional[str]):
+        """Initialize an empty group."""
+        self.object = obj
+        self.reason = reason
+        self.type: Optional[str] = None
+        self.count = 0
+        self.first_timestamp: Optional[datetime.datetime] = None
+        self.last_timestamp: Optional[datetime.datetime] = None
+        self.message: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict shaped like the scanner's event dicts."""
+        kind, namespace, name = self.object
+        return {
+            "type": self.type,
+            "reason": self.reason,
+            "message": self.message,
+            "count": self.count,
+            "firstTimestamp": self.first_timestamp,
+            "lastTimestamp": self.last_timestamp,
+            "involvedObject": {"kind": kind, "name": name, "namespace": namespace}
+        }
+
+class EventIndex:
+    """Events grouped by involvedObject and reason, with time-bucketed counts.
+
+    Groups are kept ordered by lastTimestamp, and counts are kept per time
+    bucket (one minute by default), so recent-activity queries bisect to the
+    window they cover instead of scanning every event. An event's full count
+    is attributed to the bucket of its lastTimestamp.
+    """
+
+    def __init__(self, bucket_seconds: int = 60):
+        """Initialize an empty index."""
+        self.bucket_seconds = bucket_seconds
+        self.groups: Dict[Tuple[ObjectKey, Optional[str]], EventGroup] = {}
+        self.events = 0
+
+        # (lastTimestamp epoch, insertion sequence, group key), sorted
+        self._timeline: List[Tuple[float, int, Tuple]] = []
+        self._sequence = 0
+
+        # Bucket start (epoch seconds) -> counts per object, with the starts kept sorted
+        self._buckets: Dict[int, Counter] = {}
+        self._bucket_starts: List[int] = []
+
+    @classmethod
+    def from_events(cls, events: List[Dict[str, Any]], bucket_seconds: int = 60) -> "EventIndex":
+        """Build an index from event dicts as returned by K8sScanner.get_events."""
+        index = cls(bucket_seconds)
+        for event in events:
+            index.add(event)
+        return index
+
+    def add(self, event: Dict[str, Any]):
+        """Add an event dict."""
+        involved = event.get("involvedObject") or {}
+        obj = (involved.get("kind"), involved.get("namespace"), involved.get("name"))
+        key = (obj, event.get("reason"))
+        count = event.get("count") or (event.get("series") or {}).get("count") or 1
+        first = event_first_seen(event)
+        last = event_last_seen(event)
+
+        self.events += 1
+
+        group = self.groups.get(key)
+        if group is None:
+            group = EventGroup(obj, event.get("reason"))
+            self.groups[key] = group
+        else:
+            # The group moves in the timeline, so drop its old position
+            position = self._find(_epoch(group.last_timestamp), key)
+            if position is not None:
+                del self._timeline[position]
+
+        group.count += count
+        if first and (group.first_timestamp is None or _epoch(first) < _epoch(group.first_timestamp)):
+            group.first_timestamp = first
+        if group.last_timestamp is None or (last is not None and _epoch(last) >= _epoch(group.last_timestamp)):
+            group.last_timestamp = last
+            group.type = event.get("type")
+            group.message = event.get("message")
+
+        self._sequence += 1
+        bisect.insort(self._timeline, (_epoch(group.last_timestamp), self._sequence, key))
+
+        if last is not None:
+            start = int(_epoch(last)) // self.bucket_seconds * self.bucket_seconds
+            bucket = self._buckets.get(start)
+            if bucket is None:
+                bucket = Counter()
+                self._buckets[start] = bucket
+                bisect.insort(self._bucket_starts, start)
+            bucket[obj] += count
+
+    def _find(self, epoch: float, key: Tuple) -> Optional[int]:
+        """Position of a group's timeline entry."""
+        position = bisect.bisect_left(self._timeline, (epoch,))
+        while position < len(self._timeline) and self._timeline[position][0] == epoch:
+            if self._timeline[position][2] == key:
+                return position
+            position += 1
+        return None
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def latest(self, limit: int = None, since: datetime.datetime = None) -> List[EventGroup]:
+        """Groups ordered by lastTimestamp, most recent first, optionally only those seen since a time."""
+        start = bisect.bisect_left(self._timeline, (_epoch(since),)) if since else 0
+        result = []
+        for position in range(len(self._timeline) - 1, start - 1, -1):
+            result.append(self.groups[self._timeline[position][2]])
+            if limit and len(result) >= limit:
+                break
+        return result
+
+    def _bucket_range(self, since: datetime.datetime = None, until: datetime.datetime = None) -> List[int]:
+        """Sorted bucket starts overlapping [since, until)."""
+        low = 0
+        if since:
+            low = bisect.bisect_left(self._bucket_starts, int(_epoch(since)) // self.bucket_seconds * self.bucket_seconds)
+        high = bisect.bisect_left(self._bucket_starts, _epoch(until)) if until else len(self._bucket_starts)
+        return self._bucket_starts[low:high]
+
+    def noisiest(self, limit: int = 10, since: datetime.datetime = None,
+                 until: datetime.datetime = None) -> List[Tuple[ObjectKey, int]]:
+        """The objects with the most events in a time window, e.g. the last 15 minutes."""
+        totals = Counter()
+        for start in self._bucket_range(since, until):
+            totals.update(self._buckets[start])
+        return heapq.nlargest(limit, totals.items(), key=lambda item: item[1])
+
+    def histogram(self, obj: ObjectKey = None, since: datetime.datetime = None,
+                  until: datetime.datetime = None) -> List[Tuple[datetime.datetime, int]]:
+        """Event counts per bucket, for all objects or one object."""
+        result = []
+        for start in self._bucket_range(since, until):
+            bucket = self._buckets[start]
+            count = bucket[obj] if obj else sum(bucket.values())
+            if count:
+                result.append((datetime.datetime.fromtimestamp(start, datetime.timezone.utc), count))
+        return result
+
+    def reasons(self, since: datetime.datetime = None) -> Counter:
+        """Event counts per reason for groups seen since a time."""
+        counts = Counter()
+        for group in self.latest(since=since):
+            counts[group.reason] += group.count
+        return counts
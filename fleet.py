@@ -0,0 +1,143 @@
+"""Concurrent scanning across kubeconfig contexts for Groot CLI."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+try:
+    from kubernetes import config as k8s_config
+    k8s_available = True
+except ImportError:
+    k8s_available = False
+
+from rich.console import Console
+from groot.config import config as groot_config
+from groot.k8s_scanner import K8sScanner
+
+console = Console()
+
+def list_contexts() -> List[str]:
+    """Names of the contexts in the kubeconfig."""
+    if not k8s_available:
+        return []
+
+    try:
+        contexts, _ = k8s_config.list_kube_config_contexts(config_file=groot_config.get("kubeconfig"))
+        return [context["name"] for context in contexts]
+    except Exception as e:
+        console.print(f"[red]Error reading kubeconfig contexts: {e}[/red]")
+        return []
+
+class FleetScanner:
+    """Runs scanner operations against many clusters at once.
+
+    Each context gets its own K8sScanner, and with it its own API client and
+    connection pool. Operations run concurrently with a per-cluster timeout,
+    so a fleet-wide query takes as long as the slowest cluster rather than
+    the sum of all of them, and one unreachable cluster can't stall the rest.
+    """
+
+    def __init__(self, contexts: List[str] = None, timeout: float = None):
+        """Initialize the fleet scanner.
+
+        contexts defaults to the config key fleet_contexts, or else every
+        context in the kubeconfig; timeout defaults to the config key
+        fleet_timeout (30 seconds).
+        """
+        if contexts is None:
+            contexts = groot_config.get("fleet_contexts") or list_contexts()
+            if isinstance(contexts, str):
+                contexts = [context.strip() for context in contexts.split(",") if context.strip()]
+
+        self.contexts = list(contexts)
+        self.timeout = float(timeout or groot_config.get("fleet_timeout", 30))
+        self.scanners: Dict[str, K8sScanner] = {}
+
+    def scanner(self, context: str) -> K8sScanner:
+        """Get the scanner for a context, creating it on first use."""
+        scanner = self.scanners.get(context)
+        if scanner is None:
+            scanner = K8sScanner(context=context)
+            self.scanners[context] = scanner
+        return scanner
+
+    async def run(self, operation: Callable[[K8sScanner], Awaitable[Any]]) -> List[Dict[str, Any]]:
+        """Run operation(scanner) on every cluster concurrently.
+
+        Returns one {"cluster", "result", "error", "elapsed"} dict per context,
+        in context order. A cluster that fails or exceeds the timeout has
+        result None and the reason in error.
+        """
+        async def run_one(context: str) -> Dict[str, Any]:
+            started = time.monotonic()
+            result, error = None, None
+
+            try:
+                result = await asyncio.wait_for(self._run_on(context, operation), self.timeout)
+            except asyncio.TimeoutError:
+                error = f"Timed out after {self.timeout:g}s"
+            except Exception as e:
+                error = str(e)
+
+            return {
+                "cluster": context,
+                "result": result,
+                "error": error,
+                "elapsed": time.monotonic() - started
+            }
+
+        return await asyncio.gather(*[run_one(context) for context in self.contexts])
+
+    async def _run_on(self, context: str, operation: Callable[[K8sScanner], Awaitable[Any]]) -> Any:
+        """Initialize a cluster's scanner and run an operation on it."""
+        scanner = self.scanner(context)
+        await scanner.initialize()
+
+        # The scanner reports connection errors itself and would return empty results
+        if not scanner.initialized:
+            raise RuntimeError("Kubernetes client not initialized")
+
+        return await operation(scanner)
+
+    async def analyze_resources(self, namespace: str) -> List[Dict[str, Any]]:
+        """Analyze a namespace on every cluster."""
+        return await self.run(lambda scanner: scanner.analyze_resources(namespace))
+
+    async def get_events(self, namespace: str, **kwargs) -> List[Dict[str, Any]]:
+        """Get events of a namespace on every cluster."""
+        return await self.run(lambda scanner: scanner.get_events(namespace, **kwargs))
+
+    async def get_status(self, namespace: str = None) -> List[Dict[str, Any]]:
+        """Summarize pods on every cluster: counts per phase, restarts and pods waiting in a bad state.
+
+        errors lists what failed if a cluster's pods could only be partly listed.
+        """
+        async def status(scanner: K8sScanner) -> Dict[str, Any]:
+            phases: Dict[str, int] = {}
+            waiting: Dict[str, List[str]] = {}
+            errors: List[str] = []
+            pods = 0
+            restarts = 0
+
+            async for pod in scanner.iter_pods(namespace, errors=errors):
+                pods += 1
+                phase = pod.status.phase if pod.status else None
+                phases[phase] = phases.get(phase, 0) + 1
+
+                reasons = set()
+                for container in (pod.status.container_statuses if pod.status else None) or []:
+                    restarts += container.restart_count or 0
+                    if container.state and container.state.waiting and container.state.waiting.reason:
+                        reasons.add(container.state.waiting.reason)
+
+                for reason in reasons:
+                    waiting.setdefault(reason, []).append(f"{pod.metadata.namespace}/{pod.metadata.name}")
+
+            return {"pods": pods, "phases": phases, "restarts": restarts, "waiting": waiting, "errors": errors}
+
+        return await self.run(status)
+
+    def close(self):
+        """Close every cluster's scanner."""
+        for scanner in self.scanners.values():
+            scanner.close()
@@ -0,0 +1,349 @@
+"""Watch-backed local cache of Kubernetes resources for Groot CLI."""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from kubernetes import watch
+    from kubernetes.client.rest import ApiException
+    k8s_available = True
+except ImportError:
+    k8s_available = False
+
+from rich.console import Console
+from groot.utils.k8s_objects import ObjectView, loads
+from groot.rate_limiter import HTTP_TOO_MANY_REQUESTS, RequestScheduler, retry_after
+
+console = Console()
+
+# HTTP status returned when a watch resourceVersion is too old
+HTTP_GONE = 410
+
+def object_key(obj: Any) -> str:
+    """Return the namespace/name key for a Kubernetes object."""
+    namespace = obj.metadata.namespace
+    if namespace:
+        return f"{namespace}/{obj.metadata.name}"
+    return obj.metadata.name
+
+class ResourceStore:
+    """Thread-safe store of Kubernetes objects keyed by namespace/name."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._lock = threading.RLock()
+        self._by_namespace: Dict[str, Dict[str, Any]] = {}
+        self.resource_version: Optional[str] = None
+
+    def replace(self, items: List[Any], resource_version: Optional[str]):
+        """Replace the store contents with the result of a full LIST."""
+        by_namespace: Dict[str, Dict[str, Any]] = {}
+        for obj in items:
+            namespace = obj.metadata.namespace or ""
+            by_namespace.setdefault(namespace, {})[obj.metadata.name] = obj
+
+        with self._lock:
+            self._by_namespace = by_namespace
+            self.resource_version = resource_version
+
+    def upsert(self, obj: Any):
+        """Add or update an object."""
+        namespace = obj.metadata.namespace or ""
+        with self._lock:
+            self._by_namespace.setdefault(namespace, {})[obj.metadata.name] = obj
+
+    def delete(self, obj: Any):
+        """Remove an object if present."""
+        namespace = obj.metadata.namespace or ""
+        with self._lock:
+            objects = self._by_namespace.get(namespace)
+            if objects is not None:
+                objects.pop(obj.metadata.name, None)
+                if not objects:
+                    del self._by_namespace[namespace]
+
+    def get(self, namespace: Optional[str], name: str) -> Optional[Any]:
+        """Get a single object by namespace and name."""
+        with self._lock:
+            return self._by_namespace.get(namespace or "", {}).get(name)
+
+    def list(self, namespace: Optional[str] = None) -> List[Any]:
+        """List objects, optionally restricted to one namespace."""
+        with self._lock:
+            if namespace and namespace != "all":
+                return list(self._by_namespace.get(namespace, {}).values())
+
+            result = []
+            for objects in self._by_namespace.values():
+                result.extend(objects.values())
+            return result
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(objects) for objects in self._by_namespace.values())
+
+class Informer:
+    """Keeps a ResourceStore in sync with one resource kind using LIST+WATCH."""
+
+    def __init__(self, kind: str, list_func: Callable, watch_timeout: int = 300, retry_delay: float = 1.0,
+                 raw: bool = False, scheduler: RequestScheduler = None):
+        """Initialize the informer.
+
+        list_func must be a cluster-wide list call of the kubernetes client,
+        e.g. CoreV1Api.list_pod_for_all_namespaces. With raw enabled, objects
+        are stored as ObjectViews decoded from the response JSON. With a
+        scheduler, relists and watch requests wait in its background lane.
+        """
+        self.kind = kind
+        self.list_func = list_func
+        self.raw = raw
+        self.watch_timeout = watch_timeout
+        self.retry_delay = retry_delay
+        self.scheduler = scheduler
+        self.store = ResourceStore()
+        self.handlers: List[Callable[[str, Any], None]] = []
+        self.synced = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watch = None
+
+    def start(self):
+        """Start the background LIST+WATCH loop."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name=f"groot-informer-{self.kind}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background loop."""
+        self._stopped.set()
+        if self._watch:
+            self._watch.stop()
+
+    def add_handler(self, handler: Callable[[str, Any], None]):
+        """Call handler(event_type, obj) for every change; a relist reports each object as ADDED."""
+        self.handlers.append(handler)
+
+    def _notify(self, event_type: str, obj: Any):
+        """Pass a change to the handlers."""
+        for handler in self.handlers:
+            try:
+                handler(event_type, obj)
+            except Exception as e:
+                console.print(f"[red]Error handling {self.kind} change: {e}[/red]")
+
+    def wait_for_sync(self, timeout: float = None) -> bool:
+        """Block until the initial LIST has completed."""
+        return self.synced.wait(timeout)
+
+    def _run(self):
+        """Relist and watch until stopped."""
+        needs_relist = True
+
+        while not self._stopped.is_set():
+            try:
+                if needs_relist:
+                    self._relist()
+                    needs_relist = False
+
+                # Returns normally when the server closes the watch; resume from the last resourceVersion
+                needs_relist = self._watch_changes()
+            except ApiException as e:
+                if e.status == HTTP_GONE:
+                    needs_relist = True
+                elif e.status == HTTP_TOO_MANY_REQUESTS:
+                    delay = retry_after(e, self.retry_delay)
+                    if self.scheduler:
+                        self.scheduler.backoff(delay)
+                    time.sleep(delay)
+                else:
+                    console.print(f"[red]Error watching {self.kind}: {e}[/red]")
+                    time.sleep(self.retry_delay)
+            except Exception as e:
+                console.print(f"[red]Error watching {self.kind}: {e}[/red]")
+                needs_relist = True
+                time.sleep(self.retry_delay)
+
+    def _relist(self):
+        """Replace the store with a fresh LIST."""
+        if self.scheduler:
+            self.scheduler.acquire_blocking("background")
+
+        if self.raw:
+            data = loads(self.list_func(_preload_content=False).data)
+            items = [ObjectView(item) for item in data.get("items") or []]
+            self.store.replace(items, (data.get("metadata") or {}).get("resourceVersion"))
+        else:
+            result = self.list_func()
+            items = result.items
+            self.store.replace(items, result.metadata.resource_version)
+        self.synced.set()
+
+        if self.handlers:
+            for obj in items:
+                self._notify("ADDED", obj)
+
+    def _watch_changes(self) -> bool:
+        """Apply watch events to the store. Returns True if a relist is needed."""
+        if self.scheduler:
+            self.scheduler.acquire_blocking("background")
+
+        self._watch = watch.Watch()
+
+        for event in self._watch.stream(
+            self.list_func,
+            resource_version=self.store.resource_version,
+            timeout_seconds=self.watch_timeout,
+            allow_watch_bookmarks=True
+        ):
+            if self._stopped.is_set():
+                break
+
+            event_type = event["type"]
+            raw_object = event.get("raw_object") or {}
+
+            if event_type == "ERROR":
+                if raw_object.get("code") == HTTP_GONE:
+                    return True
+                console.print(f"[red]Error watching {self.kind}: {raw_object.get('message')}[/red]")
+                return False
+
+            obj = ObjectView(raw_object) if self.raw else event["object"]
+            if event_type == "ADDED" or event_type == "MODIFIED":
+                self.store.upsert(obj)
+            elif event_type == "DELETED":
+                self.store.delete(obj)
+
+            if event_type != "BOOKMARK" and self.handlers:
+                self._notify(event_type, obj)
+
+            # BOOKMARK events only advance the resourceVersion
+            resource_version = raw_object.get("metadata", {}).get("resourceVersion")
+            if resource_version:
+                self.store.resource_version = resource_version
+
+        return False
+
+class InformerCache:
+    """Lazily started informers, one per resource kind."""
+
+    def __init__(self, sync_timeout: float = 30.0, raw: bool = False, scheduler: RequestScheduler = None):
+        """Initialize the cache."""
+        self.sync_timeout = sync_timeout
+        self.raw = raw
+        self.scheduler = scheduler
+        self._list_funcs: Dict[str, Callable] = {}
+        self._informers: Dict[str, Informer] = {}
+        self._lock = threading.Lock()
+
+    def register(self, kind: str, list_func: Callable):
+        """Register the cluster-wide list call for a resource kind."""
+        self._list_funcs[kind] = list_func
+
+    def supports(self, kind: str) -> bool:
+        """Check whether a resource kind can be served from the cache."""
+        return kind in self._list_funcs
+
+    def informer(self, kind: str) -> Informer:
+        """Get the informer for a kind, starting it on first use."""
+        with self._lock:
+            informer = self._informers.get(kind)
+            if informer is None:
+                informer = Informer(kind, self._list_funcs[kind], raw=self.raw, scheduler=self.scheduler)
+                self._informers[kind] = informer
+                informer.start()
+            return informer
+
+    def list(self, kind: str, namespace: Optional[str] = None) -> Optional[List[Any]]:
+        """List cached objects, or None if the cache could not sync in time."""
+        informer = self.informer(kind)
+        if not informer.wait_for_sync(self.sync_timeout):
+            return None
+        return informer.store.list(namespace)
+
+    def get(self, kind: str, namespace: Optional[str], name: str) -> Optional[Any]:
+        """Get a cached object, or None if it is unknown."""
+        informer = self.informer(kind)
+        if not informer.wait_for_sync(self.sync_timeout):
+            return None
+        return informer.store.get(namespace, name)
+
+    def stop(self):
+        """Stop all running informers."""
+        with self._lock:
+            for informer in self._informers.values():
+                informer.stop()
+            self._informers = {}
+
+class DescribeCache:
+    """LRU cache of described objects, bounded by entry count and approximate size.
+
+    Entries younger than ttl are served as is. Older entries are only stale
+    candidates: the caller revalidates them by resourceVersion and either
+    refreshes them or replaces them.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 256, max_bytes: int = 16 * 1024 * 1024):
+        """Initialize an empty cache."""
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0}
+        self._entries: "OrderedDict[Tuple, Tuple[Optional[str], float, Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Tuple[Optional[Any], Optional[str], bool]:
+        """Look up an entry, returning (value, resource_version, fresh)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, None, False
+
+            self._entries.move_to_end(key)
+            resource_version, stored_at, value, _ = entry
+            return value, resource_version, time.monotonic() - stored_at < self.ttl
+
+    def put(self, key: Tuple, value: Any, resource_version: Optional[str]):
+        """Store an entry, evicting the least recently used ones to stay within bounds."""
+        size = len(json.dumps(value, default=str))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= old[3]
+
+            self._entries[key] = (resource_version, time.monotonic(), value, size)
+            self.size += size
+
+            while self._entries and (len(self._entries) > self.max_entries or self.size > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted[3]
+
+    def touch(self, key: Tuple):
+        """Mark an entry as fresh again after its resourceVersion was confirmed."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = (entry[0], time.monotonic(), entry[2], entry[3])
+
+    def invalidate(self, key: Tuple = None):
+        """Drop one entry, or all of them."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self.size = 0
+            else:
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self.size -= entry[3]
+
+    def __len__(self) -> int:
+        return len(self._entries)
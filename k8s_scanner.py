@@ -1,10 +1,16 @@
 """Kubernetes scanner for Groot CLI."""
 
 import asyncio
+import datetime
+import functools
+import heapq
 import json
 import re
 import os
-from typing import List, Dict, Any, Tuple, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple, Optional, AsyncIterator
 
 try:
     from kubernetes import client, config as k8s_config
@@ -14,42 +20,458 @@ except ImportError:
     k8s_available = False
 
 from rich.console import Console
-from groot.utils.helpers import format_age
+from groot.utils.helpers import format_age, parse_bool, timestamp_sort_key
 from groot.config import config as groot_config
+from groot.utils.k8s_objects import ObjectView, loads
+from groot.k8s_cache import DescribeCache, InformerCache
+from groot.pod_snapshot import PodSnapshot
+from groot.owner_graph import OwnerGraph
+from groot.label_index import LabelIndex, compile_selector
+from groot.rules import RuleEngine
+from groot.event_archive import EventArchive, EventRecorder
+from groot.event_index import event_last_seen
+from groot.discovery import DiscoveryCache
+from groot.rate_limiter import HTTP_TOO_MANY_REQUESTS, RequestScheduler, retry_after
+from groot.resilience import Resilience, ScanResult, describe_error
+from groot.snapshot import SNAPSHOT_KINDS, Snapshot, SnapshotWriter, match_field_selector, match_label_selector
+from groot.cassette import Cassette
 
 console = Console()
 
+# API path prefix, plural and scope of the kinds the scanner can request by path
+RESOURCE_PATHS = {
+    "pod": ("/api/v1", "pods", True),
+    "service": ("/api/v1", "services", True),
+    "endpoints": ("/api/v1", "endpoints", True),
+    "event": ("/api/v1", "events", True),
+    "configmap": ("/api/v1", "configmaps", True),
+    "secret": ("/api/v1", "secrets", True),
+    "namespace": ("/api/v1", "namespaces", False),
+    "node": ("/api/v1", "nodes", False),
+    "deployment": ("/apis/apps/v1", "deployments", True),
+    "replicaset": ("/apis/apps/v1", "replicasets", True),
+    "statefulset": ("/apis/apps/v1", "statefulsets", True),
+    "daemonset": ("/apis/apps/v1", "daemonsets", True),
+    "job": ("/apis/batch/v1", "jobs", True),
+    "cronjob": ("/apis/batch/v1", "cronjobs", True),
+    "ingress": ("/apis/networking.k8s.io/v1", "ingresses", True),
+    "endpointslice": ("/apis/discovery.k8s.io/v1", "endpointslices", True),
+    "networkpolicy": ("/apis/networking.k8s.io/v1", "networkpolicies", True),
+    "poddisruptionbudget": ("/apis/policy/v1", "poddisruptionbudgets", True)
+}
+
+# Kinds whose ownerReferences link pods to their workloads
+OWNER_GRAPH_KINDS = {
+    "pod": "Pod",
+    "replicaset": "ReplicaSet",
+    "deployment": "Deployment",
+    "statefulset": "StatefulSet",
+    "daemonset": "DaemonSet",
+    "job": "Job"
+}
+
+# Server-side printed columns, as used by kubectl get
+TABLE_ACCEPT = "application/json;as=Table;g=meta.k8s.io;v=v1,application/json"
+
+# Object metadata only, without spec or status
+METADATA_ACCEPT = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json"
+OBJECT_METADATA_ACCEPT = "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1,application/json"
+
+def _path_endpoint(path: str, verb: str = None) -> str:
+    """Endpoint of an API path, e.g. "get apps/v1/deployments", without its namespace and object name.
+
+    Circuit breakers and latency tracking are kept per endpoint, so they stay
+    few and cover every object of a resource.
+    """
+    parts = [part for part in path.split("/") if part]
+    if parts[:1] not in (["api"], ["apis"]):
+        return f"get {path}"
+
+    size = 2 if parts[0] == "api" else 3
+    group_version, rest = parts[1:size], parts[size:]
+    if len(rest) >= 3 and rest[0] == "namespaces":
+        rest = rest[2:]
+    if not rest:
+        return f"get {path}"
+
+    # Anything after the object name is a subresource, such as log or status
+    verb = verb or ("list" if len(rest) == 1 else "get")
+    return f"{verb} {'/'.join(group_version + rest[:1] + rest[2:])}"
+
+def _qualified_name(obj) -> str:
+    """namespace/name of an object, unique across the cluster."""
+    return f"{obj.metadata.namespace}/{obj.metadata.name}"
+
 class K8sScanner:
     """Scanner for Kubernetes resources."""
 
-    def __init__(self):
-        """Initialize the Kubernetes scanner."""
+    def __init__(self, use_cache: bool = None, io_mode: str = None, max_concurrency: int = None,
+                 raw_json: bool = None, context: str = None, snapshot: str = None, kubeconfig: str = None,
+                 cassette: Cassette = None):
+        """Initialize the Kubernetes scanner.
+
+        context selects a kubeconfig context; by default the current one is
+        used. Each scanner has its own API client and connection pool, so
+        scanners for different contexts can run side by side. kubeconfig
+        (config key kubeconfig) is the kubeconfig file to read instead of the
+        default one.
+
+        When use_cache is enabled (config key k8s_watch_cache), list getters are
+        served from a watch-backed local store instead of a LIST per call.
+
+        io_mode (config key k8s_io_mode) is "executor" to run the blocking
+        kubernetes client calls on a bounded thread pool of max_concurrency
+        workers (config key k8s_max_concurrency), or "blocking" to call them
+        directly on the event loop.
+
+        raw_json (config key k8s_raw_json) decodes LIST responses straight into
+        lightweight ObjectViews instead of kubernetes client models.
+
+        With the config key event_archive enabled, events are recorded in the
+        background to a local archive (event_archive_path, kept for
+        event_archive_retention_days) that get_events queries by time range.
+
+        analyze_resources checks objects with the built-in rules plus any YAML
+        rule packs listed in the config key rule_packs.
+
+        API requests are rate limited on the client to k8s_qps requests per
+        second with bursts of up to k8s_burst, serving interactive calls such
+        as describe before background LISTs and watch relists.
+
+        snapshot (config key snapshot) is the path of a file written by
+        save_snapshot; the scanner then serves every getter from it instead
+        of connecting to a cluster.
+
+        cassette records every API response to a Cassette, or replays them
+        from it without connecting. Watches, hedged requests and the event
+        recorder are then turned off, since their traffic depends on timing
+        rather than on the commands run.
+        """
         self.initialized = False
+        self.context = context
+        self.kubeconfig = kubeconfig or groot_config.get("kubeconfig")
+        self.snapshot_path = snapshot or groot_config.get("snapshot")
+        self.snapshot = None
+        self.cassette = cassette
         self.v1 = None
         self.apps_v1 = None
         self.custom_api = None
+        self.discovery_v1 = None
+        self.networking_v1 = None
+        self.api_client = None
+        self.discovery = None
+        self.resource_paths = dict(RESOURCE_PATHS)
+        self.use_cache = use_cache if use_cache is not None else parse_bool(groot_config.get("k8s_watch_cache", False))
+        self.use_cache = self.use_cache and cassette is None
+        self.cache = None
+        self.io_mode = io_mode or groot_config.get("k8s_io_mode", "executor")
+        self.max_concurrency = int(max_concurrency or groot_config.get("k8s_max_concurrency", 8))
+        self.raw_json = raw_json if raw_json is not None else parse_bool(groot_config.get("k8s_raw_json", False))
+        self.page_size = int(groot_config.get("k8s_page_size", 500))
+        self.log_buffer_lines = int(groot_config.get("k8s_log_buffer_lines", 1000))
+        self.describe_cache = DescribeCache(
+            float(groot_config.get("describe_cache_ttl", 30)),
+            int(groot_config.get("describe_cache_max_entries", 256)),
+            int(groot_config.get("describe_cache_max_bytes", 16 * 1024 * 1024))
+        )
+        self.scheduler = RequestScheduler(
+            float(groot_config.get("k8s_qps", 20)),
+            int(groot_config.get("k8s_burst", 40))
+        )
+        self.max_retries = int(groot_config.get("k8s_max_retries", 3))
+        self.resilience = Resilience(
+            failure_threshold=int(groot_config.get("k8s_circuit_failure_threshold", 5)),
+            reset_timeout=float(groot_config.get("k8s_circuit_reset_timeout", 30)),
+            hedge_delay=float(groot_config.get("k8s_hedge_delay", 1.0)) if cassette is None else 0
+        )
+        # Last good result of each list, served marked stale when a later request fails
+        self._last_good: Dict[Tuple, List[Any]] = {}
+        self.use_event_archive = parse_bool(groot_config.get("event_archive", False)) and cassette is None
+        self.event_archive = None
+        self.event_recorder = None
+        self._analysis_cache: Dict[str, Dict[str, Tuple[str, List[Dict[str, Any]]]]] = {}
+        self.analysis_stats = {"evaluated": 0, "reused": 0}
+        self.rules = None
+        self.load_rules()
+        self._executor = None
+        self._init_lock = None
+
+    def load_rules(self, pack_paths: List[str] = None):
+        """(Re)load the analysis rules from the built-in pack and YAML rule packs."""
+        if pack_paths is None:
+            pack_paths = groot_config.get("rule_packs", [])
+            if isinstance(pack_paths, str):
+                pack_paths = [path.strip() for path in pack_paths.split(",") if path.strip()]
+
+        self.rules = RuleEngine.load(pack_paths)
+
+        # Cached per-object results were produced by the old rules
+        self._analysis_cache = {}
 
     async def initialize(self):
-        """Initialize the Kubernetes client."""
+        """Initialize the Kubernetes client, or open the snapshot."""
         if self.initialized:
             return
 
+        if self.snapshot_path:
+            try:
+                self.snapshot = Snapshot(self.snapshot_path)
+                self.initialized = True
+            except (OSError, ValueError) as e:
+                console.print(f"[red]Error opening snapshot {self.snapshot_path}: {e}[/red]")
+            return
+
         if not k8s_available:
             console.print("[red]Kubernetes client not available. Please install kubernetes package.[/red]")
             return
 
+        # Concurrent callers wait for the first one instead of loading kubeconfig again
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+
+        async with self._init_lock:
+            if self.initialized:
+                return
+
+            try:
+                # Load kubeconfig into a private configuration, so scanners for other contexts don't share it
+                configuration = client.Configuration()
+                if self.cassette and self.cassette.replaying:
+                    configuration.host = self.cassette.metadata.get("host", "http://localhost")
+                else:
+                    await self._call(k8s_config.load_kube_config, config_file=self.kubeconfig, context=self.context,
+                                     client_configuration=configuration, _priority=None)
+
+                # Size the connection pool so concurrent calls don't queue for a connection
+                configuration.connection_pool_maxsize = max(self.max_concurrency, 4)
+                self.api_client = client.ApiClient(configuration)
+                if self.cassette:
+                    self.cassette.wrap_rest_client(self.api_client.rest_client)
+                    self.cassette.metadata.setdefault("host", configuration.host)
+
+                # Create API clients
+                self.v1 = client.CoreV1Api(self.api_client)
+                self.apps_v1 = client.AppsV1Api(self.api_client)
+                self.custom_api = client.CustomObjectsApi(self.api_client)
+                self.discovery_v1 = client.DiscoveryV1Api(self.api_client)
+                self.networking_v1 = client.NetworkingV1Api(self.api_client)
+                self.discovery = DiscoveryCache(configuration.host, float(groot_config.get("discovery_cache_ttl", 3600)))
+
+                if self.use_cache:
+                    self.cache = InformerCache(float(groot_config.get("k8s_cache_sync_timeout", 30)), raw=self.raw_json,
+                                               scheduler=self.scheduler)
+                    self.cache.register("pod", self.v1.list_pod_for_all_namespaces)
+                    self.cache.register("deployment", self.apps_v1.list_deployment_for_all_namespaces)
+                    self.cache.register("service", self.v1.list_service_for_all_namespaces)
+                    self.cache.register("event", self.v1.list_event_for_all_namespaces)
+
+                if self.use_event_archive:
+                    # One archive per context unless a path is configured
+                    default_path = f"~/.groot/events-{self.context}.db" if self.context else None
+                    self.event_archive = EventArchive(
+                        groot_config.get("event_archive_path", default_path),
+                        int(groot_config.get("event_archive_retention_days", 7))
+                    )
+                    self.event_recorder = EventRecorder(self.event_archive, self.v1.list_event_for_all_namespaces,
+                                                        scheduler=self.scheduler)
+                    self.event_recorder.start()
+
+                self.initialized = True
+            except Exception as e:
+                console.print(f"[red]Error initializing Kubernetes client: {e}[/red]")
+
+    def close(self):
+        """Stop background watches and release the I/O executor and snapshot."""
+        if self.snapshot:
+            self.snapshot.close()
+            self.snapshot = None
+            self.initialized = False
+        if self.cache:
+            self.cache.stop()
+        if self.event_recorder:
+            self.event_recorder.stop()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _call(self, func, *args, _priority: Optional[str] = "normal", **kwargs):
+        """Run a blocking kubernetes client call according to the I/O mode.
+
+        API calls first wait for the request scheduler in the _priority lane
+        ("interactive", "normal" or "background"); None marks local work that
+        is not rate limited. A 429 response pauses all requests for its
+        Retry-After. Server errors and failed connections are retried with
+        jittered backoff and count towards the endpoint's circuit breaker;
+        calls to an open circuit fail fast. Together that is at most
+        k8s_max_retries retries. Slow reads outside the background lane are
+        hedged with a second request. Errors that remain are raised as
+        ApiException.
+        """
+        if _priority is None:
+            return await self._run(func, *args, **kwargs)
+
+        endpoint = self._endpoint(func, args)
+        breaker = self.resilience.breaker(endpoint)
+        attempt = 0
+
+        while True:
+            trial = breaker.state == "half-open"
+            if not breaker.allow():
+                self.resilience.stats["rejected"] += 1
+                raise ApiException(reason=f"Circuit open for {endpoint} after repeated failures, "
+                                          f"retrying in {breaker.retry_in():.0f}s")
+
+            try:
+                await self.scheduler.acquire(_priority)
+                started = time.monotonic()
+                if _priority != "background" and self.io_mode == "executor":
+                    result = await self._hedged(endpoint, _priority, func, *args, **kwargs)
+                else:
+                    result = await self._run(func, *args, **kwargs)
+            except Exception as e:
+                throttled = isinstance(e, ApiException) and e.status == HTTP_TOO_MANY_REQUESTS
+                transient = throttled or self.resilience.retryable(e)
+                if not transient:
+                    # Errors such as 404 show the endpoint is up
+                    breaker.record_success()
+                elif not throttled:
+                    breaker.record_failure()
+                elif trial:
+                    # Throttling says nothing about the endpoint, so let the retry be the trial
+                    breaker.release()
+
+                if not transient or attempt >= self.max_retries:
+                    if isinstance(e, ApiException):
+                        raise
+                    raise ApiException(reason=f"{type(e).__name__}: {e}") from e
+
+                if throttled:
+                    self.scheduler.backoff(retry_after(e, 2 ** attempt))
+                else:
+                    await asyncio.sleep(self.resilience.backoff(attempt))
+                self.resilience.stats["retries"] += 1
+                attempt += 1
+                continue
+            except BaseException:
+                # A cancelled trial (e.g. by a fleet scan timeout) must not hold the circuit open for good
+                if trial:
+                    breaker.release()
+                raise
+
+            breaker.record_success()
+            self.resilience.record_latency(endpoint, time.monotonic() - started)
+            return result
+
+    async def _hedged(self, endpoint: str, priority: str, func, *args, **kwargs):
+        """Run a read, racing a second request against it once it is slower than usual."""
+        delay = self.resilience.hedge_delay(endpoint)
+        first = asyncio.ensure_future(self._run(func, *args, **kwargs))
+        if delay is None:
+            return await first
+
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done:
+            return first.result()
+
+        await self.scheduler.acquire(priority)
+        self.resilience.stats["hedged"] += 1
+        second = asyncio.ensure_future(self._run(func, *args, **kwargs))
+
+        # The first successful response wins; the loser's thread finishes in the background
+        pending = {first, second}
         try:
-            # Load kubeconfig
-            k8s_config.load_kube_config()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is second:
+                            self.resilience.stats["hedge_wins"] += 1
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return first.result()
+
+    def _endpoint(self, func, args: Tuple) -> str:
+        """Name of the API endpoint a call goes to, for circuit breaking and latency tracking."""
+        if func == self._list_raw:
+            func = args[0]
+        elif func == self._get_json:
+            return _path_endpoint(args[0])
+        return getattr(func, "__name__", None) or repr(func)
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking function on the executor, or directly in blocking mode."""
+        if self.io_mode != "executor":
+            return func(*args, **kwargs)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="groot-k8s")
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _list(self, func, *args, **kwargs) -> Tuple[List[Any], Optional[str]]:
+        """Run a LIST call in the background lane and return its items and continue token."""
+        if self.raw_json:
+            return await self._call(self._list_raw, func, *args, _priority="background", **kwargs)
+
+        result = await self._call(func, *args, _priority="background", **kwargs)
+        return result.items, result.metadata._continue
+
+    def _list_raw(self, func, *args, **kwargs) -> Tuple[List[Any], Optional[str]]:
+        """Run a LIST call and decode the response body straight into ObjectViews.
+
+        This skips the kubernetes client's OpenAPI model deserialization, which
+        dominates CPU time on large lists.
+        """
+        response = func(*args, _preload_content=False, **kwargs)
+        data = loads(response.data)
+        metadata = data.get("metadata") or {}
+        return [ObjectView(item) for item in data.get("items") or []], metadata.get("continue")
+
+    def _remember(self, key: Tuple, items: List[Any]) -> List[Any]:
+        """Keep a successful list result to fall back on."""
+        self._last_good[key] = items
+        return items
 
-            # Create API clients
-            self.v1 = client.CoreV1Api()
-            self.apps_v1 = client.AppsV1Api()
-            self.custom_api = client.CustomObjectsApi()
+    def _degraded(self, key: Tuple, description: str, error: Exception, items: List[Any] = ()) -> ScanResult:
+        """Result of a failed list: the last good result marked stale, or what was fetched marked partial."""
+        reason = describe_error(error)
+        message = f"{description}: {reason}"
 
-            self.initialized = True
-        except Exception as e:
-            console.print(f"[red]Error initializing Kubernetes client: {e}[/red]")
+        last_good = self._last_good.get(key)
+        if last_good is not None:
+            console.print(f"[yellow]Error getting {description}, using the last good result: {reason}[/yellow]")
+            return ScanResult(last_good, stale=True, errors=[message])
+
+        console.print(f"[red]Error getting {description}: {reason}[/red]")
+        return ScanResult(items, partial=True, errors=[message])
+
+    async def _cached_list(self, kind: str, namespace: str = None) -> Optional[List[Any]]:
+        """List objects from the snapshot or the watch cache, or None if neither can serve them."""
+        if self.snapshot:
+            if kind not in self.snapshot.kinds:
+                return ScanResult(partial=True, errors=[f"{kind}s: not in snapshot"])
+
+            objects = await self._call(self.snapshot.list, kind, namespace, _priority=None)
+            incomplete = (self.snapshot.metadata.get("incomplete") or {}).get(kind)
+            if incomplete:
+                return ScanResult(objects, partial=True, errors=[f"{kind}s: {incomplete} while saving the snapshot"])
+            return objects
+
+        if not self.cache or not self.cache.supports(kind):
+            return None
+
+        # The first read waits for the initial LIST, so keep it off the event loop
+        informer = self.cache.informer(kind)
+        if not informer.synced.is_set():
+            loop = asyncio.get_running_loop()
+            if not await loop.run_in_executor(None, informer.wait_for_sync, self.cache.sync_timeout):
+                return None
+
+        return informer.store.list(namespace)
 
     async def get_pods(self, namespace: str = None) -> List[Any]:
         """Get pods from the cluster."""
@@ -58,86 +480,473 @@ class K8sScanner:
         if not self.initialized:
             return []
 
+        cached = await self._cached_list("pod", namespace)
+        if cached is not None:
+            return cached
+
+        key = ("pod", namespace)
         try:
             if namespace and namespace != "all":
-                pods = self.v1.list_namespaced_pod(namespace)
+                pods, _ = await self._list(self.v1.list_namespaced_pod, namespace)
             else:
-                pods = self.v1.list_pod_for_all_namespaces()
+                pods, _ = await self._list(self.v1.list_pod_for_all_namespaces)
 
-            return pods.items
+            return self._remember(key, pods)
         except ApiException as e:
-            console.print(f"[red]Error getting pods: {e}[/red]")
-            return []
+            return self._degraded(key, "pods", e)
+
+    async def iter_pods(self, namespace: str = None, page_size: int = None, errors: List[str] = None) -> AsyncIterator[Any]:
+        """Stream pods from the cluster one LIST page at a time.
 
-    async def get_deployments(self) -> List[Tuple[str, int, str]]:
-        """Get deployments from the cluster."""
+        If the LIST fails part way, the stream ends early and the error is
+        appended to errors, so callers can tell a short list from a failed one.
+        """
         await self.initialize()
 
         if not self.initialized:
-            return []
+            return
 
-        try:
-            deployments = self.apps_v1.list_deployment_for_all_namespaces()
+        cached = await self._cached_list("pod", namespace)
+        if cached is not None:
+            if isinstance(cached, ScanResult) and errors is not None:
+                errors.extend(cached.errors)
+            for pod in cached:
+                yield pod
+            return
+
+        async for pod in self._iter_list(
+            self.v1.list_namespaced_pod,
+            self.v1.list_pod_for_all_namespaces,
+            namespace,
+            page_size,
+            "pods",
+            errors
+        ):
+            yield pod
 
-            result = []
-            for deployment in deployments.items:
-                name = deployment.metadata.name
-                replicas = deployment.spec.replicas
+    async def get_pod_snapshot(self, namespace: str = None, errors: List[str] = None) -> PodSnapshot:
+        """Stream pods into a compact columnar snapshot; list errors are appended to errors."""
+        snapshot = PodSnapshot()
+        async for pod in self.iter_pods(namespace, errors=errors):
+            snapshot.append(pod)
+        return snapshot
 
-                # Check if deployment is healthy
-                available = deployment.status.available_replicas or 0
-                desired = deployment.status.replicas or 0
+    async def _iter_list(self, namespaced_func, cluster_func, namespace: str, page_size: int,
+                         description: str, errors: List[str] = None, **kwargs) -> AsyncIterator[Any]:
+        """Page through a LIST call with limit/continue, yielding items as they arrive."""
+        limit = page_size or self.page_size
+        continue_token = None
 
-                if desired == 0:
-                    status = "No replicas desired"
-                elif available == desired:
-                    status = f"Healthy ({available}/{desired} replicas)"
+        try:
+            while True:
+                if namespace and namespace != "all":
+                    items, continue_token = await self._list(namespaced_func, namespace, limit=limit, _continue=continue_token, **kwargs)
                 else:
-                    status = f"Unhealthy ({available}/{desired} replicas)"
+                    items, continue_token = await self._list(cluster_func, limit=limit, _continue=continue_token, **kwargs)
 
-                result.append((name, replicas, status))
+                for item in items:
+                    yield item
 
-            return result
+                if not continue_token:
+                    break
         except ApiException as e:
-            console.print(f"[red]Error getting deployments: {e}[/red]")
-            return []
+            console.print(f"[red]Error getting {description}: {describe_error(e)}[/red]")
+            if errors is not None:
+                errors.append(f"{description}: {describe_error(e)}")
+
+    async def resolve_resource(self, kind: str) -> Optional[Tuple[str, str, bool]]:
+        """Find the API path prefix, plural and scope of any kind, including custom resources.
+
+        Kinds outside RESOURCE_PATHS are looked up by kind, plural, singular,
+        short name or plural.group in the discovery cache, which is refreshed
+        only when it is stale or doesn't know the name.
+        """
+        if kind in self.resource_paths:
+            return self.resource_paths[kind]
 
-    async def get_services(self) -> List[Tuple[str, str]]:
-        """Get services from the cluster."""
         await self.initialize()
 
+        if not self.initialized or self.discovery is None:
+            return None
+
+        if self.discovery.needs_refresh(kind):
+            try:
+                await self._call(self.discovery.refresh, self._get_json_blocking, _priority=None)
+            except Exception as e:
+                console.print(f"[red]Error refreshing API discovery: {e}[/red]")
+
+        info = self.discovery.lookup(kind)
+        if info is None:
+            console.print(f"[red]Unknown resource type: {kind}[/red]")
+            return None
+
+        self.resource_paths[kind] = (info.prefix, info.plural, info.namespaced)
+        return self.resource_paths[kind]
+
+    def _resource_path(self, kind: str, namespace: str = None) -> str:
+        """Build the collection path for a kind, e.g. /api/v1/namespaces/default/pods."""
+        prefix, plural, namespaced = self.resource_paths[kind]
+        if namespaced and namespace and namespace != "all":
+            return f"{prefix}/namespaces/{namespace}/{plural}"
+        return f"{prefix}/{plural}"
+
+    def _get_json(self, path: str, query_params: List[Tuple[str, Any]] = None, accept: str = "application/json") -> Dict[str, Any]:
+        """GET an API path with a custom Accept header and decode the JSON body."""
+        if hasattr(self.api_client, "param_serialize"):
+            # kubernetes >= 32 builds the request separately and leaves error statuses to the caller
+            request = self.api_client.param_serialize(
+                "GET",
+                path,
+                query_params=query_params or [],
+                header_params={"Accept": accept},
+                auth_settings=["BearerToken"]
+            )
+            response = self.api_client.call_api(*request)
+            response.read()
+            if not 200 <= response.status <= 299:
+                raise ApiException(http_resp=response)
+            return loads(response.data)
+
+        response = self.api_client.call_api(
+            path,
+            "GET",
+            query_params=query_params or [],
+            header_params={"Accept": accept},
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True,
+            _preload_content=False
+        )
+        return loads(response.data)
+
+    def _get_json_blocking(self, path: str, accept: str = "application/json") -> Dict[str, Any]:
+        """_get_json for code running on a worker thread, waiting for the scheduler first."""
+        self.scheduler.acquire_blocking("normal")
+        return self._get_json(path, None, accept)
+
+    async def get_resource_table(self, kind: str, namespace: str = None, page_size: int = None) -> Dict[str, Any]:
+        """Get the server-side printed table for a kind instead of full objects.
+
+        Returns {"columns": [...], "rows": [{"name", "namespace", "cells": {column: value}}]},
+        with "partial" set if the LIST failed and "unresolved" if the kind is unknown.
+        """
+        await self.initialize()
+
+        table = {"columns": [], "rows": []}
+        if self.snapshot:
+            return await self._snapshot_table(kind, namespace)
+
         if not self.initialized:
-            return []
+            return table
+
+        if not await self.resolve_resource(kind):
+            table["unresolved"] = True
+            return table
+
+        path = self._resource_path(kind, namespace)
+        continue_token = None
 
         try:
-            services = self.v1.list_service_for_all_namespaces()
+            while True:
+                query_params = [("limit", page_size or self.page_size), ("includeObject", "Metadata")]
+                if continue_token:
+                    query_params.append(("continue", continue_token))
 
-            result = []
-            for service in services.items:
-                name = service.metadata.name
-                service_type = service.spec.type
+                page = await self._call(self._get_json, path, query_params, TABLE_ACCEPT, _priority="background")
 
-                result.append((name, service_type))
+                if not table["columns"]:
+                    table["columns"] = [column["name"] for column in page.get("columnDefinitions") or []]
 
-            return result
+                for row in page.get("rows") or []:
+                    metadata = (row.get("object") or {}).get("metadata") or {}
+                    table["rows"].append({
+                        "name": metadata.get("name"),
+                        "namespace": metadata.get("namespace"),
+                        "cells": dict(zip(table["columns"], row.get("cells") or []))
+                    })
+
+                continue_token = (page.get("metadata") or {}).get("continue")
+                if not continue_token:
+                    break
         except ApiException as e:
-            console.print(f"[red]Error getting services: {e}[/red]")
+            console.print(f"[red]Error getting {kind} table: {describe_error(e)}[/red]")
+            table["partial"] = True
+            table["errors"] = [f"{kind}s: {describe_error(e)}"]
+
+        return table
+
+    async def _snapshot_table(self, kind: str, namespace: str = None) -> Dict[str, Any]:
+        """Build a name/namespace/age table from the snapshot, which holds no server-side columns."""
+        objects = await self._cached_list(kind, namespace)
+        table = {"columns": ["Name", "Namespace", "Age"], "rows": []}
+        if isinstance(objects, ScanResult) and objects.partial:
+            table["partial"] = True
+            table["errors"] = objects.errors
+
+        for obj in objects:
+            table["rows"].append({
+                "name": obj.metadata.name,
+                "namespace": obj.metadata.namespace,
+                "cells": {
+                    "Name": obj.metadata.name,
+                    "Namespace": obj.metadata.namespace or "",
+                    "Age": format_age(obj.metadata.creation_timestamp)
+                }
+            })
+        return table
+
+    async def list_metadata(self, kind: str, namespace: str = None, label_selector: str = None) -> List[ObjectView]:
+        """List only the metadata of objects of a kind, without spec or status."""
+        await self.initialize()
+
+        if self.snapshot:
+            objects = await self._cached_list(kind, namespace)
+            if label_selector:
+                matched = [obj for obj in objects if match_label_selector(obj.metadata.labels, label_selector)]
+                objects = ScanResult(matched).merge_status(objects)
+            return objects
+
+        if not self.initialized or not await self.resolve_resource(kind):
+            return []
+
+        path = self._resource_path(kind, namespace)
+        result = []
+        continue_token = None
+
+        try:
+            while True:
+                query_params = [("limit", self.page_size)]
+                if label_selector:
+                    query_params.append(("labelSelector", label_selector))
+                if continue_token:
+                    query_params.append(("continue", continue_token))
+
+                page = await self._call(self._get_json, path, query_params, METADATA_ACCEPT, _priority="background")
+                result.extend(ObjectView(item) for item in page.get("items") or [])
+
+                continue_token = (page.get("metadata") or {}).get("continue")
+                if not continue_token:
+                    break
+        except ApiException as e:
+            return self._degraded(("metadata", kind, namespace, label_selector), f"{kind} metadata", e, result)
+
+        return self._remember(("metadata", kind, namespace, label_selector), result)
+
+    async def list_objects(self, kind: str, namespace: str = None) -> List[ObjectView]:
+        """List full objects of any kind, including custom resources, as ObjectViews."""
+        await self.initialize()
+
+        if self.snapshot:
+            return await self._cached_list(kind, namespace)
+
+        if not self.initialized or not await self.resolve_resource(kind):
             return []
 
-    async def get_namespaces(self) -> List[str]:
-        """Get namespaces from the cluster."""
+        path = self._resource_path(kind, namespace)
+        result = []
+        continue_token = None
+
+        try:
+            while True:
+                query_params = [("limit", self.page_size)]
+                if continue_token:
+                    query_params.append(("continue", continue_token))
+
+                page = await self._call(self._get_json, path, query_params, _priority="background")
+                result.extend(ObjectView(item) for item in page.get("items") or [])
+
+                continue_token = (page.get("metadata") or {}).get("continue")
+                if not continue_token:
+                    break
+        except ApiException as e:
+            return self._degraded(("objects", kind, namespace), f"{kind}s", e, result)
+
+        return self._remember(("objects", kind, namespace), result)
+
+    async def save_snapshot(self, path: str, namespace: str = None, kinds: List[str] = None) -> Dict[str, int]:
+        """Stream objects of every kind in SNAPSHOT_KINDS (or kinds) into a snapshot file.
+
+        Objects are listed page by page as raw JSON and written as they
+        arrive, so memory use stays at about one page whatever the cluster
+        size. With a namespace, namespaced kinds are only saved from it.
+        Returns the number of objects saved per kind; kinds that fail part way
+        are recorded as incomplete and read back marked partial.
+        """
+        await self.initialize()
+
+        if not self.initialized or self.snapshot:
+            return {}
+
+        writer = SnapshotWriter(path, metadata={
+            "context": self.context,
+            "namespace": namespace if namespace != "all" else None,
+            "server": self.api_client.configuration.host
+        })
+        counts = {}
+
+        try:
+            for kind in kinds or SNAPSHOT_KINDS:
+                if not await self.resolve_resource(kind):
+                    continue
+
+                collection = self._resource_path(kind, namespace)
+                continue_token = None
+                counts[kind] = 0
+
+                try:
+                    while True:
+                        query_params = [("limit", self.page_size)]
+                        if continue_token:
+                            query_params.append(("continue", continue_token))
+
+                        page = await self._call(self._get_json, collection, query_params, _priority="background")
+                        items = page.get("items") or []
+                        await self._call(writer.add, kind, items, _priority=None)
+                        counts[kind] += len(items)
+
+                        continue_token = (page.get("metadata") or {}).get("continue")
+                        if not continue_token:
+                            break
+                except ApiException as e:
+                    console.print(f"[red]Error saving {kind}s: {describe_error(e)}[/red]")
+                    writer.index["metadata"].setdefault("incomplete", {})[kind] = describe_error(e)
+
+            await self._call(writer.close, _priority=None)
+        except BaseException:
+            writer.abort()
+            raise
+
+        return counts
+
+    async def get_custom_resources(self, group: str, version: str, plural: str, namespace: str = None) -> List[Dict]:
+        """Get custom resources of a specific type."""
         await self.initialize()
 
         if not self.initialized:
-            return ["default"]
+            return []
+
+        if self.snapshot:
+            return ScanResult(partial=True, errors=[f"{plural}.{group}: not in snapshot"])
 
         try:
-            namespaces = self.v1.list_namespace()
+            if namespace and namespace != "all":
+                resources = await self._call(self.custom_api.list_namespaced_custom_object, group, version, namespace, plural,
+                                             _priority="background")
+            else:
+                resources = await self._call(self.custom_api.list_cluster_custom_object, group, version, plural,
+                                             _priority="background")
+            return self._remember(("custom", group, version, plural, namespace), resources.get("items", []))
+        except ApiException as e:
+            return self._degraded(("custom", group, version, plural, namespace), f"{plural}.{group}", e)
 
-            return [ns.metadata.name for ns in namespaces.items]
+    async def count_resources(self, kind: str, namespace: str = None) -> Optional[int]:
+        """Count objects of a kind without downloading them.
+
+        Asks for a single metadata-only item and reads remainingItemCount;
+        servers that omit it are counted page by page from metadata. Returns
+        None if the objects could not be counted, so that an API error isn't
+        reported as an empty cluster.
+        """
+        await self.initialize()
+
+        if self.snapshot:
+            return self.snapshot.count(kind, namespace)
+
+        if not self.initialized or not await self.resolve_resource(kind):
+            return None
+
+        try:
+            page = await self._call(self._get_json, self._resource_path(kind, namespace), [("limit", 1)], METADATA_ACCEPT)
         except ApiException as e:
-            console.print(f"[red]Error getting namespaces: {e}[/red]")
-            return ["default"]
+            console.print(f"[red]Error counting {kind}s: {describe_error(e)}[/red]")
+            return None
+
+        metadata = page.get("metadata") or {}
+        items = page.get("items") or []
+
+        if not metadata.get("continue"):
+            return len(items)
+        if metadata.get("remainingItemCount") is not None:
+            return len(items) + metadata["remainingItemCount"]
+
+        objects = await self.list_metadata(kind, namespace)
+        if isinstance(objects, ScanResult) and objects.partial:
+            return None
+        return len(objects)
+
+    async def build_owner_graph(self, namespace: str = None, kinds: List[str] = None,
+                                graph: OwnerGraph = None) -> OwnerGraph:
+        """Index ownerReferences of pods and workloads from metadata-only LISTs."""
+        graph = graph if graph is not None else OwnerGraph()
+        kinds = kinds or list(OWNER_GRAPH_KINDS)
+
+        results = await asyncio.gather(*[self.list_metadata(kind, namespace) for kind in kinds])
+        for kind, items in zip(kinds, results):
+            for item in items:
+                graph.add(OWNER_GRAPH_KINDS[kind], item)
+
+        return graph
+
+    async def get_deployments(self) -> ScanResult:
+        """Get deployments from the cluster as (name, namespace, replicas, status), marked stale or partial on error."""
+        await self.initialize()
+
+        if not self.initialized:
+            return ScanResult(partial=True, errors=["Kubernetes client not initialized"])
+
+        deployments = await self._list_namespaced("deployment", None)
+        result = ScanResult().merge_status(deployments)
+        for deployment in deployments:
+            name = deployment.metadata.name
+            replicas = deployment.spec.replicas
+
+            # Check if deployment is healthy
+            available = deployment.status.available_replicas or 0
+            desired = deployment.status.replicas or 0
+
+            if desired == 0:
+                status = "No replicas desired"
+            elif available == desired:
+                status = f"Healthy ({available}/{desired} replicas)"
+            else:
+                status = f"Unhealthy ({available}/{desired} replicas)"
+
+            result.append((name, deployment.metadata.namespace, replicas, status))
+
+        return result
+
+    async def get_services(self) -> ScanResult:
+        """Get services from the cluster as (name, type), marked stale or partial on error."""
+        await self.initialize()
+
+        if not self.initialized:
+            return ScanResult(partial=True, errors=["Kubernetes client not initialized"])
+
+        services = await self._list_namespaced("service", None)
+        result = ScanResult().merge_status(services)
+        for service in services:
+            result.append((service.metadata.name, service.spec.type))
+
+        return result
+
+    async def get_namespaces(self) -> ScanResult:
+        """Get namespace names from the cluster, marked stale or partial on error."""
+        await self.initialize()
+
+        if not self.initialized:
+            return ScanResult(["default"], partial=True, errors=["Kubernetes client not initialized"])
+
+        if self.snapshot:
+            namespaces = await self._cached_list("namespace")
+            return ScanResult([ns.metadata.name for ns in namespaces] or ["default"]).merge_status(namespaces)
+
+        key = ("namespace", None)
+        try:
+            namespaces, _ = await self._list(self.v1.list_namespace)
+            namespaces = self._remember(key, namespaces)
+        except ApiException as e:
+            namespaces = self._degraded(key, "namespaces", e)
+
+        return ScanResult([ns.metadata.name for ns in namespaces]).merge_status(namespaces)
 
     async def get_pod_logs(self, pod_name: str, namespace: str, container: str = None, tail_lines: int = 100) -> str:
         """Get logs for a pod."""
@@ -146,19 +955,26 @@ class K8sScanner:
         if not self.initialized:
             return "Error: Kubernetes client not initialized"
 
+        if self.snapshot:
+            return "Error: Logs are not stored in snapshots"
+
         try:
             if container:
-                logs = self.v1.read_namespaced_pod_log(
+                logs = await self._call(
+                    self.v1.read_namespaced_pod_log,
                     name=pod_name,
                     namespace=namespace,
                     container=container,
-                    tail_lines=tail_lines
+                    tail_lines=tail_lines,
+                    _priority="interactive"
                 )
             else:
-                logs = self.v1.read_namespaced_pod_log(
+                logs = await self._call(
+                    self.v1.read_namespaced_pod_log,
                     name=pod_name,
                     namespace=namespace,
-                    tail_lines=tail_lines
+                    tail_lines=tail_lines,
+                    _priority="interactive"
                 )
 
             return logs
@@ -168,77 +984,346 @@ class K8sScanner:
             else:
                 return f"Error getting logs: {e}"
 
-    async def get_events(self, namespace: str, field_selector: str = None) -> List[Dict[str, Any]]:
-        """Get events from the cluster."""
+    async def stream_pod_logs(self, pod_name: str, namespace: str, container: str = None, follow: bool = True,
+                              since_seconds: int = None, limit_bytes: int = None, timestamps: bool = False,
+                              tail_lines: int = None) -> AsyncIterator[str]:
+        """Stream log lines for a pod as they arrive.
+
+        A reader thread pushes lines into a bounded queue (config key
+        k8s_log_buffer_lines), so a slow consumer stalls the HTTP stream instead
+        of buffering without limit. Closing the generator, or cancelling the
+        task consuming it, closes the connection.
+        """
         await self.initialize()
 
         if not self.initialized:
-            return []
+            yield "Error: Kubernetes client not initialized"
+            return
+
+        if self.snapshot:
+            yield "Error: Logs are not stored in snapshots"
+            return
+
+        kwargs = {"follow": follow, "timestamps": timestamps}
+        for key, value in (("container", container), ("since_seconds", since_seconds),
+                           ("limit_bytes", limit_bytes), ("tail_lines", tail_lines)):
+            if value is not None:
+                kwargs[key] = value
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.log_buffer_lines)
+        stopped = threading.Event()
+        stream = {}
+        end = object()
+
+        def put(item):
+            # Blocks the reader thread while the queue is full
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        def read():
+            try:
+                self.scheduler.acquire_blocking("interactive")
+                response = self.v1.read_namespaced_pod_log(pod_name, namespace, _preload_content=False, **kwargs)
+                stream["response"] = response
+                if stopped.is_set():
+                    response.close()
+                    return
+
+                pending = b""
+                for chunk in response.stream(amt=None):
+                    pending += chunk
+                    *lines, pending = pending.split(b"\n")
+                    for line in lines:
+                        if stopped.is_set():
+                            return
+                        put(line.decode("utf-8", errors="replace"))
+                if pending and not stopped.is_set():
+                    put(pending.decode("utf-8", errors="replace"))
+            except Exception as e:
+                if not stopped.is_set():
+                    put(e)
+            finally:
+                if not stopped.is_set():
+                    put(end)
+
+        reader = threading.Thread(target=read, name=f"groot-logs-{pod_name}", daemon=True)
+        reader.start()
 
         try:
-            if namespace and namespace != "all":
-                events = self.v1.list_namespaced_event(
-                    namespace=namespace,
-                    field_selector=field_selector,
-                    sort_by="lastTimestamp"
-                )
-            else:
-                events = self.v1.list_event_for_all_namespaces(
-                    field_selector=field_selector,
-                    sort_by="lastTimestamp"
-                )
+            while True:
+                item = await queue.get()
+                if item is end:
+                    break
 
-            # Convert to dict for easier handling
-            result = []
-            for event in events.items:
-                event_dict = {
-                    "type": event.type,
-                    "reason": event.reason,
-                    "message": event.message,
-                    "count": event.count,
-                    "firstTimestamp": event.first_timestamp,
-                    "lastTimestamp": event.last_timestamp,
-                    "involvedObject": {
-                        "kind": event.involved_object.kind,
-                        "name": event.involved_object.name,
-                        "namespace": event.involved_object.namespace
-                    }
-                }
-                result.append(event_dict)
+                if isinstance(item, ApiException):
+                    if item.status == 404:
+                        yield f"Error: Pod {pod_name} not found in namespace {namespace}"
+                    else:
+                        yield f"Error getting logs: {item}"
+                    break
+                if isinstance(item, Exception):
+                    yield f"Error streaming logs: {item}"
+                    break
 
-            return result
-        except ApiException as e:
-            console.print(f"[red]Error getting events: {e}[/red]")
+                yield item
+        finally:
+            stopped.set()
+            response = stream.get("response")
+            if response is not None:
+                response.close()
+
+            # Unblock a reader waiting on a full queue so the thread can exit
+            while not queue.empty():
+                queue.get_nowait()
+
+    async def aggregate_workload_logs(self, kind: str, name: str, namespace: str, tail_lines: int = 100,
+                                      include_previous: bool = True, graph: OwnerGraph = None,
+                                      pods: List[Any] = None) -> List[Dict[str, Any]]:
+        """Fetch logs of every container in every pod of a workload, merged by timestamp.
+
+        kind is a key of OWNER_GRAPH_KINDS. Pods are resolved through the owner
+        graph and fetched with at most max_concurrency requests in flight.
+        Callers that already have the namespace's owner graph or pods can pass
+        them in to save the LISTs. With
+        include_previous, containers that restarted also contribute the logs of
+        their previous instance. Each entry has timestamp, pod, container,
+        previous and line keys.
+        """
+        await self.initialize()
+
+        if not self.initialized or self.snapshot:
             return []
 
+        if kind == "pod":
+            pod_names = {name}
+        else:
+            if graph is None:
+                graph = await self.build_owner_graph(namespace)
+            pod_names = {ref[2] for ref in graph.descendants(OWNER_GRAPH_KINDS[kind], namespace, name, of_kind="Pod")}
+
+        if not pod_names:
+            return []
+
+        # (pod, container, previous) for every log to fetch
+        targets = []
+        if pods is None:
+            if len(pod_names) == 1:
+                try:
+                    pods = [await self._call(self.v1.read_namespaced_pod, name=next(iter(pod_names)), namespace=namespace,
+                                             _priority="interactive")]
+                except ApiException:
+                    return []
+            else:
+                pods = await self.get_pods(namespace)
+
+        for pod in pods:
+            if pod.metadata.name not in pod_names:
+                continue
+
+            restarted = {status.name for status in (pod.status.container_statuses or []) if status.restart_count}
+            for container in pod.spec.containers or []:
+                targets.append((pod.metadata.name, container.name, False))
+                if include_previous and container.name in restarted:
+                    targets.append((pod.metadata.name, container.name, True))
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(pod_name: str, container: str, previous: bool) -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    logs = await self._call(
+                        self.v1.read_namespaced_pod_log,
+                        name=pod_name,
+                        namespace=namespace,
+                        container=container,
+                        previous=previous,
+                        timestamps=True,
+                        tail_lines=tail_lines
+                    )
+                except ApiException:
+                    # Previous logs are gone once the container is replaced; skip what can't be read
+                    return []
+
+            entries = []
+            for line in (logs or "").splitlines():
+                timestamp, _, message = line.partition(" ")
+                entries.append({
+                    "timestamp": timestamp,
+                    "pod": pod_name,
+                    "container": container,
+                    "previous": previous,
+                    "line": message
+                })
+            return entries
+
+        results = await asyncio.gather(*[fetch(*target) for target in targets])
+
+        # Each container's log is already in time order, so a k-way merge is enough
+        return list(heapq.merge(*results, key=lambda entry: timestamp_sort_key(entry["timestamp"])))
+
+    async def get_events(self, namespace: str, field_selector: str = None, since: datetime.datetime = None,
+                         until: datetime.datetime = None, kind: str = None, name: str = None) -> ScanResult:
+        """Get events from the cluster, most recent first.
+
+        since and until restrict events to a time range, and kind and name to
+        one involved object. Time-range queries are answered from the event
+        archive when it is enabled, so they include events the API server has
+        already expired; field_selector is then evaluated locally against the
+        archived events. The result is marked partial if the events could
+        only be partly listed.
+        """
+        await self.initialize()
+
+        if (since or until) and self.event_archive:
+            archived = await self._call(self.event_archive.query, namespace, kind, name, since, until, _priority=None)
+            # The archive is indexed by object and time; other fields are selected here
+            return ScanResult(self._event_to_dict(event) for event in archived
+                              if not field_selector or match_field_selector(event, field_selector))
+
+        selectors = [field_selector] if field_selector else []
+        if kind:
+            selectors.append(f"involvedObject.kind={kind}")
+        if name:
+            selectors.append(f"involvedObject.name={name}")
+
+        errors = []
+        result = []
+        async for event in self.iter_events(namespace, ",".join(selectors) or None, errors=errors):
+            last_seen = event_last_seen(event)
+            if last_seen and ((since and last_seen < since) or (until and last_seen >= until)):
+                continue
+            result.append(event)
+
+        # The API server has no server-side ordering, so sort by when events last happened here
+        epoch = datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
+        result.sort(key=lambda event: event_last_seen(event) or epoch, reverse=True)
+        return ScanResult(result, partial=bool(errors), errors=errors)
+
+    async def iter_events(self, namespace: str, field_selector: str = None, page_size: int = None,
+                          errors: List[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream events from the cluster one LIST page at a time.
+
+        As with iter_pods, a failed LIST ends the stream early and the error
+        is appended to errors.
+        """
+        await self.initialize()
+
+        if not self.initialized:
+            return
+
+        # Field selectors are evaluated by the API server, so only unfiltered reads use the cache
+        if not field_selector or self.snapshot:
+            cached = await self._cached_list("event", namespace)
+            if cached is not None:
+                if isinstance(cached, ScanResult) and errors is not None:
+                    errors.extend(cached.errors)
+                for event in cached:
+                    if not field_selector or match_field_selector(event, field_selector):
+                        yield self._event_to_dict(event)
+                return
+
+        async for event in self._iter_list(
+            self.v1.list_namespaced_event,
+            self.v1.list_event_for_all_namespaces,
+            namespace,
+            page_size,
+            "events",
+            errors,
+            field_selector=field_selector
+        ):
+            yield self._event_to_dict(event)
+
+    def _event_to_dict(self, event) -> Dict[str, Any]:
+        """Convert an event to a dict for easier handling."""
+        return {
+            "type": event.type,
+            "reason": event.reason,
+            "message": event.message,
+            "count": event.count,
+            "firstTimestamp": event.first_timestamp,
+            "lastTimestamp": event.last_timestamp,
+            "eventTime": event.event_time,
+            "series": {
+                "count": event.series.count,
+                "lastObservedTime": event.series.last_observed_time
+            } if event.series else None,
+            "involvedObject": {
+                "kind": event.involved_object.kind,
+                "name": event.involved_object.name,
+                "namespace": event.involved_object.namespace
+            }
+        }
+
     async def describe_resource(self, resource_type: str, name: str, namespace: str) -> Dict[str, Any]:
-        """Describe a Kubernetes resource."""
+        """Describe a Kubernetes resource.
+
+        Kinds without a typed client, including custom resources, are found
+        through API discovery and returned as their JSON.
+
+        Results are cached (config keys describe_cache_ttl, describe_cache_max_entries
+        and describe_cache_max_bytes). Within the TTL a cached result is returned
+        as is; after it, a metadata-only GET checks whether the resourceVersion
+        changed before the object is read again.
+        """
         await self.initialize()
 
         if not self.initialized:
             return {"error": "Kubernetes client not initialized"}
 
-        try:
-            if resource_type == "pod":
-                resource = self.v1.read_namespaced_pod(name=name, namespace=namespace)
-            elif resource_type == "deployment":
-                resource = self.apps_v1.read_namespaced_deployment(name=name, namespace=namespace)
-            elif resource_type == "service":
-                resource = self.v1.read_namespaced_service(name=name, namespace=namespace)
-            elif resource_type == "configmap":
-                resource = self.v1.read_namespaced_config_map(name=name, namespace=namespace)
-            elif resource_type == "secret":
-                resource = self.v1.read_namespaced_secret(name=name, namespace=namespace)
-            elif resource_type == "ingress":
-                networking_v1 = client.NetworkingV1Api()
-                resource = networking_v1.read_namespaced_ingress(name=name, namespace=namespace)
-            else:
+        if self.snapshot:
+            resource = self.snapshot.get(resource_type, namespace, name) if resource_type in self.snapshot.kinds else None
+            if resource is None:
+                return {"error": f"{resource_type.capitalize()} {name} not found in namespace {namespace} of the snapshot"}
+            return resource.to_dict()
+
+        read_funcs = {
+            "pod": self.v1.read_namespaced_pod,
+            "deployment": self.apps_v1.read_namespaced_deployment,
+            "service": self.v1.read_namespaced_service,
+            "configmap": self.v1.read_namespaced_config_map,
+            "secret": self.v1.read_namespaced_secret,
+            "ingress": self.networking_v1.read_namespaced_ingress
+        }
+        if resource_type not in read_funcs:
+            # Any other kind, including custom resources, is read by path as raw JSON
+            if not await self.resolve_resource(resource_type):
                 return {"error": f"Unsupported resource type: {resource_type}"}
 
+            path = self._resource_path(resource_type, namespace)
+
+            def read_object(name, namespace):
+                return ObjectView(self._get_json(f"{path}/{name}"))
+
+            # Named after the resource, so every kind gets its own circuit breaker
+            read_object.__name__ = _path_endpoint(path, "get")
+            read_funcs[resource_type] = read_object
+
+        key = (resource_type, namespace, name)
+        cached, resource_version, fresh = self.describe_cache.get(key)
+
+        try:
+            if cached is not None:
+                if fresh:
+                    self.describe_cache.stats["hits"] += 1
+                    return cached
+
+                path = f"{self._resource_path(resource_type, namespace)}/{name}"
+                metadata = await self._call(self._get_json, path, None, OBJECT_METADATA_ACCEPT, _priority="interactive")
+                if (metadata.get("metadata") or {}).get("resourceVersion") == resource_version:
+                    self.describe_cache.touch(key)
+                    self.describe_cache.stats["revalidated"] += 1
+                    return cached
+
+            self.describe_cache.stats["misses"] += 1
+            resource = await self._call(read_funcs[resource_type], name=name, namespace=namespace, _priority="interactive")
+
             # Convert to dict for easier handling
-            return self._convert_k8s_obj_to_dict(resource)
+            result = self._convert_k8s_obj_to_dict(resource)
+            self.describe_cache.put(key, result, resource.metadata.resource_version)
+            return result
         except ApiException as e:
             if e.status == 404:
+                self.describe_cache.invalidate(key)
                 return {"error": f"{resource_type.capitalize()} {name} not found in namespace {namespace}"}
             else:
                 return {"error": f"Error describing {resource_type}: {e}"}
@@ -254,115 +1339,235 @@ class K8sScanner:
         else:
             return obj
 
-    async def analyze_resources(self, namespace: str) -> List[Dict[str, Any]]:
-        """Analyze resources in a namespace for issues."""
+    async def analyze_resources(self, namespace: str) -> ScanResult:
+        """Analyze resources in a namespace for issues.
+
+        The issues are marked partial or stale when some of the resources
+        could not be listed, so an API outage isn't reported as no issues.
+        """
         await self.initialize()
 
         if not self.initialized:
-            return []
+            return ScanResult(partial=True, errors=["Kubernetes client not initialized"])
+
+        issues = ScanResult()
+        pod_errors = []
+
+        # Streamed pods are added to the owner graph and label index; ReplicaSets and Jobs link them to their workloads
+        graph = OwnerGraph()
+        label_index = LabelIndex()
+
+        # Per-object results of the previous scan, keyed by uid; objects whose resourceVersion
+        # is unchanged reuse them instead of being re-checked
+        previous = self._analysis_cache.get(namespace, {})
+        current = {}
+        self.analysis_stats = {"evaluated": 0, "reused": 0}
+
+        # Issue every LIST concurrently, then join the results in memory; pods are streamed page by page
+        pod_issues, deployments, services, ready_endpoints, _, budgets, policies = await asyncio.gather(
+            self._analyze_pods(namespace, graph, label_index, previous, current, pod_errors),
+            self._list_namespaced("deployment", namespace),
+            self._list_namespaced("service", namespace),
+            self._get_ready_endpoints(namespace),
+            self.build_owner_graph(namespace, ["replicaset", "job"], graph),
+            self.list_objects("poddisruptionbudget", namespace),
+            self.list_objects("networkpolicy", namespace)
+        )
+        coverage = self._selector_coverage(label_index, services or [], budgets, policies)
+
+        issues.merge_status(deployments, services, ready_endpoints, budgets, policies)
+        if pod_errors:
+            issues.partial = True
+            issues.errors.extend(pod_errors)
+
+        # Roll pod issues up to the workload that manages the pod, in the pod's own namespace for cluster-wide scans
+        for issue in pod_issues:
+            kind, _, name = graph.root_controller("Pod", issue["namespace"], issue["name"])
+            if kind != "Pod":
+                issue["workload"] = f"{kind.lower()}/{name}"
+        issues.extend(pod_issues)
+
+        # Check for deployment issues
+        for deployment in deployments:
+            issues.extend(self._check_cached(deployment, self._check_deployment, previous, current))
 
+        # Deleted objects drop out of the cache because only this scan's results are kept
+        self._analysis_cache[namespace] = current
+
+        # Selector checks would count pods that failed to list as matching nothing
+        selectors_checked = not pod_errors
+
+        if selectors_checked and not ready_endpoints.partial:
+            # Check for services without endpoints; services without a selector manage their own endpoints
+            ready = dict(ready_endpoints)
+            for service in services:
+                issues.extend(self.rules.evaluate("service", service, {
+                    "ready_endpoints": ready.get((service.metadata.namespace, service.metadata.name), 0),
+                    "matched_pods": coverage["service"].get(_qualified_name(service), 0)
+                }))
+
+        # Check for disruption budgets and network policies that select nothing
+        for kind, objects in (("poddisruptionbudget", budgets), ("networkpolicy", policies)):
+            for obj in objects if selectors_checked else []:
+                issues.extend(self.rules.evaluate(kind, obj, {
+                    "matched_pods": coverage[kind].get(_qualified_name(obj), 0)
+                }))
+
+        return issues
+
+    async def selector_coverage(self, namespace: str) -> Dict[str, Any]:
+        """Count the pods matched by every Service, PodDisruptionBudget and NetworkPolicy selector.
+
+        Selectors are evaluated against a label index of the streamed pods, so
+        no per-selector API calls are made.
+        """
+        label_index = LabelIndex()
+
+        async def index_pods():
+            async for pod in self.iter_pods(namespace):
+                label_index.add(pod)
+
+        _, services, budgets, policies = await asyncio.gather(
+            index_pods(),
+            self._list_namespaced("service", namespace),
+            self.list_objects("poddisruptionbudget", namespace),
+            self.list_objects("networkpolicy", namespace)
+        )
+        return self._selector_coverage(label_index, services or [], budgets, policies)
+
+    def _selector_coverage(self, label_index: LabelIndex, services: List[Any], budgets: List[Any],
+                           policies: List[Any]) -> Dict[str, Any]:
+        """Match selectors against a label index, keyed by kind and namespace/name."""
+        coverage = {"service": {}, "poddisruptionbudget": {}, "networkpolicy": {}}
+
+        for service in services:
+            if service.spec.selector:
+                selector = compile_selector(service.spec.selector)
+                coverage["service"][_qualified_name(service)] = selector.count(label_index, service.metadata.namespace)
+
+        for budget in budgets:
+            selector = compile_selector(budget.spec.selector)
+            coverage["poddisruptionbudget"][_qualified_name(budget)] = selector.count(label_index, budget.metadata.namespace)
+
+        # Pods selected by at least one policy are isolated; the rest accept all traffic
+        isolated = 0
+        for policy in policies:
+            bits = compile_selector(policy.spec.pod_selector).match(label_index, policy.metadata.namespace)
+            coverage["networkpolicy"][_qualified_name(policy)] = bin(bits).count("1")
+            isolated |= bits
+
+        coverage["pods_without_network_policy"] = bin(label_index.all_bits() & ~isolated).count("1")
+        return coverage
+
+    async def _analyze_pods(self, namespace: str, graph: OwnerGraph, label_index: LabelIndex,
+                            previous: Dict[str, Any], current: Dict[str, Any],
+                            errors: List[str] = None) -> List[Dict[str, Any]]:
+        """Check streamed pods for issues without holding the full pod list."""
         issues = []
+        async for pod in self.iter_pods(namespace, errors=errors):
+            graph.add("Pod", pod)
+            label_index.add(pod)
+            issues.extend(self._check_cached(pod, self._check_pod, previous, current))
+        return issues
 
-        # Get pods
-        pods = await self.get_pods(namespace)
+    def _check_cached(self, obj, check, previous: Dict[str, Any], current: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run a single-object check, reusing the previous result if the object is unchanged."""
+        uid = obj.metadata.uid
+        resource_version = obj.metadata.resource_version
 
-        # Check for pod issues
-        for pod in pods:
-            # Check for crash loop backoff
-            if pod.status.phase != "Running":
-                if pod.status.container_statuses:
-                    for container in pod.status.container_statuses:
-                        if container.state.waiting and container.state.waiting.reason == "CrashLoopBackOff":
-                            issues.append({
-                                "resource_type": "pod",
-                                "name": pod.metadata.name,
-                                "severity": "high",
-                                "issue": "Pod is in CrashLoopBackOff state",
-                                "details": f"Container {container.name} is crashing repeatedly. Check logs for more information."
-                            })
-                        elif container.state.waiting and container.state.waiting.reason == "ImagePullBackOff":
-                            issues.append({
-                                "resource_type": "pod",
-                                "name": pod.metadata.name,
-                                "severity": "high",
-                                "issue": "Pod is in ImagePullBackOff state",
-                                "details": f"Container {container.name} image cannot be pulled. Check image name and registry access."
-                            })
-
-            # Check for high restart count
-            if pod.status.container_statuses:
-                for container in pod.status.container_statuses:
-                    if container.restart_count > 10:
-                        issues.append({
-                            "resource_type": "pod",
-                            "name": pod.metadata.name,
-                            "severity": "medium",
-                            "issue": "Container has high restart count",
-                            "details": f"Container {container.name} has restarted {container.restart_count} times. Check logs for more information."
-                        })
-
-            # Check for missing resource limits
-            if pod.spec.containers:
-                for container in pod.spec.containers:
-                    if not container.resources or not container.resources.limits:
-                        issues.append({
-                            "resource_type": "pod",
-                            "name": pod.metadata.name,
-                            "severity": "low",
-                            "issue": "Container missing resource limits",
-                            "details": f"Container {container.name} does not have resource limits set. This can lead to resource contention."
-                        })
-
-        # Get deployments
-        try:
-            deployments = self.apps_v1.list_namespaced_deployment(namespace=namespace)
-
-            # Check for deployment issues
-            for deployment in deployments.items:
-                # Check for unavailable replicas
-                if deployment.status.unavailable_replicas:
-                    issues.append({
-                        "resource_type": "deployment",
-                        "name": deployment.metadata.name,
-                        "severity": "medium",
-                        "issue": "Deployment has unavailable replicas",
-                        "details": f"Deployment has {deployment.status.unavailable_replicas} unavailable replicas out of {deployment.spec.replicas} desired."
-                    })
+        entry = previous.get(uid)
+        if uid is None or entry is None or entry[0] != resource_version:
+            entry = (resource_version, check(obj))
+            self.analysis_stats["evaluated"] += 1
+        else:
+            self.analysis_stats["reused"] += 1
 
-                # Check for missing pod anti-affinity
-                if not deployment.spec.template.spec.affinity or not deployment.spec.template.spec.affinity.pod_anti_affinity:
-                    issues.append({
-                        "resource_type": "deployment",
-                        "name": deployment.metadata.name,
-                        "severity": "low",
-                        "issue": "Deployment missing pod anti-affinity",
-                        "details": "Pod anti-affinity is not configured. This can lead to all pods running on the same node."
-                    })
+        if uid is not None:
+            current[uid] = entry
 
+        # Callers annotate issues, so hand out copies
+        return [dict(issue) for issue in entry[1]]
+
+    def _check_deployment(self, deployment) -> List[Dict[str, Any]]:
+        """Check a single deployment for issues."""
+        return self.rules.evaluate("deployment", deployment)
+
+    def _check_pod(self, pod) -> List[Dict[str, Any]]:
+        """Check a single pod for issues."""
+        return self.rules.evaluate("pod", pod)
+
+    async def _list_namespaced(self, kind: str, namespace: str) -> List[Any]:
+        """List deployments or services in a namespace, marked stale or partial on error."""
+        cached = await self._cached_list(kind, namespace)
+        if cached is not None:
+            return cached
+
+        if kind == "deployment":
+            namespaced_func, cluster_func = self.apps_v1.list_namespaced_deployment, self.apps_v1.list_deployment_for_all_namespaces
+        else:
+            namespaced_func, cluster_func = self.v1.list_namespaced_service, self.v1.list_service_for_all_namespaces
+
+        try:
+            items, _ = await self._list_in(namespaced_func, cluster_func, namespace)
+            return self._remember((kind, namespace), items)
         except ApiException as e:
-            console.print(f"[red]Error analyzing deployments: {e}[/red]")
+            return self._degraded((kind, namespace), f"{kind}s", e)
+
+    async def _list_in(self, namespaced_func, cluster_func, namespace: str) -> Tuple[List[Any], Optional[str]]:
+        """LIST in a namespace, or across the cluster when namespace is empty or "all"."""
+        if namespace and namespace != "all":
+            return await self._list(namespaced_func, namespace=namespace)
+        return await self._list(cluster_func)
+
+    async def _get_ready_endpoints(self, namespace: str) -> ScanResult:
+        """Count ready endpoint addresses per service with a single LIST.
+
+        Returns ((namespace, service name), count) pairs, marked stale or
+        partial on error like the other lists.
+        """
+        key = ("endpoints", namespace)
+        ready = {}
 
-        # Get services
         try:
-            services = self.v1.list_namespaced_service(namespace=namespace)
+            slices = await self._cached_list("endpointslice", namespace)
+            if isinstance(slices, ScanResult) and slices.partial:
+                return ScanResult(partial=True, errors=slices.errors)
+            if slices is None:
+                slices, _ = await self._list_in(self.discovery_v1.list_namespaced_endpoint_slice,
+                                                self.discovery_v1.list_endpoint_slice_for_all_namespaces, namespace)
 
-            # Check for service issues
-            for service in services.items:
-                # Check for services without endpoints
-                try:
-                    endpoints = self.v1.read_namespaced_endpoints(name=service.metadata.name, namespace=namespace)
-                    if not endpoints.subsets or not any(subset.addresses for subset in endpoints.subsets):
-                        issues.append({
-                            "resource_type": "service",
-                            "name": service.metadata.name,
-                            "severity": "medium",
-                            "issue": "Service has no endpoints",
-                            "details": "Service selector does not match any pods. Check pod labels and service selector."
-                        })
-                except ApiException:
-                    pass
+            for endpoint_slice in slices:
+                labels = endpoint_slice.metadata.labels or {}
+                service_name = labels.get("kubernetes.io/service-name")
+                if not service_name:
+                    continue
 
+                count = 0
+                for endpoint in endpoint_slice.endpoints or []:
+                    # A missing ready condition means ready
+                    if not endpoint.conditions or endpoint.conditions.ready is not False:
+                        count += len(endpoint.addresses or [])
+                service_key = (endpoint_slice.metadata.namespace, service_name)
+                ready[service_key] = ready.get(service_key, 0) + count
+
+            return ScanResult(self._remember(key, list(ready.items())))
         except ApiException as e:
-            console.print(f"[red]Error analyzing services: {e}[/red]")
+            if e.status != 404:
+                return self._degraded(key, "endpoints", e)
 
-        return issues
\ No newline at end of file
+        # Clusters without discovery.k8s.io/v1 only have core Endpoints
+        try:
+            endpoints_list = await self._cached_list("endpoints", namespace)
+            if endpoints_list is None:
+                endpoints_list, _ = await self._list_in(self.v1.list_namespaced_endpoints,
+                                                        self.v1.list_endpoints_for_all_namespaces, namespace)
+
+            if isinstance(endpoints_list, ScanResult) and endpoints_list.partial:
+                return ScanResult(partial=True, errors=endpoints_list.errors)
+
+            for endpoints in endpoints_list:
+                ready[(endpoints.metadata.namespace, endpoints.metadata.name)] = sum(len(subset.addresses or []) for subset in endpoints.subsets or [])
+
+            return ScanResult(self._remember(key, list(ready.items())))
+        except ApiException as e:
+            return self._degraded(key, "endpoints", e)
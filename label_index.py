@@ -0,0 +1,161 @@
+"""Inverted label index and compiled label selectors for Groot CLI."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from groot.utils.k8s_objects import get_field
+
+def _to_bitset(ids: List[int], size: int) -> int:
+    """Pack object ids into an int bitset in O(n)."""
+    bitmap = bytearray((size + 7) // 8)
+    for i in ids:
+        bitmap[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bitmap, "little")
+
+def _bit_ids(bits: int) -> List[int]:
+    """Unpack an int bitset into sorted object ids."""
+    ids = []
+    bitmap = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for byte_index, byte in enumerate(bitmap):
+        while byte:
+            low = byte & -byte
+            ids.append((byte_index << 3) + low.bit_length() - 1)
+            byte ^= low
+    return ids
+
+class LabelIndex:
+    """Inverted index from label key and value to a bitset of object ids.
+
+    Object ids are insertion positions. Bitsets are Python ints built lazily
+    on first query, so matching a selector is a handful of big-int AND/OR
+    operations instead of a scan over every object's labels.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.refs: List[Tuple[Optional[str], str]] = []
+        self._value_ids: Dict[str, Dict[str, List[int]]] = {}
+        self._key_ids: Dict[str, List[int]] = {}
+        self._namespace_ids: Dict[Optional[str], List[int]] = {}
+        self._bitsets: Dict[Tuple, int] = {}
+
+    def add(self, obj: Any) -> int:
+        """Index an object's labels (kubernetes model or ObjectView) and return its id."""
+        metadata = obj.metadata
+        object_id = len(self.refs)
+        self.refs.append((metadata.namespace, metadata.name))
+        self._namespace_ids.setdefault(metadata.namespace, []).append(object_id)
+
+        for key, value in (metadata.labels or {}).items():
+            self._value_ids.setdefault(key, {}).setdefault(value, []).append(object_id)
+            self._key_ids.setdefault(key, []).append(object_id)
+
+        # Cached bitsets no longer cover every id
+        self._bitsets = {}
+        return object_id
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def _bits(self, cache_key: Tuple, ids: Optional[List[int]]) -> int:
+        """Get (and cache) the bitset for a posting list."""
+        bits = self._bitsets.get(cache_key)
+        if bits is None:
+            bits = _to_bitset(ids, len(self.refs)) if ids else 0
+            self._bitsets[cache_key] = bits
+        return bits
+
+    def all_bits(self, namespace: str = None) -> int:
+        """Bitset of every object, or of every object in a namespace."""
+        if namespace and namespace != "all":
+            return self._bits(("ns", namespace), self._namespace_ids.get(namespace))
+        return (1 << len(self.refs)) - 1
+
+    def value_bits(self, key: str, value: str) -> int:
+        """Bitset of objects with label key=value."""
+        return self._bits(("kv", key, value), self._value_ids.get(key, {}).get(value))
+
+    def key_bits(self, key: str) -> int:
+        """Bitset of objects that have label key."""
+        return self._bits(("k", key), self._key_ids.get(key))
+
+    def refs_for(self, bits: int) -> List[Tuple[Optional[str], str]]:
+        """Resolve a bitset to (namespace, name) pairs."""
+        return [self.refs[i] for i in _bit_ids(bits)]
+
+class CompiledSelector:
+    """A label selector compiled into set operations over a LabelIndex."""
+
+    def __init__(self, terms: List[Tuple[str, str, List[str]]], match_none: bool = False):
+        """Initialize from normalized (key, operator, values) terms; match_none selects nothing."""
+        self.match_none = match_none
+        # Equality and In terms narrow the result fastest, so evaluate them first
+        order = {"In": 0, "Exists": 1, "NotIn": 2, "DoesNotExist": 3}
+        self.terms = sorted(terms, key=lambda term: order.get(term[1], 4))
+
+    def match(self, index: LabelIndex, namespace: str = None) -> int:
+        """Bitset of indexed objects selected in a namespace (or cluster-wide)."""
+        if self.match_none:
+            return 0
+
+        universe = index.all_bits(namespace)
+        result = universe
+
+        for key, operator, values in self.terms:
+            if not result:
+                break
+
+            if operator == "In":
+                bits = 0
+                for value in values:
+                    bits |= index.value_bits(key, value)
+                result &= bits
+            elif operator == "NotIn":
+                # Objects without the key also satisfy NotIn
+                for value in values:
+                    result &= ~index.value_bits(key, value)
+            elif operator == "Exists":
+                result &= index.key_bits(key)
+            elif operator == "DoesNotExist":
+                result &= ~index.key_bits(key)
+            else:
+                return 0
+
+        return result & universe
+
+    def count(self, index: LabelIndex, namespace: str = None) -> int:
+        """Number of indexed objects selected."""
+        return bin(self.match(index, namespace)).count("1")
+
+    def select(self, index: LabelIndex, namespace: str = None) -> List[Tuple[Optional[str], str]]:
+        """(namespace, name) pairs of the selected objects."""
+        return index.refs_for(self.match(index, namespace))
+
+def compile_selector(selector: Any) -> CompiledSelector:
+    """Compile a selector into a CompiledSelector.
+
+    Accepts a plain label map (Service spec.selector) or a LabelSelector with
+    matchLabels/matchExpressions, as a kubernetes model, ObjectView or dict.
+    An empty LabelSelector selects everything, a null one (None) nothing.
+    """
+    terms = []
+    if selector is None:
+        return CompiledSelector(terms, match_none=True)
+
+    match_labels = get_field(selector, "match_labels")
+    match_expressions = get_field(selector, "match_expressions")
+
+    if match_labels is None and match_expressions is None:
+        # A plain key/value map, unless it is an empty LabelSelector model
+        match_labels = selector if isinstance(selector, dict) else {}
+
+    for key, value in (match_labels or {}).items():
+        terms.append((key, "In", [value]))
+
+    for expression in match_expressions or []:
+        terms.append((
+            get_field(expression, "key"),
+            get_field(expression, "operator"),
+            list(get_field(expression, "values") or [])
+        ))
+
+    return CompiledSelector(terms)
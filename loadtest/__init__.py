@@ -0,0 +1,9 @@
+"""
+Load testing tools for Groot CLI.
+
+generator builds synthetic clusters of any size with injected failures, and
+server serves one through a local stand-in for the Kubernetes API, so the
+scanner can be run against thousands of pods on one machine:
+
+    python -m groot.loadtest --pods 50000
+"""
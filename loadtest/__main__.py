@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Serve a synthetic cluster on localhost and write a kubeconfig for it.
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+
+from groot.loadtest.generator import SyntheticCluster
+from groot.loadtest.server import FakeApiServer
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic Kubernetes cluster for load tests")
+    parser.add_argument("--pods", type=int, default=10000, help="Number of pods")
+    parser.add_argument("--namespaces", type=int, help="Number of namespaces (default: one per 250 pods)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed; the same seed gives the same cluster")
+    parser.add_argument("--port", type=int, default=0, help="Port to listen on (default: any free port)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument("--churn", type=float, default=1.0, help="Pod changes per second sent to watches")
+    parser.add_argument("--kubeconfig", default=os.path.join(tempfile.gettempdir(), "groot-loadtest.kubeconfig"),
+                        help="Where to write the kubeconfig")
+    args = parser.parse_args()
+
+    cluster = SyntheticCluster(args.pods, args.namespaces, args.seed)
+    server = FakeApiServer(cluster, port=args.port, latency=args.latency, error_rate=args.error_rate, churn=args.churn)
+    path = server.kubeconfig(args.kubeconfig)
+
+    print(f"Serving {', '.join(f'{kind}: {count}' for kind, count in cluster.counts().items())}")
+    print(f"Injected failures: {', '.join(f'{mode}: {count}' for mode, count in cluster.failures.items())}")
+    print(f"API server: {server.url}")
+    print(f"Point Groot at it with: GROOT_KUBECONFIG={path} groot")
+
+    with server:
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,447 @@
+"""Synthetic Kubernetes clusters for load testing Groot CLI.
+
+Builds the JSON of a cluster of any size with the shape of a real one: a few
+large namespaces and a long tail of small ones, deployments with skewed
+replica counts owning pods through ReplicaSets, StatefulSets and Jobs,
+services with endpoint slices, events, PodDisruptionBudgets and
+NetworkPolicies. Failure modes are injected at configurable rates.
+Generation is seeded, so the same arguments always give the same cluster.
+"""
+
+import datetime
+import hashlib
+import random
+from typing import Any, Dict, Iterator, List, Optional
+
+from groot.snapshot import SNAPSHOT_KINDS, SnapshotWriter
+
+# Failure modes and the share of pods (or services) they affect
+DEFAULT_FAILURE_RATES = {
+    "crashloop": 0.02,
+    "image_pull": 0.01,
+    "pending": 0.01,
+    "service_without_endpoints": 0.03
+}
+
+# Replica counts of deployments and how common they are
+_REPLICA_WEIGHTS = ((1, 30), (2, 25), (3, 25), (5, 10), (10, 7), (25, 3))
+
+_TEAMS = ("payments", "checkout", "search", "identity", "catalog", "billing", "shipping", "analytics",
+          "platform", "notifications", "recommendations", "inventory", "reviews", "media", "gateway")
+_COMPONENTS = ("api", "worker", "frontend", "consumer", "scheduler", "cache", "proxy", "sync", "indexer", "auth")
+_TIERS = ("frontend", "backend", "worker")
+
+_LOG_LINES = (
+    'INFO request handled method=GET path=/api/v1/items status=200 latency_ms={latency}',
+    'INFO request handled method=POST path=/api/v1/orders status=201 latency_ms={latency}',
+    'DEBUG cache hit key=item:{number}',
+    'INFO processed batch size={number} duration_ms={latency}',
+    'WARN slow query table=orders duration_ms={latency}'
+)
+_CRASH_LOG_LINES = (
+    'ERROR failed to connect to database host=db-{number}.internal:5432: connection refused',
+    'ERROR unhandled exception in main loop: KeyError: \'config\'',
+    'FATAL shutting down after {number} failed health checks'
+)
+
+def _timestamp(value: datetime.datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+def _uid(*parts: Any) -> str:
+    """A stable UUID-shaped uid."""
+    digest = hashlib.md5("/".join(str(part) for part in parts).encode()).hexdigest()
+    return f"{digest[:8]}-{digest[8:12]}-{digest[12:16]}-{digest[16:20]}-{digest[20:32]}"
+
+def _hash(*parts: Any) -> str:
+    """A pod-template-hash style suffix."""
+    return hashlib.md5("/".join(str(part) for part in parts).encode()).hexdigest()[:10]
+
+class SyntheticCluster:
+    """A generated cluster, as lists of object JSON per kind."""
+
+    def __init__(self, pods: int = 10000, namespaces: int = None, seed: int = 0,
+                 failure_rates: Dict[str, float] = None, now: datetime.datetime = None):
+        """Generate a cluster of about the given number of pods.
+
+        namespaces defaults to one per 250 pods. failure_rates overrides
+        entries of DEFAULT_FAILURE_RATES. now is the reference time for
+        creation and event timestamps.
+        """
+        self.seed = seed
+        self.failure_rates = dict(DEFAULT_FAILURE_RATES, **(failure_rates or {}))
+        self.now = now or datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+        self.objects: Dict[str, List[Dict[str, Any]]] = {
+            kind: [] for kind in ("namespace", "node", "pod", "deployment", "replicaset", "statefulset", "job",
+                                  "service", "endpointslice", "event", "poddisruptionbudget", "networkpolicy")
+        }
+        self.failures: Dict[str, int] = {mode: 0 for mode in self.failure_rates}
+
+        self._random = random.Random(seed)
+        self._resource_version = 1000
+        self._ip = 0
+
+        self._generate(pods, namespaces or max(1, pods // 250))
+
+    def _next_resource_version(self) -> str:
+        self._resource_version += 1
+        return str(self._resource_version)
+
+    def _next_ip(self) -> str:
+        self._ip += 1
+        return f"10.{(self._ip >> 16) & 255}.{(self._ip >> 8) & 255}.{self._ip & 255}"
+
+    def _metadata(self, name: str, namespace: Optional[str], age: datetime.timedelta,
+                  labels: Dict[str, str] = None, owner: Dict[str, Any] = None) -> Dict[str, Any]:
+        metadata = {
+            "name": name,
+            "uid": _uid(namespace, name),
+            "resourceVersion": self._next_resource_version(),
+            "creationTimestamp": _timestamp(self.now - age)
+        }
+        if namespace:
+            metadata["namespace"] = namespace
+        if labels:
+            metadata["labels"] = labels
+        if owner:
+            metadata["ownerReferences"] = [dict(owner, controller=True, blockOwnerDeletion=True)]
+        return metadata
+
+    def _age(self, max_days: int = 90) -> datetime.timedelta:
+        return datetime.timedelta(seconds=self._random.randint(60, max_days * 86400))
+
+    def _generate(self, pod_target: int, namespace_count: int):
+        """Build every object."""
+        rng = self._random
+
+        namespaces = [f"{_TEAMS[i % len(_TEAMS)]}-{i // len(_TEAMS)}" if i >= len(_TEAMS) else _TEAMS[i]
+                      for i in range(namespace_count)]
+        for namespace in namespaces:
+            self.objects["namespace"].append({
+                "metadata": self._metadata(namespace, None, self._age(365), {"kubernetes.io/metadata.name": namespace}),
+                "spec": {"finalizers": ["kubernetes"]},
+                "status": {"phase": "Active"}
+            })
+
+        nodes = [f"node-{i:04d}" for i in range(max(3, pod_target // 30))]
+        for node in nodes:
+            self.objects["node"].append({
+                "metadata": self._metadata(node, None, self._age(180), {
+                    "kubernetes.io/hostname": node,
+                    "topology.kubernetes.io/zone": f"zone-{ord(node[-1]) % 3}"
+                }),
+                "spec": {"podCIDR": "10.244.0.0/24"},
+                "status": {
+                    "capacity": {"cpu": "16", "memory": "64Gi", "pods": "110"},
+                    "allocatable": {"cpu": "15800m", "memory": "62Gi", "pods": "110"},
+                    "conditions": [{"type": "Ready", "status": "True", "reason": "KubeletReady",
+                                    "lastHeartbeatTime": _timestamp(self.now), "lastTransitionTime": _timestamp(self.now)}],
+                    "nodeInfo": {"kubeletVersion": "v1.29.4", "osImage": "Ubuntu 22.04.4 LTS", "architecture": "amd64"}
+                }
+            })
+
+        # A few big namespaces and a long tail, as in most clusters
+        weights = [1 / (rank + 1) ** 0.8 for rank in range(len(namespaces))]
+        replicas_choices = [count for count, _ in _REPLICA_WEIGHTS]
+        replicas_weights = [weight for _, weight in _REPLICA_WEIGHTS]
+
+        pods = 0
+        workload = 0
+        while pods < pod_target:
+            namespace = rng.choices(namespaces, weights)[0]
+            name = f"{rng.choice(_COMPONENTS)}-{workload}"
+            replicas = min(rng.choices(replicas_choices, replicas_weights)[0], pod_target - pods)
+            roll = rng.random()
+
+            if roll < 0.05:
+                self._add_job(namespace, name, nodes)
+                pods += 1
+            elif roll < 0.10:
+                self._add_workload("statefulset", namespace, name, replicas, nodes)
+                pods += replicas
+            else:
+                self._add_workload("deployment", namespace, name, replicas, nodes)
+                pods += replicas
+            workload += 1
+
+        # Sorted by namespace and name, as the API server lists them
+        for items in self.objects.values():
+            items.sort(key=lambda item: (item["metadata"].get("namespace", ""), item["metadata"]["name"]))
+
+    def _pod_template(self, labels: Dict[str, str], image: str, limits: bool) -> Dict[str, Any]:
+        return {
+            "metadata": {"labels": labels},
+            "spec": {
+                "containers": [{
+                    "name": "main",
+                    "image": image,
+                    "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                    "resources": {"limits": {"cpu": "500m", "memory": "256Mi"},
+                                  "requests": {"cpu": "100m", "memory": "128Mi"}} if limits else {},
+                    "readinessProbe": {"httpGet": {"path": "/healthz", "port": 8080}}
+                }],
+                "restartPolicy": "Always"
+            }
+        }
+
+    def _add_workload(self, kind: str, namespace: str, name: str, replicas: int, nodes: List[str]):
+        """Add a deployment (with its ReplicaSet) or a StatefulSet, its pods, service and extras."""
+        rng = self._random
+        age = self._age()
+        tier = rng.choice(_TIERS)
+        labels = {"app": name, "app.kubernetes.io/name": name, "tier": tier}
+        image = f"registry.example.com/{namespace}/{name}:1.{rng.randint(0, 40)}.{rng.randint(0, 9)}"
+        template = self._pod_template(labels, image, rng.random() < 0.7)
+        api_kind = "Deployment" if kind == "deployment" else "StatefulSet"
+
+        workload = {
+            "metadata": self._metadata(name, namespace, age, labels),
+            "spec": {"replicas": replicas, "selector": {"matchLabels": dict(labels)}, "template": template},
+            "status": {}
+        }
+        if kind == "statefulset":
+            workload["spec"]["serviceName"] = name
+        self.objects[kind].append(workload)
+
+        owner = {"apiVersion": "apps/v1", "kind": api_kind, "name": name, "uid": workload["metadata"]["uid"]}
+        if kind == "deployment":
+            template_hash = _hash(namespace, name, image)
+            replicaset_name = f"{name}-{template_hash}"
+            replicaset_labels = dict(labels, **{"pod-template-hash": template_hash})
+            replicaset = {
+                "metadata": self._metadata(replicaset_name, namespace, age, replicaset_labels, owner),
+                "spec": {"replicas": replicas, "selector": {"matchLabels": dict(replicaset_labels)},
+                         "template": dict(template, metadata={"labels": replicaset_labels})},
+                "status": {"replicas": replicas}
+            }
+            self.objects["replicaset"].append(replicaset)
+            owner = {"apiVersion": "apps/v1", "kind": "ReplicaSet", "name": replicaset_name,
+                     "uid": replicaset["metadata"]["uid"]}
+            pod_labels = replicaset_labels
+        else:
+            pod_labels = labels
+
+        ready_ips = []
+        for index in range(replicas):
+            if kind == "deployment":
+                pod_name = f"{owner['name']}-{_hash(owner['name'], index)[:5]}"
+            else:
+                pod_name = f"{name}-{index}"
+            pod = self._pod(namespace, pod_name, pod_labels, owner, template, nodes, age)
+            if pod["status"].get("podIP") and all(c["ready"] for c in pod["status"].get("containerStatuses") or [{"ready": False}]):
+                ready_ips.append((pod_name, pod["status"]["podIP"], pod["spec"].get("nodeName")))
+
+        available = len(ready_ips)
+        workload["status"] = {"replicas": replicas, "readyReplicas": available, "availableReplicas": available,
+                              "observedGeneration": 1}
+        if kind == "deployment":
+            workload["status"]["updatedReplicas"] = replicas
+            if available < replicas:
+                workload["status"]["unavailableReplicas"] = replicas - available
+            self.objects["replicaset"][-1]["status"].update(readyReplicas=available, availableReplicas=available)
+
+        if tier != "worker":
+            self._add_service(namespace, name, labels, ready_ips)
+
+        if replicas >= 3 and rng.random() < 0.3:
+            self.objects["poddisruptionbudget"].append({
+                "metadata": self._metadata(name, namespace, age),
+                "spec": {"minAvailable": 1, "selector": {"matchLabels": {"app": name}}},
+                "status": {"currentHealthy": available, "desiredHealthy": 1, "expectedPods": replicas,
+                           "disruptionsAllowed": max(0, available - 1)}
+            })
+
+        if rng.random() < 0.1:
+            self.objects["networkpolicy"].append({
+                "metadata": self._metadata(f"{name}-ingress", namespace, age),
+                "spec": {"podSelector": {"matchLabels": {"app": name}}, "policyTypes": ["Ingress"],
+                         "ingress": [{"from": [{"podSelector": {"matchLabels": {"tier": "frontend"}}}]}]}
+            })
+
+    def _add_job(self, namespace: str, name: str, nodes: List[str]):
+        """Add a completed Job and its pod."""
+        age = self._age(7)
+        labels = {"job-name": name}
+        template = self._pod_template(labels, f"registry.example.com/{namespace}/{name}:latest", True)
+        template["spec"]["restartPolicy"] = "Never"
+        job = {
+            "metadata": self._metadata(name, namespace, age, labels),
+            "spec": {"completions": 1, "parallelism": 1, "backoffLimit": 6, "template": template},
+            "status": {"succeeded": 1, "startTime": _timestamp(self.now - age), "completionTime": _timestamp(self.now - age + datetime.timedelta(minutes=2))}
+        }
+        self.objects["job"].append(job)
+
+        owner = {"apiVersion": "batch/v1", "kind": "Job", "name": name, "uid": job["metadata"]["uid"]}
+        self._pod(namespace, f"{name}-{_hash(name)[:5]}", labels, owner, template, nodes, age, completed=True)
+
+    def _pod(self, namespace: str, name: str, labels: Dict[str, str], owner: Dict[str, Any],
+             template: Dict[str, Any], nodes: List[str], age: datetime.timedelta, completed: bool = False) -> Dict[str, Any]:
+        """Add a pod, injecting failure modes at their rates."""
+        rng = self._random
+        rates = self.failure_rates
+        started = self.now - age
+        container = template["spec"]["containers"][0]
+
+        pod = {
+            "metadata": self._metadata(name, namespace, age, dict(labels), owner),
+            "spec": {
+                "containers": [dict(container)],
+                "restartPolicy": template["spec"]["restartPolicy"],
+                "serviceAccountName": "default"
+            },
+            "status": {}
+        }
+
+        roll = rng.random()
+        if completed:
+            mode = "completed"
+        elif roll < rates["pending"]:
+            mode = "pending"
+        elif roll < rates["pending"] + rates["image_pull"]:
+            mode = "image_pull"
+        elif roll < rates["pending"] + rates["image_pull"] + rates["crashloop"]:
+            mode = "crashloop"
+        else:
+            mode = "running"
+        if mode in self.failures:
+            self.failures[mode] += 1
+
+        if mode == "pending":
+            # Unschedulable: no node, no container statuses
+            pod["status"] = {
+                "phase": "Pending",
+                "conditions": [{"type": "PodScheduled", "status": "False", "reason": "Unschedulable",
+                                "message": "0/%d nodes are available: insufficient cpu." % len(nodes),
+                                "lastTransitionTime": _timestamp(started)}]
+            }
+            self._add_event(namespace, name, "FailedScheduling", pod["status"]["conditions"][0]["message"], rng.randint(1, 50))
+            self.objects["pod"].append(pod)
+            return pod
+
+        pod["spec"]["nodeName"] = rng.choice(nodes)
+        status = {"name": "main", "image": container["image"], "imageID": "", "ready": False, "restartCount": 0,
+                  "started": False, "state": {}}
+
+        if mode == "image_pull":
+            phase = "Pending"
+            status["state"] = {"waiting": {"reason": "ImagePullBackOff",
+                                           "message": f'Back-off pulling image "{container["image"]}"'}}
+            self._add_event(namespace, name, "Failed", f'Failed to pull image "{container["image"]}": not found', rng.randint(1, 30))
+        elif mode == "crashloop":
+            # Crash-looping pods stay in phase Running while the kubelet backs off restarts
+            phase = "Running"
+            status["restartCount"] = rng.randint(3, 200)
+            status["imageID"] = f"sha256:{_hash(container['image'])}"
+            status["state"] = {"waiting": {"reason": "CrashLoopBackOff",
+                                           "message": "back-off 5m0s restarting failed container"}}
+            status["lastState"] = {"terminated": {"exitCode": 1, "reason": "Error",
+                                                  "finishedAt": _timestamp(self.now - datetime.timedelta(minutes=2))}}
+            self._add_event(namespace, name, "BackOff", "Back-off restarting failed container main", status["restartCount"])
+        elif mode == "completed":
+            phase = "Succeeded"
+            status["imageID"] = f"sha256:{_hash(container['image'])}"
+            status["state"] = {"terminated": {"exitCode": 0, "reason": "Completed",
+                                              "finishedAt": _timestamp(started + datetime.timedelta(minutes=2))}}
+        else:
+            phase = "Running"
+            status["ready"] = True
+            status["started"] = True
+            status["imageID"] = f"sha256:{_hash(container['image'])}"
+            status["restartCount"] = rng.choices((0, 1, 2, 15), (90, 6, 3, 1))[0]
+            status["state"] = {"running": {"startedAt": _timestamp(started)}}
+
+        pod["status"] = {
+            "phase": phase,
+            "hostIP": f"192.168.{nodes.index(pod['spec']['nodeName']) // 250}.{nodes.index(pod['spec']['nodeName']) % 250}",
+            "podIP": self._next_ip(),
+            "startTime": _timestamp(started),
+            "conditions": [{"type": "Ready", "status": "True" if status["ready"] else "False",
+                            "lastTransitionTime": _timestamp(started)}],
+            "containerStatuses": [status]
+        }
+        self.objects["pod"].append(pod)
+        return pod
+
+    def _add_service(self, namespace: str, name: str, labels: Dict[str, str], ready_ips: List[tuple]):
+        """Add a service and its endpoint slice; some services get a selector that matches nothing."""
+        selector = {"app": name}
+        if self._random.random() < self.failure_rates["service_without_endpoints"]:
+            # A typo'd selector, the usual reason for a service without endpoints
+            selector = {"app": f"{name}-v2"}
+            ready_ips = []
+            self.failures["service_without_endpoints"] += 1
+
+        service = {
+            "metadata": self._metadata(name, namespace, self._age(), dict(labels)),
+            "spec": {
+                "type": "ClusterIP",
+                "clusterIP": self._next_ip().replace("10.", "172.", 1),
+                "selector": selector,
+                "ports": [{"name": "http", "port": 80, "targetPort": 8080, "protocol": "TCP"}]
+            },
+            "status": {"loadBalancer": {}}
+        }
+        self.objects["service"].append(service)
+
+        self.objects["endpointslice"].append({
+            "metadata": self._metadata(f"{name}-{_hash(namespace, name)[:5]}", namespace, self._age(), {
+                "kubernetes.io/service-name": name,
+                "endpointslice.kubernetes.io/managed-by": "endpointslice-controller.k8s.io"
+            }, {"apiVersion": "v1", "kind": "Service", "name": name, "uid": service["metadata"]["uid"]}),
+            "addressType": "IPv4",
+            "endpoints": [{
+                "addresses": [ip],
+                "conditions": {"ready": True, "serving": True, "terminating": False},
+                "nodeName": node,
+                "targetRef": {"kind": "Pod", "name": pod_name, "namespace": namespace}
+            } for pod_name, ip, node in ready_ips],
+            "ports": [{"name": "http", "port": 8080, "protocol": "TCP"}]
+        })
+
+    def _add_event(self, namespace: str, pod_name: str, reason: str, message: str, count: int):
+        """Add a warning event about a pod."""
+        first = self.now - datetime.timedelta(minutes=self._random.randint(5, 55))
+        self.objects["event"].append({
+            "metadata": self._metadata(f"{pod_name}.{_hash(pod_name, reason)[:16]}", namespace, self.now - first),
+            "involvedObject": {"kind": "Pod", "namespace": namespace, "name": pod_name, "apiVersion": "v1",
+                               "uid": _uid(namespace, pod_name), "fieldPath": "spec.containers{main}"},
+            "reason": reason,
+            "message": message,
+            "source": {"component": "default-scheduler" if reason == "FailedScheduling" else "kubelet"},
+            "firstTimestamp": _timestamp(first),
+            "lastTimestamp": _timestamp(self.now - datetime.timedelta(seconds=self._random.randint(0, 300))),
+            "count": count,
+            "type": "Warning",
+            "reportingComponent": "",
+            "reportingInstance": ""
+        })
+
+    def counts(self) -> Dict[str, int]:
+        """Number of objects per kind."""
+        return {kind: len(items) for kind, items in self.objects.items()}
+
+    def write_snapshot(self, path: str) -> str:
+        """Save the cluster as a snapshot file that K8sScanner(snapshot=path) can analyze offline."""
+        writer = SnapshotWriter(path, metadata={"synthetic": True, "seed": self.seed})
+        try:
+            # Kinds the generator doesn't create are saved empty, so they read as "none" rather than "unknown"
+            for kind in SNAPSHOT_KINDS:
+                writer.add(kind, self.objects.get(kind, []))
+        except Exception:
+            writer.abort()
+            raise
+        writer.close()
+        return writer.path
+
+    def log_lines(self, pod: Dict[str, Any], count: int, previous: bool = False) -> Iterator[str]:
+        """Generate the last count log lines of a pod's container, without timestamps."""
+        rng = random.Random(f"{self.seed}/{pod['metadata']['uid']}/{previous}")
+        statuses = (pod.get("status") or {}).get("containerStatuses") or []
+        crashing = previous or any((s.get("state") or {}).get("waiting", {}).get("reason") == "CrashLoopBackOff"
+                                   for s in statuses)
+
+        for index in range(count):
+            if crashing and index >= count - 3:
+                template = _CRASH_LOG_LINES[index % len(_CRASH_LOG_LINES)]
+            else:
+                template = rng.choice(_LOG_LINES)
+            yield template.format(latency=rng.randint(1, 900), number=rng.randint(1, 5000))
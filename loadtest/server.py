@@ -0,0 +1,496 @@
+"""A local stand-in for the Kubernetes API server, serving a SyntheticCluster.
+
+Implements what Groot CLI's scanner uses: discovery, LIST with limit and
+continue, label and field selectors, Table and PartialObjectMetadata
+responses, single-object GETs, WATCH with resourceVersions (including 410
+Gone for expired ones), and pod logs with tailLines, timestamps, previous
+and follow. A churn thread modifies pods at a steady rate so watches see
+events. Latency and 503 errors can be injected per request.
+"""
+
+import base64
+import bisect
+import collections
+import copy
+import datetime
+import json
+import os
+import random
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from groot.k8s_scanner import RESOURCE_PATHS
+from groot.loadtest.generator import SyntheticCluster
+from groot.snapshot import match_field_selector, match_label_selector
+
+# Kind and list kind names, as the API server returns them
+KIND_NAMES = {
+    "pod": "Pod", "service": "Service", "endpoints": "Endpoints", "event": "Event", "configmap": "ConfigMap",
+    "secret": "Secret", "namespace": "Namespace", "node": "Node", "deployment": "Deployment",
+    "replicaset": "ReplicaSet", "statefulset": "StatefulSet", "daemonset": "DaemonSet", "job": "Job",
+    "cronjob": "CronJob", "ingress": "Ingress", "endpointslice": "EndpointSlice", "networkpolicy": "NetworkPolicy",
+    "poddisruptionbudget": "PodDisruptionBudget"
+}
+
+# Watch events kept for resuming from a resourceVersion; older ones get 410 Gone
+WATCH_HISTORY = 10000
+
+def _status(code: int, reason: str, message: str) -> Dict[str, Any]:
+    return {"kind": "Status", "apiVersion": "v1", "metadata": {}, "status": "Failure",
+            "message": message, "reason": reason, "code": code}
+
+def _flag(query: Dict[str, str], name: str) -> bool:
+    """A boolean query parameter; the Python client sends True, kubectl true."""
+    return query.get(name, "").lower() in ("true", "1")
+
+def _age(timestamp: Optional[str]) -> str:
+    """kubectl style age of a timestamp."""
+    if not timestamp:
+        return "<unknown>"
+    created = datetime.datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=datetime.timezone.utc)
+    seconds = int((datetime.datetime.now(datetime.timezone.utc) - created).total_seconds())
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{seconds // size}{unit}"
+    return f"{seconds}s"
+
+class FakeApiServer:
+    """Serves a SyntheticCluster over HTTP on localhost.
+
+    latency adds that many seconds to every request, error_rate answers that
+    share of requests with 503, and churn is the number of pod changes per
+    second published to watches.
+    """
+
+    def __init__(self, cluster: SyntheticCluster, host: str = "127.0.0.1", port: int = 0,
+                 latency: float = 0.0, error_rate: float = 0.0, churn: float = 1.0):
+        """Initialize the server; port 0 picks a free port."""
+        self.cluster = cluster
+        self.latency = latency
+        self.error_rate = error_rate
+        self.churn = churn
+        self.stats = collections.Counter()
+
+        self._lock = threading.Condition()
+        self._resource_version = int(max(
+            (int(item["metadata"]["resourceVersion"]) for items in cluster.objects.values() for item in items),
+            default=1
+        ))
+        self._history: collections.deque = collections.deque(maxlen=WATCH_HISTORY)
+        # Watches from before this resourceVersion can't be resumed
+        self._compacted = self._resource_version
+        self._random = random.Random(cluster.seed)
+        self._stopped = threading.Event()
+
+        # Paths of every kind, and where each namespace's objects start and end (lists are sorted by namespace)
+        self._kinds = {(prefix, plural): kind for kind, (prefix, plural, _) in RESOURCE_PATHS.items()}
+        self._ranges: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        for kind, items in cluster.objects.items():
+            namespaces = [item["metadata"].get("namespace", "") for item in items]
+            self._ranges[kind] = {namespace: (bisect.bisect_left(namespaces, namespace), bisect.bisect_right(namespaces, namespace))
+                                  for namespace in set(namespaces)}
+
+        self._httpd = _HTTPServer((host, port), _Handler)
+        self._httpd.api = self
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve in background threads."""
+        for target in (self._httpd.serve_forever, self._churn):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        """Stop serving and end open watches and log streams."""
+        self._stopped.set()
+        with self._lock:
+            self._lock.notify_all()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def kubeconfig(self, path: str, context: str = "loadtest") -> str:
+        """Write a kubeconfig pointing at the server and return its path."""
+        path = os.path.expanduser(path)
+        with open(path, "w") as f:
+            yaml.safe_dump({
+                "apiVersion": "v1",
+                "kind": "Config",
+                "clusters": [{"name": context, "cluster": {"server": self.url}}],
+                "users": [{"name": context, "user": {"token": "loadtest"}}],
+                "contexts": [{"name": context, "context": {"cluster": context, "user": context}}],
+                "current-context": context
+            }, f, default_flow_style=False)
+        return path
+
+    def _churn(self):
+        """Modify random pods, publishing MODIFIED events: restarts, readiness flips."""
+        pods = self.cluster.objects["pod"]
+        while self.churn > 0 and pods and not self._stopped.wait(1 / self.churn):
+            index = self._random.randrange(len(pods))
+            pod = copy.deepcopy(pods[index])
+            for status in (pod.get("status") or {}).get("containerStatuses") or []:
+                if self._random.random() < 0.5:
+                    status["restartCount"] += 1
+                else:
+                    status["ready"] = not status["ready"]
+
+            with self._lock:
+                self._resource_version += 1
+                pod["metadata"]["resourceVersion"] = str(self._resource_version)
+                # Replaced rather than changed in place, so pages being served see whole objects
+                pods[index] = pod
+                if len(self._history) == self._history.maxlen:
+                    self._compacted = self._history[0][0]
+                self._history.append((self._resource_version, "pod", "MODIFIED", pod))
+                self._lock.notify_all()
+
+    def _items(self, kind: str, namespace: Optional[str]) -> List[Dict[str, Any]]:
+        """Objects of a kind, optionally in one namespace."""
+        items = self.cluster.objects.get(kind, [])
+        if namespace is None:
+            return items
+        start, end = self._ranges.get(kind, {}).get(namespace, (0, 0))
+        return items[start:end]
+
+class _HTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server that ignores clients closing their connections."""
+
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler; the FakeApiServer is self.server.api."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def api(self) -> FakeApiServer:
+        return self.server.api
+
+    def _send_json(self, body: Dict[str, Any], code: int = 200):
+        data = json.dumps(body, separators=(",", ":")).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _start_stream(self, content_type: str):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _send_chunk(self, data: bytes):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def _end_stream(self):
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def do_GET(self):
+        api = self.api
+        url = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        parts = [part for part in url.path.split("/") if part]
+        api.stats["requests"] += 1
+
+        if api.latency:
+            time.sleep(api.latency)
+        if api.error_rate and api._random.random() < api.error_rate:
+            api.stats["errors"] += 1
+            self._send_json(_status(503, "ServiceUnavailable", "injected error"), 503)
+            return
+
+        try:
+            if parts in (["api"], ["apis"], ["api", "v1"]) or (len(parts) == 3 and parts[0] == "apis"):
+                self._send_json(self._discovery(parts))
+                return
+            self._route(parts, query)
+        except ConnectionError:
+            pass
+
+    def _discovery(self, parts: List[str]) -> Dict[str, Any]:
+        """Legacy discovery documents for the kinds in RESOURCE_PATHS."""
+        prefixes = sorted({prefix for prefix, _, _ in RESOURCE_PATHS.values()})
+        if parts == ["api"]:
+            return {"kind": "APIVersions", "versions": ["v1"], "serverAddressByClientCIDRs": []}
+        if parts == ["apis"]:
+            groups = []
+            for prefix in prefixes:
+                if prefix.startswith("/apis/"):
+                    name, version = prefix.split("/")[2:4]
+                    group_version = {"groupVersion": f"{name}/{version}", "version": version}
+                    groups.append({"name": name, "versions": [group_version], "preferredVersion": group_version})
+            return {"kind": "APIGroupList", "apiVersion": "v1", "groups": groups}
+
+        prefix = "/" + "/".join(parts)
+        return {
+            "kind": "APIResourceList",
+            "apiVersion": "v1",
+            "groupVersion": "/".join(parts[1:]),
+            "resources": [{
+                "name": plural,
+                "singularName": kind,
+                "namespaced": namespaced,
+                "kind": KIND_NAMES[kind],
+                "verbs": ["get", "list", "watch"]
+            } for kind, (kind_prefix, plural, namespaced) in RESOURCE_PATHS.items() if kind_prefix == prefix]
+        }
+
+    def _route(self, parts: List[str], query: Dict[str, str]):
+        """Dispatch /api/v1/... and /apis/group/version/... resource paths."""
+        base = 2 if parts[0] == "api" else 3
+        prefix = "/" + "/".join(parts[:base])
+        rest = parts[base:]
+
+        namespace = None
+        if len(rest) >= 3 and rest[0] == "namespaces":
+            namespace, rest = rest[1], rest[2:]
+
+        kind = self.api._kinds.get((prefix, rest[0])) if rest else None
+        if kind is None:
+            self._send_json(_status(404, "NotFound", "the server could not find the requested resource"), 404)
+            return
+
+        if len(rest) == 1:
+            if _flag(query, "watch"):
+                self._watch(kind, namespace, query)
+            else:
+                self._list(kind, namespace, query)
+            return
+
+        obj = next((item for item in self.api._items(kind, namespace) if item["metadata"]["name"] == rest[1]), None)
+        if obj is None:
+            self._send_json(_status(404, "NotFound", f'{rest[0]} "{rest[1]}" not found'), 404)
+        elif len(rest) == 3 and rest[2] == "log" and kind == "pod":
+            self._logs(obj, query)
+        elif len(rest) == 2:
+            self._send_json(self._with_kind(kind, prefix, obj, self.headers.get("Accept", "")))
+        else:
+            self._send_json(_status(404, "NotFound", "the server could not find the requested resource"), 404)
+
+    def _with_kind(self, kind: str, prefix: str, obj: Dict[str, Any], accept: str) -> Dict[str, Any]:
+        if "as=PartialObjectMetadata" in accept:
+            return {"kind": "PartialObjectMetadata", "apiVersion": "meta.k8s.io/v1", "metadata": obj["metadata"]}
+        return dict(obj, kind=KIND_NAMES[kind], apiVersion=prefix.split("/", 2)[-1])
+
+    def _matching(self, kind: str, namespace: Optional[str], query: Dict[str, str]) -> List[Dict[str, Any]]:
+        items = self.api._items(kind, namespace)
+        label_selector = query.get("labelSelector")
+        field_selector = query.get("fieldSelector")
+        if label_selector:
+            items = [item for item in items if match_label_selector(item["metadata"].get("labels"), label_selector)]
+        if field_selector:
+            items = [item for item in items if match_field_selector(item, field_selector)]
+        return items
+
+    def _list(self, kind: str, namespace: Optional[str], query: Dict[str, str]):
+        """LIST, paged with limit and continue."""
+        api = self.api
+        prefix, plural, _ = RESOURCE_PATHS[kind]
+        api.stats["lists"] += 1
+
+        with api._lock:
+            resource_version = str(api._resource_version)
+        items = self._matching(kind, namespace, query)
+
+        offset = 0
+        if query.get("continue"):
+            try:
+                token = json.loads(base64.urlsafe_b64decode(query["continue"]))
+                offset, resource_version = token["offset"], token["resourceVersion"]
+            except (ValueError, KeyError):
+                self._send_json(_status(400, "BadRequest", "invalid continue token"), 400)
+                return
+
+        limit = int(query.get("limit") or 0)
+        end = offset + limit if limit else len(items)
+        page = items[offset:end]
+
+        metadata = {"resourceVersion": resource_version}
+        if end < len(items):
+            metadata["continue"] = base64.urlsafe_b64encode(
+                json.dumps({"offset": end, "resourceVersion": resource_version}).encode()).decode()
+            metadata["remainingItemCount"] = len(items) - end
+
+        accept = self.headers.get("Accept", "")
+        if "as=Table" in accept:
+            self._send_json(self._table(kind, page, metadata))
+        elif "as=PartialObjectMetadataList" in accept:
+            self._send_json({
+                "kind": "PartialObjectMetadataList",
+                "apiVersion": "meta.k8s.io/v1",
+                "metadata": metadata,
+                "items": [{"kind": "PartialObjectMetadata", "apiVersion": "meta.k8s.io/v1", "metadata": item["metadata"]}
+                          for item in page]
+            })
+        else:
+            self._send_json({
+                "kind": f"{KIND_NAMES[kind]}List",
+                "apiVersion": prefix.split("/", 2)[-1],
+                "metadata": metadata,
+                "items": page
+            })
+
+    def _table(self, kind: str, page: List[Dict[str, Any]], metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """A meta.k8s.io Table with kubectl's main columns for pods and services, Name and Age otherwise."""
+        def pod_cells(pod):
+            statuses = pod["status"].get("containerStatuses") or []
+            waiting = [(s.get("state") or {}).get("waiting", {}).get("reason") for s in statuses]
+            ready = sum(1 for s in statuses if s["ready"])
+            return [f"{ready}/{len(pod['spec']['containers'])}", next((w for w in waiting if w), pod["status"]["phase"]),
+                    sum(s["restartCount"] for s in statuses)]
+
+        def service_cells(service):
+            return [service["spec"]["type"], service["spec"].get("clusterIP", ""), "<none>",
+                    ",".join(f"{port['port']}/{port['protocol']}" for port in service["spec"].get("ports") or [])]
+
+        columns, cells = {
+            "pod": (["Ready", "Status", "Restarts"], pod_cells),
+            "service": (["Type", "Cluster-IP", "External-IP", "Port(s)"], service_cells)
+        }.get(kind, ([], lambda obj: []))
+
+        return {
+            "kind": "Table",
+            "apiVersion": "meta.k8s.io/v1",
+            "metadata": metadata,
+            "columnDefinitions": [{"name": name, "type": "string", "format": "", "description": "", "priority": 0}
+                                  for name in ["Name"] + columns + ["Age"]],
+            "rows": [{
+                "cells": [obj["metadata"]["name"]] + cells(obj) + [_age(obj["metadata"].get("creationTimestamp"))],
+                "object": {"kind": "PartialObjectMetadata", "apiVersion": "meta.k8s.io/v1", "metadata": obj["metadata"]}
+            } for obj in page]
+        }
+
+    def _watch(self, kind: str, namespace: Optional[str], query: Dict[str, str]):
+        """WATCH from a resourceVersion until timeoutSeconds, as newline-delimited JSON events."""
+        api = self.api
+        api.stats["watches"] += 1
+        deadline = time.monotonic() + float(query.get("timeoutSeconds") or 1800)
+        bookmarks = _flag(query, "allowWatchBookmarks")
+        label_selector = query.get("labelSelector")
+        field_selector = query.get("fieldSelector")
+
+        def matches(item):
+            return ((namespace is None or item["metadata"].get("namespace") == namespace)
+                    and (not label_selector or match_label_selector(item["metadata"].get("labels"), label_selector))
+                    and (not field_selector or match_field_selector(item, field_selector)))
+
+        def send(event_type, obj):
+            self._send_chunk(json.dumps({"type": event_type, "object": obj}, separators=(",", ":")).encode() + b"\n")
+
+        self._start_stream("application/json")
+
+        with api._lock:
+            current = api._resource_version
+            compacted = api._compacted
+        requested = query.get("resourceVersion")
+
+        if requested in (None, "", "0"):
+            # No resourceVersion: the current state as ADDED events, then changes
+            for item in self._matching(kind, namespace, query):
+                send("ADDED", item)
+            last = current
+        elif int(requested) < compacted:
+            send("ERROR", _status(410, "Expired", f"too old resource version: {requested} ({compacted})"))
+            self._end_stream()
+            return
+        else:
+            last = int(requested)
+
+        try:
+            while not api._stopped.is_set() and time.monotonic() < deadline:
+                with api._lock:
+                    if not api._history or api._history[-1][0] <= last:
+                        api._lock.wait(min(5.0, max(0.0, deadline - time.monotonic())))
+                    events = [event for event in api._history if event[0] > last]
+                    current = api._resource_version
+
+                sent = False
+                for resource_version, event_kind, event_type, obj in events:
+                    last = resource_version
+                    if event_kind == kind and matches(obj):
+                        send(event_type, obj)
+                        sent = True
+                if bookmarks and not sent:
+                    send("BOOKMARK", {"kind": KIND_NAMES[kind], "apiVersion": RESOURCE_PATHS[kind][0].split("/", 2)[-1],
+                                      "metadata": {"resourceVersion": str(current)}})
+                last = max(last, current)
+            self._end_stream()
+        except ConnectionError:
+            pass
+
+    def _logs(self, pod: Dict[str, Any], query: Dict[str, str]):
+        """Pod logs, generated from the pod's state; follow streams a line every half second."""
+        api = self.api
+        api.stats["logs"] += 1
+        containers = [container["name"] for container in pod["spec"]["containers"]]
+        container = query.get("container") or containers[0]
+        if container not in containers:
+            self._send_json(_status(400, "BadRequest", f"container {container} is not valid for pod {pod['metadata']['name']}"), 400)
+            return
+
+        statuses = pod["status"].get("containerStatuses") or []
+        previous = _flag(query, "previous")
+        if not statuses or (previous and not any(s["restartCount"] for s in statuses)):
+            message = "previous terminated container" if previous else "container"
+            self._send_json(_status(400, "BadRequest", f'{message} "{container}" in pod "{pod["metadata"]["name"]}" not found'), 400)
+            return
+
+        timestamps = _flag(query, "timestamps")
+        tail = int(query["tailLines"]) if query.get("tailLines") else 200
+        now = datetime.datetime.now(datetime.timezone.utc)
+
+        def line(text, at):
+            prefix = at.strftime("%Y-%m-%dT%H:%M:%S.%f000Z ") if timestamps else ""
+            return f"{prefix}{text}\n"
+
+        lines = list(api.cluster.log_lines(pod, tail, previous))
+        body = "".join(line(text, now - datetime.timedelta(seconds=len(lines) - index))
+                       for index, text in enumerate(lines)).encode()
+
+        if not _flag(query, "follow"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        self._start_stream("text/plain")
+        try:
+            if body:
+                self._send_chunk(body)
+            more = api.cluster.log_lines(pod, 10 ** 9)
+            while not api._stopped.wait(0.5):
+                self._send_chunk(line(next(more), datetime.datetime.now(datetime.timezone.utc)).encode())
+            self._end_stream()
+        except ConnectionError:
+            pass
@@ -0,0 +1,171 @@
+"""Log template mining for Groot CLI.
+
+Groups log lines into templates in a single streaming pass, following the
+Drain algorithm: variable-looking tokens are masked, lines are routed through
+a fixed-depth prefix tree keyed by token count and leading tokens, and each
+leaf holds the templates that lines are matched against by token similarity.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from groot.utils.helpers import timestamp_sort_key
+
+WILDCARD = "<*>"
+
+# Tokens that are almost always variables, masked before matching
+_MASKS = [
+    re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"),
+    re.compile(r"^\d{1,3}(\.\d{1,3}){3}(:\d+)?$"),
+    re.compile(r"^0x[0-9a-fA-F]+$"),
+    re.compile(r"^[0-9a-fA-F]{16,}$"),
+    re.compile(r"^[-+]?\d+(\.\d+)?[a-zA-Z%]*$")
+]
+
+def mask_token(token: str) -> str:
+    """Replace a variable-looking token with the wildcard."""
+    for mask in _MASKS:
+        if mask.match(token):
+            return WILDCARD
+    return token
+
+class LogTemplate:
+    """A group of log lines sharing one template."""
+
+    __slots__ = ("tokens", "count", "first_seen", "last_seen", "examples", "sources", "_first_key", "_last_key")
+
+    def __init__(self, tokens: List[str]):
+        """Initialize a template from the tokens of its first line."""
+        self.tokens = tokens
+        self.count = 0
+        self.first_seen: Optional[str] = None
+        self.last_seen: Optional[str] = None
+        self._first_key: Optional[str] = None
+        self._last_key: Optional[str] = None
+        self.examples: List[str] = []
+        self.sources: Dict[str, int] = {}
+
+    @property
+    def template(self) -> str:
+        return " ".join(self.tokens)
+
+    def similarity(self, tokens: List[str]) -> float:
+        """Fraction of positions where the template has the same token or a wildcard."""
+        same = 0
+        for template_token, token in zip(self.tokens, tokens):
+            if template_token == token or template_token == WILDCARD:
+                same += 1
+        return same / len(tokens) if tokens else 1.0
+
+    def merge(self, tokens: List[str]):
+        """Generalize positions that differ from tokens to the wildcard."""
+        for i, token in enumerate(tokens):
+            if self.tokens[i] != token:
+                self.tokens[i] = WILDCARD
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary."""
+        return {
+            "template": self.template,
+            "count": self.count,
+            "first_seen": self.first_seen,
+            "last_seen": self.last_seen,
+            "examples": list(self.examples),
+            "sources": dict(self.sources)
+        }
+
+class LogMiner:
+    """Streaming Drain-style log template miner."""
+
+    def __init__(self, depth: int = 4, similarity_threshold: float = 0.5, max_children: int = 100,
+                 max_examples: int = 3):
+        """Initialize the miner.
+
+        depth is the number of leading tokens used to route a line through the
+        prefix tree; lines whose best similarity to a leaf's templates is below
+        similarity_threshold start a new template.
+        """
+        self.depth = depth
+        self.similarity_threshold = similarity_threshold
+        self.max_children = max_children
+        self.max_examples = max_examples
+        self.templates: List[LogTemplate] = []
+        self.lines = 0
+        self._tree: Dict[int, Dict] = {}
+
+    def add(self, line: str, timestamp: str = None, source: str = None) -> Optional[LogTemplate]:
+        """Add a log line, returning the template it was grouped into."""
+        tokens = [mask_token(token) for token in line.split()]
+        if not tokens:
+            return None
+
+        self.lines += 1
+        leaf = self._leaf(tokens)
+
+        best, best_similarity = None, -1.0
+        for template in leaf:
+            similarity = template.similarity(tokens)
+            if similarity > best_similarity:
+                best, best_similarity = template, similarity
+
+        if best is None or best_similarity < self.similarity_threshold:
+            best = LogTemplate(tokens)
+            leaf.append(best)
+            self.templates.append(best)
+        else:
+            best.merge(tokens)
+
+        best.count += 1
+        if timestamp:
+            # Compare parsed keys, as timestamps may differ in fractional-second precision or offset
+            key = timestamp_sort_key(timestamp)
+            if best._first_key is None or key < best._first_key:
+                best.first_seen, best._first_key = timestamp, key
+            if best._last_key is None or key > best._last_key:
+                best.last_seen, best._last_key = timestamp, key
+        if len(best.examples) < self.max_examples:
+            best.examples.append(line)
+        if source:
+            best.sources[source] = best.sources.get(source, 0) + 1
+
+        return best
+
+    def _leaf(self, tokens: List[str]) -> List[LogTemplate]:
+        """Walk (and grow) the prefix tree to the leaf for tokens."""
+        node = self._tree.setdefault(len(tokens), {})
+
+        for token in tokens[:self.depth]:
+            # Tokens with digits are likely variables, and a full node routes everything to the wildcard
+            if any(c.isdigit() for c in token):
+                token = WILDCARD
+            if token not in node and len(node) >= self.max_children:
+                token = WILDCARD
+            node = node.setdefault(token, {})
+
+        return node.setdefault(None, [])
+
+    def top(self, limit: int = None) -> List[LogTemplate]:
+        """Templates ordered by number of lines, most frequent first."""
+        templates = sorted(self.templates, key=lambda template: template.count, reverse=True)
+        return templates[:limit] if limit else templates
+
+    def summary(self, limit: int = 20) -> str:
+        """Render the most frequent templates as compact text."""
+        lines = [f"{len(self.templates)} templates from {self.lines} log lines"]
+        for template in self.top(limit):
+            seen = ""
+            if template.first_seen:
+                seen = f" (first {template.first_seen}, last {template.last_seen})"
+            lines.append(f"{template.count}x {template.template}{seen}")
+
+        if limit and len(self.templates) > limit:
+            lines.append(f"... {len(self.templates) - limit} less frequent templates omitted")
+
+        return "\n".join(lines)
+
+def mine_logs(entries: List[Dict[str, Any]]) -> LogMiner:
+    """Mine log entries as returned by K8sScanner.aggregate_workload_logs."""
+    miner = LogMiner()
+    for entry in entries:
+        miner.add(entry["line"], entry.get("timestamp"), f"{entry.get('pod')}/{entry.get('container')}")
+    return miner
@@ -106,11 +106,6 @@ class NLPEngine:
 
         ruler.add_patterns(patterns)
 
-    def parse  "pending"}]},
-    ]
-
-    ruler.add_patterns(patterns)
-
     def parse_query(self, query: str) -> Dict[str, Any]:
         """Parse a natural language query to extract intent and entities."""
         doc = self.nlp(query.lower())
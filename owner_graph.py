@@ -0,0 +1,113 @@
+"""Ownership graph built from Kubernetes ownerReferences for Groot CLI."""
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# (kind, namespace, name); namespace is None for cluster-scoped objects
+ObjectRef = Tuple[str, Optional[str], str]
+
+class OwnerGraph:
+    """Bidirectional index of metadata.ownerReferences.
+
+    Objects are linked by uid, so lookups in either direction (Pod -> ReplicaSet
+    -> Deployment, or Deployment -> its Pods) are dict reads instead of scans
+    over every object. Owners that were not listed themselves are still known
+    by the kind and name in the reference.
+    """
+
+    def __init__(self):
+        """Initialize an empty graph."""
+        self._refs: Dict[str, ObjectRef] = {}
+        self._uids: Dict[ObjectRef, str] = {}
+        self._by_name: Dict[Tuple[str, str], List[ObjectRef]] = {}
+        self._owners: Dict[str, List[str]] = {}
+        self._controllers: Dict[str, str] = {}
+        self._children: Dict[str, List[str]] = {}
+
+    def add(self, kind: str, obj: Any):
+        """Add an object (kubernetes model or ObjectView) and its owner references."""
+        metadata = obj.metadata
+        uid = metadata.uid
+        if not uid:
+            return
+
+        ref = (kind, metadata.namespace, metadata.name)
+        self._register(uid, ref)
+
+        for owner in metadata.owner_references or []:
+            self._register(owner.uid, (owner.kind, metadata.namespace, owner.name))
+            self._owners.setdefault(uid, []).append(owner.uid)
+            self._children.setdefault(owner.uid, []).append(uid)
+            if owner.controller:
+                self._controllers[uid] = owner.uid
+
+    def _register(self, uid: str, ref: ObjectRef):
+        """Record the identity of a uid."""
+        if uid in self._refs:
+            return
+
+        self._refs[uid] = ref
+        self._uids[ref] = uid
+        self._by_name.setdefault((ref[0], ref[2]), []).append(ref)
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def __contains__(self, ref: ObjectRef) -> bool:
+        return ref in self._uids
+
+    def find(self, kind: str, name: str) -> List[ObjectRef]:
+        """Find objects of a kind by name across namespaces."""
+        return list(self._by_name.get((kind, name), []))
+
+    def owners(self, kind: str, namespace: Optional[str], name: str) -> List[ObjectRef]:
+        """Direct owners of an object."""
+        uid = self._uids.get((kind, namespace, name))
+        return [self._refs[owner] for owner in self._owners.get(uid, [])]
+
+    def controller(self, kind: str, namespace: Optional[str], name: str) -> Optional[ObjectRef]:
+        """The managing controller of an object, if any."""
+        uid = self._uids.get((kind, namespace, name))
+        owner = self._controllers.get(uid)
+        return self._refs[owner] if owner else None
+
+    def children(self, kind: str, namespace: Optional[str], name: str) -> List[ObjectRef]:
+        """Objects directly owned by an object."""
+        uid = self._uids.get((kind, namespace, name))
+        return [self._refs[child] for child in self._children.get(uid, [])]
+
+    def root_controller(self, kind: str, namespace: Optional[str], name: str) -> ObjectRef:
+        """Follow controller references up to the top-level workload (e.g. Pod -> Deployment)."""
+        ref = (kind, namespace, name)
+        seen = set()
+
+        while ref not in seen:
+            seen.add(ref)
+            owner = self.controller(*ref)
+            if owner is None:
+                break
+            ref = owner
+
+        return ref
+
+    def descendants(self, kind: str, namespace: Optional[str], name: str, of_kind: str = None) -> List[ObjectRef]:
+        """All objects transitively owned by an object, optionally only of one kind."""
+        uid = self._uids.get((kind, namespace, name))
+        if uid is None:
+            return []
+
+        result = []
+        seen: Set[str] = {uid}
+        stack = list(self._children.get(uid, []))
+
+        while stack:
+            child = stack.pop()
+            if child in seen:
+                continue
+            seen.add(child)
+
+            ref = self._refs[child]
+            if of_kind is None or ref[0] == of_kind:
+                result.append(ref)
+            stack.extend(self._children.get(child, []))
+
+        return result
@@ -0,0 +1,134 @@
+"""Compact columnar snapshot of pod state for Groot CLI status views."""
+
+import datetime
+import math
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+class StringTable:
+    """Interns repeated strings (namespaces, phases, nodes) as small integer codes."""
+
+    def __init__(self):
+        """Initialize an empty table."""
+        self.values: List[Optional[str]] = []
+        self._codes: Dict[Optional[str], int] = {}
+
+    def code(self, value: Optional[str]) -> int:
+        """Get the code for a value, adding it if needed."""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def __getitem__(self, code: int) -> Optional[str]:
+        return self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+class PodSnapshot:
+    """Array-backed columns of the pod fields the status views need.
+
+    Each pod costs its UTF-8 name plus a few bytes of fixed-width columns,
+    instead of a full V1Pod object graph.
+    """
+
+    def __init__(self):
+        """Initialize an empty snapshot."""
+        self.namespaces = StringTable()
+        self.phases = StringTable()
+        self.nodes = StringTable()
+
+        self._names = bytearray()
+        self._name_offsets = array("I", [0])
+        self.namespace_codes = array("I")
+        self.phase_codes = array("B")
+        self.node_codes = array("I")
+        self.restarts = array("I")
+        self.created = array("d")
+
+    @classmethod
+    def from_pods(cls, pods) -> "PodSnapshot":
+        """Build a snapshot from an iterable of pods."""
+        snapshot = cls()
+        for pod in pods:
+            snapshot.append(pod)
+        return snapshot
+
+    def append(self, pod: Any):
+        """Add a pod (kubernetes model or ObjectView)."""
+        metadata = pod.metadata
+        status = pod.status
+
+        self._names += (metadata.name or "").encode()
+        self._name_offsets.append(len(self._names))
+        self.namespace_codes.append(self.namespaces.code(metadata.namespace))
+        self.phase_codes.append(self.phases.code(status.phase if status else None))
+        self.node_codes.append(self.nodes.code(pod.spec.node_name if pod.spec else None))
+
+        restarts = 0
+        if status and status.container_statuses:
+            for container in status.container_statuses:
+                restarts += container.restart_count or 0
+        self.restarts.append(restarts)
+
+        created = metadata.creation_timestamp
+        self.created.append(created.timestamp() if created else math.nan)
+
+    def __len__(self) -> int:
+        return len(self.phase_codes)
+
+    def name(self, index: int) -> str:
+        """Get the name of the pod at index."""
+        return self._names[self._name_offsets[index]:self._name_offsets[index + 1]].decode()
+
+    def creation_timestamp(self, index: int) -> Optional[datetime.datetime]:
+        """Get the creation time of the pod at index."""
+        created = self.created[index]
+        if math.isnan(created):
+            return None
+        return datetime.datetime.fromtimestamp(created, datetime.timezone.utc)
+
+    def rows(self) -> Iterator[Tuple[str, Optional[str], Optional[str], int, Optional[datetime.datetime], Optional[str]]]:
+        """Iterate over (name, namespace, phase, restarts, creation time, node) tuples."""
+        for index in range(len(self)):
+            yield (
+                self.name(index),
+                self.namespaces[self.namespace_codes[index]],
+                self.phases[self.phase_codes[index]],
+                self.restarts[index],
+                self.creation_timestamp(index),
+                self.nodes[self.node_codes[index]]
+            )
+
+    def phase_counts(self) -> Dict[str, int]:
+        """Count pods per phase."""
+        if not len(self):
+            return {}
+
+        if numpy_available:
+            counts = np.bincount(np.frombuffer(self.phase_codes, dtype=np.uint8), minlength=len(self.phases))
+            return {self.phases[code]: int(count) for code, count in enumerate(counts) if count}
+
+        return {self.phases[code]: count for code, count in Counter(self.phase_codes).items()}
+
+    def total_restarts(self) -> int:
+        """Sum container restarts across all pods."""
+        if numpy_available and len(self):
+            return int(np.frombuffer(self.restarts, dtype=np.uint32).sum())
+        return sum(self.restarts)
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the columns, excluding the interned strings."""
+        columns = (self._name_offsets, self.namespace_codes, self.phase_codes, self.node_codes,
+                   self.restarts, self.created)
+        return len(self._names) + sum(column.itemsize * len(column) for column in columns)
@@ -0,0 +1,182 @@
+"""Client-side rate limiting of Kubernetes API requests for Groot CLI."""
+
+import asyncio
+import collections
+import threading
+import time
+from typing import Any, Deque, Dict, Optional
+
+# HTTP status of a request rejected by API priority and fairness
+HTTP_TOO_MANY_REQUESTS = 429
+
+# Lanes in the order they are served
+PRIORITIES = ("interactive", "normal", "background")
+
+class RequestScheduler:
+    """Token-bucket limiter with priority lanes.
+
+    Requests take one token each; tokens refill at qps up to burst. When no
+    token is free, requests wait in their priority lane and the highest
+    priority waiter is served first, so an interactive describe overtakes
+    queued background LISTs. backoff() pauses all requests, e.g. after the
+    API server answered 429 with Retry-After.
+
+    Coroutines wait with acquire(). Background threads (watches, recorders)
+    use acquire_blocking(), which only takes a token while no coroutine of
+    higher priority is queued.
+    """
+
+    def __init__(self, qps: float = 20.0, burst: int = 40):
+        """Initialize a full bucket."""
+        self.qps = qps
+        self.burst = burst
+        self.tokens = float(burst)
+        self.paused_until = 0.0
+        self.throttled = 0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._lanes: Dict[str, Deque[asyncio.Future]] = {lane: collections.deque() for lane in PRIORITIES}
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats = {lane: {"requests": 0, "waited": 0, "wait_seconds": 0.0, "max_wait": 0.0} for lane in PRIORITIES}
+
+    def _refill(self, now: float):
+        """Add the tokens earned since the last refill. Must hold the lock."""
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.qps)
+        self._updated = now
+
+    def _take(self, now: float) -> float:
+        """Take a token if one is free, else return the seconds until one is. Must hold the lock."""
+        if now < self.paused_until:
+            return self.paused_until - now
+
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.qps
+
+    def _record(self, lane: str, waited: float):
+        """Update the per-lane counters."""
+        stats = self._stats[lane]
+        stats["requests"] += 1
+        if waited > 0:
+            stats["waited"] += 1
+            stats["wait_seconds"] += waited
+            stats["max_wait"] = max(stats["max_wait"], waited)
+
+    def _queued_before(self, lane: str) -> int:
+        """Number of coroutines queued in lanes of equal or higher priority."""
+        count = 0
+        for name in PRIORITIES:
+            count += len(self._lanes[name])
+            if name == lane:
+                break
+        return count
+
+    async def acquire(self, priority: str = "normal"):
+        """Wait for a token in a priority lane."""
+        lane = priority if priority in self._lanes else "normal"
+        loop = asyncio.get_running_loop()
+
+        if self._loop is not loop:
+            # Waiters from a finished event loop can never be served
+            self._loop = loop
+            self._dispatcher = None
+            for waiters in self._lanes.values():
+                waiters.clear()
+
+        with self._lock:
+            if not self._queued_before(lane) and self._take(time.monotonic()) == 0.0:
+                self._record(lane, 0.0)
+                return
+
+        started = time.monotonic()
+        waiter = loop.create_future()
+        self._lanes[lane].append(waiter)
+
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = loop.create_task(self._dispatch())
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in self._lanes[lane]:
+                self._lanes[lane].remove(waiter)
+            raise
+
+        self._record(lane, time.monotonic() - started)
+
+    async def _dispatch(self):
+        """Hand out tokens to queued coroutines, highest priority first."""
+        while any(self._lanes.values()):
+            with self._lock:
+                delay = self._take(time.monotonic())
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            for lane in PRIORITIES:
+                waiters = self._lanes[lane]
+                while waiters and waiters[0].done():
+                    waiters.popleft()
+                if waiters:
+                    waiters.popleft().set_result(None)
+                    break
+            else:
+                # Every waiter was cancelled; return the token
+                with self._lock:
+                    self.tokens = min(self.burst, self.tokens + 1)
+
+    def acquire_blocking(self, priority: str = "background"):
+        """Wait for a token from a non-async thread."""
+        lane = priority if priority in self._lanes else "background"
+        started = time.monotonic()
+
+        while True:
+            with self._lock:
+                if self._queued_before(lane) == 0 or lane == PRIORITIES[0]:
+                    delay = self._take(time.monotonic())
+                    if delay == 0.0:
+                        break
+                else:
+                    # Let queued coroutines of higher priority go first
+                    delay = 1 / self.qps
+
+            time.sleep(min(delay, 0.1))
+
+        self._record(lane, time.monotonic() - started)
+
+    def backoff(self, seconds: float):
+        """Pause every request for a number of seconds."""
+        with self._lock:
+            self.throttled += 1
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and wait times per lane."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "qps": self.qps,
+                "burst": self.burst,
+                "tokens": round(self.tokens, 2),
+                "throttled": self.throttled,
+                "lanes": {
+                    lane: dict(
+                        self._stats[lane],
+                        queued=len(self._lanes[lane]),
+                        avg_wait=self._stats[lane]["wait_seconds"] / self._stats[lane]["waited"] if self._stats[lane]["waited"] else 0.0
+                    )
+                    for lane in PRIORITIES
+                }
+            }
+
+def retry_after(exception: Any, default: float) -> float:
+    """Seconds to wait from an ApiException's Retry-After header, or the default."""
+    headers = getattr(exception, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After", default))
+    except (TypeError, ValueError):
+        return default
@@ -0,0 +1,174 @@
+"""Retries, circuit breaking and hedging of Kubernetes API reads for Groot CLI."""
+
+import collections
+import random
+import time
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+try:
+    from urllib3.exceptions import HTTPError as TransportError
+except ImportError:
+    TransportError = OSError
+
+# Server errors worth retrying; anything else (404, 403, ...) is an answer, not a brownout
+RETRYABLE_STATUSES = {500, 502, 503, 504}
+
+def describe_error(error: Exception) -> str:
+    """Short description of an API error, e.g. "503 Service Unavailable"."""
+    status = getattr(error, "status", None)
+    reason = getattr(error, "reason", None) or str(error)
+    return f"{status} {reason}" if status else reason
+
+class ScanResult(list):
+    """A list of results that may be incomplete.
+
+    partial means some of the data could not be fetched, stale that it is the
+    last good result served in place of a failed request. errors names what
+    failed. An empty ScanResult that is partial is "don't know", not "none".
+    """
+
+    def __init__(self, items: Iterable[Any] = (), partial: bool = False, stale: bool = False,
+                 errors: List[str] = None):
+        """Initialize the result."""
+        super().__init__(items)
+        self.partial = partial
+        self.stale = stale
+        self.errors = list(errors or [])
+
+    @property
+    def degraded(self) -> bool:
+        return self.partial or self.stale
+
+    def merge_status(self, *results: Any):
+        """Take over the partial and stale flags and errors of other results."""
+        for result in results:
+            if isinstance(result, ScanResult):
+                self.partial = self.partial or result.partial
+                self.stale = self.stale or result.stale
+                self.errors.extend(result.errors)
+        return self
+
+class CircuitBreaker:
+    """Stops calling an endpoint after consecutive failures.
+
+    After failure_threshold failures in a row the circuit opens and calls fail
+    fast for reset_timeout seconds. Then a single trial call is let through
+    (half-open): success closes the circuit, failure opens it again, and a
+    released trial lets the next call try.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize a closed circuit."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self._trial:
+            self._trial = True
+            return True
+        return False
+
+    def retry_in(self) -> float:
+        """Seconds until the circuit lets a trial call through."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def record_success(self):
+        """Close the circuit."""
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+
+    def release(self):
+        """Give up a trial call that ended without an answer, e.g. when it was cancelled."""
+        self._trial = False
+
+    def record_failure(self):
+        """Count a failure, opening the circuit at the threshold or after a failed trial."""
+        self.failures += 1
+        if self._trial or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+        self._trial = False
+
+class Resilience:
+    """Retry, circuit breaker and hedging policy shared by a scanner's API calls."""
+
+    def __init__(self, base_delay: float = 0.2, max_delay: float = 5.0, failure_threshold: int = 5,
+                 reset_timeout: float = 30.0, hedge_delay: float = 1.0, latency_window: int = 100):
+        """Initialize the policy.
+
+        Retries wait a random time between 0 and base_delay * 2^attempt
+        (capped at max_delay), so clients that failed together don't retry
+        together. A slow read gets a second, hedged request once it has taken
+        longer than 95% of recent calls to its endpoint, or hedge_delay
+        seconds until enough calls were seen. A hedge_delay of 0 disables
+        hedging.
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.default_hedge_delay = hedge_delay
+        self.latency_window = latency_window
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.stats = {"retries": 0, "hedged": 0, "hedge_wins": 0, "rejected": 0}
+        self._latencies: Dict[str, Deque[float]] = {}
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """Get the circuit breaker of an endpoint."""
+        breaker = self.breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            self.breakers[endpoint] = breaker
+        return breaker
+
+    def retryable(self, exception: Exception) -> bool:
+        """Whether an error is transient: a server error or a failed connection."""
+        status = getattr(exception, "status", None)
+        if isinstance(status, int):
+            return status in RETRYABLE_STATUSES
+        return isinstance(exception, (TransportError, OSError))
+
+    def backoff(self, attempt: int) -> float:
+        """Jittered delay before retry number attempt (starting at 0)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def record_latency(self, endpoint: str, seconds: float):
+        """Remember how long a successful call took."""
+        latencies = self._latencies.get(endpoint)
+        if latencies is None:
+            latencies = collections.deque(maxlen=self.latency_window)
+            self._latencies[endpoint] = latencies
+        latencies.append(seconds)
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """Seconds to wait for a read before hedging it, or None if hedging is disabled."""
+        if not self.default_hedge_delay:
+            return None
+
+        latencies = self._latencies.get(endpoint)
+        if not latencies or len(latencies) < 20:
+            return self.default_hedge_delay
+
+        ordered = sorted(latencies)
+        return ordered[int(len(ordered) * 0.95) - 1]
+
+    def open_circuits(self) -> List[str]:
+        """Endpoints whose circuit is not closed."""
+        return [endpoint for endpoint, breaker in self.breakers.items() if breaker.state != "closed"]
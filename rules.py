@@ -0,0 +1,326 @@
+"""Declarative rule engine for Kubernetes resource analysis in Groot CLI.
+
+Rules are plain data, e.g. in a YAML rule pack:
+
+    rules:
+      - id: pod-privileged
+        kind: pod
+        foreach: spec.containers
+        when:
+          field: item.security_context.privileged
+          op: eq
+          value: true
+        severity: high
+        issue: Container runs privileged
+        details: "Container {item.name} runs in privileged mode."
+
+Field paths use the kubernetes client's snake_case attribute names and work
+on both client models and raw JSON ObjectViews. Paths start at the object,
+at "item" (the current element of a foreach list) or at "context" (values the
+scanner computes across objects, such as ready_endpoints and matched_pods).
+
+Conditions are {field, op, value} predicates combined with all/any/not.
+Operators: eq, ne, gt, ge, lt, le, in, not_in, exists, missing, truthy,
+falsy and matches (regular expression).
+
+The scanner evaluates rules for pod, deployment, service,
+poddisruptionbudget and networkpolicy objects. A pack rule with the id of a
+built-in rule replaces it; "enabled: false" disables it.
+"""
+
+import os
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+from rich.console import Console
+
+from groot.utils.k8s_objects import get_field
+
+console = Console()
+
+# The checks Groot has always run, expressed as rules
+BUILTIN_RULES = [
+    {
+        "id": "pod-crashloopbackoff",
+        "kind": "pod",
+        "foreach": "status.container_statuses",
+        "when": {"all": [
+            {"field": "status.phase", "op": "ne", "value": "Running"},
+            {"field": "item.state.waiting.reason", "op": "eq", "value": "CrashLoopBackOff"}
+        ]},
+        "severity": "high",
+        "issue": "Pod is in CrashLoopBackOff state",
+        "details": "Container {item.name} is crashing repeatedly. Check logs for more information."
+    },
+    {
+        "id": "pod-imagepullbackoff",
+        "kind": "pod",
+        "foreach": "status.container_statuses",
+        "when": {"all": [
+            {"field": "status.phase", "op": "ne", "value": "Running"},
+            {"field": "item.state.waiting.reason", "op": "eq", "value": "ImagePullBackOff"}
+        ]},
+        "severity": "high",
+        "issue": "Pod is in ImagePullBackOff state",
+        "details": "Container {item.name} image cannot be pulled. Check image name and registry access."
+    },
+    {
+        "id": "pod-high-restart-count",
+        "kind": "pod",
+        "foreach": "status.container_statuses",
+        "when": {"field": "item.restart_count", "op": "gt", "value": 10},
+        "severity": "medium",
+        "issue": "Container has high restart count",
+        "details": "Container {item.name} has restarted {item.restart_count} times. Check logs for more information."
+    },
+    {
+        "id": "pod-missing-limits",
+        "kind": "pod",
+        "foreach": "spec.containers",
+        "when": {"field": "item.resources.limits", "op": "falsy"},
+        "severity": "low",
+        "issue": "Container missing resource limits",
+        "details": "Container {item.name} does not have resource limits set. This can lead to resource contention."
+    },
+    {
+        "id": "deployment-unavailable-replicas",
+        "kind": "deployment",
+        "when": {"field": "status.unavailable_replicas", "op": "truthy"},
+        "severity": "medium",
+        "issue": "Deployment has unavailable replicas",
+        "details": "Deployment has {status.unavailable_replicas} unavailable replicas out of {spec.replicas} desired."
+    },
+    {
+        "id": "deployment-missing-anti-affinity",
+        "kind": "deployment",
+        "when": {"field": "spec.template.spec.affinity.pod_anti_affinity", "op": "falsy"},
+        "severity": "low",
+        "issue": "Deployment missing pod anti-affinity",
+        "details": "Pod anti-affinity is not configured. This can lead to all pods running on the same node."
+    },
+    {
+        "id": "service-selector-matches-nothing",
+        "kind": "service",
+        "when": {"all": [
+            {"field": "spec.selector", "op": "truthy"},
+            {"field": "context.ready_endpoints", "op": "falsy"},
+            {"field": "context.matched_pods", "op": "falsy"}
+        ]},
+        "severity": "medium",
+        "issue": "Service has no endpoints",
+        "details": "Service selector does not match any pods. Check pod labels and service selector."
+    },
+    {
+        "id": "service-no-ready-pods",
+        "kind": "service",
+        "when": {"all": [
+            {"field": "spec.selector", "op": "truthy"},
+            {"field": "context.ready_endpoints", "op": "falsy"},
+            {"field": "context.matched_pods", "op": "truthy"}
+        ]},
+        "severity": "medium",
+        "issue": "Service has no endpoints",
+        "details": "Service selector matches {context.matched_pods} pods but none are ready. Check pod readiness probes."
+    },
+    {
+        "id": "pdb-selects-nothing",
+        "kind": "poddisruptionbudget",
+        "when": {"field": "context.matched_pods", "op": "falsy"},
+        "severity": "low",
+        "issue": "PodDisruptionBudget selects no pods",
+        "details": "The budget's selector does not match any pods, so it protects nothing during node drains."
+    },
+    {
+        "id": "networkpolicy-selects-nothing",
+        "kind": "networkpolicy",
+        "when": {"field": "context.matched_pods", "op": "falsy"},
+        "severity": "low",
+        "issue": "NetworkPolicy selects no pods",
+        "details": "The policy's podSelector does not match any pods. Check pod labels and the policy's podSelector."
+    }
+]
+
+def _greater(a, b):
+    return a is not None and a > b
+
+def _greater_equal(a, b):
+    return a is not None and a >= b
+
+def _less(a, b):
+    return a is not None and a < b
+
+def _less_equal(a, b):
+    return a is not None and a <= b
+
+OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": lambda a, b: a == b,
+    "ne": lambda a, b: a != b,
+    "gt": _greater,
+    "ge": _greater_equal,
+    "lt": _less,
+    "le": _less_equal,
+    "in": lambda a, b: a in b,
+    "not_in": lambda a, b: a not in b,
+    "exists": lambda a, b: a is not None,
+    "missing": lambda a, b: a is None,
+    "truthy": lambda a, b: bool(a),
+    "falsy": lambda a, b: not a,
+    "matches": lambda a, b: a is not None and b.search(str(a)) is not None
+}
+
+_placeholder_re = re.compile(r"\{([a-zA-Z0-9_.]+)\}")
+
+# Evaluation scope: (object, foreach item, context)
+Scope = Tuple[Any, Any, Dict[str, Any]]
+
+def compile_path(path: str) -> Callable[[Scope], Any]:
+    """Compile a dotted field path into a getter over an evaluation scope."""
+    segments = path.split(".")
+    root = segments[0]
+
+    if root == "item":
+        index, segments = 1, segments[1:]
+    elif root == "context":
+        index, segments = 2, segments[1:]
+    else:
+        index = 0
+
+    segments = tuple(segments)
+
+    def getter(scope: Scope) -> Any:
+        value = scope[index]
+        for segment in segments:
+            if value is None:
+                return None
+            if isinstance(value, dict) and index == 2:
+                value = value.get(segment)
+            else:
+                value = get_field(value, segment)
+        return value
+
+    return getter
+
+def compile_condition(condition: Dict[str, Any]) -> Callable[[Scope], bool]:
+    """Compile a condition tree into a predicate over an evaluation scope."""
+    if "all" in condition:
+        parts = [compile_condition(part) for part in condition["all"]]
+        return lambda scope: all(part(scope) for part in parts)
+    if "any" in condition:
+        parts = [compile_condition(part) for part in condition["any"]]
+        return lambda scope: any(part(scope) for part in parts)
+    if "not" in condition:
+        part = compile_condition(condition["not"])
+        return lambda scope: not part(scope)
+
+    if "field" not in condition:
+        raise ValueError(f"Condition needs field, all, any or not: {condition}")
+
+    op = condition.get("op", "eq")
+    if op not in OPERATORS:
+        raise ValueError(f"Unknown operator: {op}")
+
+    getter = compile_path(condition["field"])
+    operator = OPERATORS[op]
+    value = condition.get("value")
+    if op == "matches":
+        value = re.compile(value)
+
+    return lambda scope: operator(getter(scope), value)
+
+def compile_template(template: str) -> Callable[[Scope], str]:
+    """Compile a message template with {field.path} placeholders."""
+    parts: List[Any] = []
+    position = 0
+    for match in _placeholder_re.finditer(template):
+        parts.append(template[position:match.start()])
+        parts.append(compile_path(match.group(1)))
+        position = match.end()
+    parts.append(template[position:])
+
+    if len(parts) == 1:
+        return lambda scope: template
+
+    return lambda scope: "".join(part if isinstance(part, str) else str(part(scope)) for part in parts)
+
+class CompiledRule:
+    """A rule compiled once into closures."""
+
+    def __init__(self, rule: Dict[str, Any]):
+        """Compile a rule definition, raising ValueError if it is invalid."""
+        for key in ("id", "kind", "when", "issue"):
+            if key not in rule:
+                raise ValueError(f"Rule {rule.get('id', '<unnamed>')} is missing '{key}'")
+
+        self.id = rule["id"]
+        self.kind = rule["kind"]
+        self.severity = rule.get("severity", "medium")
+        self.issue = rule["issue"]
+        self.foreach = compile_path(rule["foreach"]) if rule.get("foreach") else None
+        self.condition = compile_condition(rule["when"])
+        self.details = compile_template(rule.get("details", ""))
+
+    def evaluate(self, obj: Any, context: Dict[str, Any], issues: List[Dict[str, Any]]):
+        """Append an issue for every match of this rule on obj."""
+        if self.foreach:
+            items = self.foreach((obj, None, context)) or []
+        else:
+            items = (None,)
+
+        for item in items:
+            scope = (obj, item, context)
+            if self.condition(scope):
+                issues.append({
+                    "resource_type": self.kind,
+                    "name": obj.metadata.name,
+                    "namespace": obj.metadata.namespace,
+                    "severity": self.severity,
+                    "issue": self.issue,
+                    "details": self.details(scope),
+                    "rule": self.id
+                })
+
+class RuleEngine:
+    """Evaluates compiled rules grouped by kind, in one pass per object."""
+
+    def __init__(self, rules: List[Dict[str, Any]]):
+        """Compile rules; later rules with the same id replace earlier ones."""
+        by_id: Dict[str, Dict[str, Any]] = {}
+        for rule in rules:
+            by_id[rule.get("id")] = rule
+
+        self.rules: Dict[str, List[CompiledRule]] = {}
+        for rule in by_id.values():
+            if rule.get("enabled", True) is False:
+                continue
+            compiled = CompiledRule(rule)
+            self.rules.setdefault(compiled.kind, []).append(compiled)
+
+    @classmethod
+    def load(cls, pack_paths: Optional[List[str]] = None) -> "RuleEngine":
+        """Build an engine from the built-in rules plus YAML rule packs."""
+        rules = list(BUILTIN_RULES)
+
+        for path in pack_paths or []:
+            try:
+                with open(os.path.expanduser(path), 'r') as f:
+                    pack = yaml.safe_load(f) or []
+                pack_rules = pack.get("rules", []) if isinstance(pack, dict) else pack
+
+                # Compile up front so one bad rule doesn't break the whole engine
+                for rule in pack_rules:
+                    if rule.get("enabled", True) is not False:
+                        CompiledRule(rule)
+                rules.extend(pack_rules)
+            except Exception as e:
+                console.print(f"[red]Error loading rule pack {path}: {e}[/red]")
+
+        return cls(rules)
+
+    def evaluate(self, kind: str, obj: Any, context: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Evaluate every rule for a kind against one object."""
+        issues: List[Dict[str, Any]] = []
+        context = context or {}
+        for rule in self.rules.get(kind, []):
+            rule.evaluate(obj, context, issues)
+        return issues
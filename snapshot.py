@@ -0,0 +1,303 @@
+"""Offline cluster snapshots for Groot CLI.
+
+A snapshot file holds the raw JSON of listed objects, grouped by kind into
+compressed chunks of up to a thousand objects. The chunk index is written at
+the end of the file, so objects can be streamed in while a cluster is being
+listed. Readers map the file into memory and only decode the chunks a query
+touches; chunks record the range of namespaces they contain, so a query for
+one namespace skips the rest.
+
+Chunks are msgpack encoded and zstd compressed when those packages are
+installed, and JSON with zlib otherwise. The index records which was used.
+"""
+
+import collections
+import contextlib
+import datetime
+import gc
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import msgpack
+    msgpack_available = True
+except ImportError:
+    msgpack_available = False
+
+try:
+    import zstandard
+    zstd_available = True
+except ImportError:
+    zstd_available = False
+
+from groot.utils.k8s_objects import ObjectView, loads
+
+MAGIC = b"GROOTSNAP1"
+
+# Kinds saved by default: what the getters and analysis read
+SNAPSHOT_KINDS = [
+    "namespace", "node", "pod", "deployment", "replicaset", "statefulset", "daemonset", "job",
+    "service", "endpoints", "endpointslice", "event", "poddisruptionbudget", "networkpolicy"
+]
+
+# Trailer: index offset, then the magic again
+_trailer = struct.Struct(">Q")
+
+_gc_lock = threading.Lock()
+_gc_pauses = 0
+_gc_was_enabled = False
+
+@contextlib.contextmanager
+def _gc_paused():
+    """Disable cyclic GC while any thread is inside, restoring it when the last one leaves."""
+    global _gc_pauses, _gc_was_enabled
+    with _gc_lock:
+        if _gc_pauses == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if _gc_pauses == 0 and _gc_was_enabled:
+                gc.enable()
+
+def _namespace(item: Dict[str, Any]) -> str:
+    return (item.get("metadata") or {}).get("namespace") or ""
+
+class SnapshotWriter:
+    """Writes objects to a snapshot file chunk by chunk.
+
+    The file is written under a temporary name and moved into place by
+    close(), so an interrupted capture never leaves a truncated snapshot.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 1000, metadata: Dict[str, Any] = None):
+        """Initialize the writer, creating the file."""
+        self.path = os.path.expanduser(path)
+        self.chunk_size = chunk_size
+        self.encoding = "msgpack" if msgpack_available else "json"
+        self.compression = "zstd" if zstd_available else "zlib"
+        self.index: Dict[str, Any] = {
+            "encoding": self.encoding,
+            "compression": self.compression,
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "metadata": metadata or {},
+            "kinds": {}
+        }
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._compressor = zstandard.ZstdCompressor(level=3) if zstd_available else None
+        self._file = open(self.path + ".tmp", "wb")
+        self._file.write(MAGIC)
+
+    def add(self, kind: str, items: List[Dict[str, Any]]):
+        """Add decoded JSON objects of a kind."""
+        pending = self._pending.setdefault(kind, [])
+        self.index["kinds"].setdefault(kind, [])
+        pending.extend(items)
+
+        while len(pending) >= self.chunk_size:
+            self._write_chunk(kind, pending[:self.chunk_size])
+            del pending[:self.chunk_size]
+
+    def _write_chunk(self, kind: str, items: List[Dict[str, Any]]):
+        """Encode, compress and append one chunk."""
+        if self.encoding == "msgpack":
+            data = msgpack.packb(items)
+        else:
+            data = json.dumps(items, separators=(",", ":")).encode()
+        data = self._compressor.compress(data) if self._compressor else zlib.compress(data, 6)
+
+        namespaces = [_namespace(item) for item in items]
+        self.index["kinds"][kind].append({
+            "offset": self._file.tell(),
+            "length": len(data),
+            "count": len(items),
+            "first_namespace": min(namespaces),
+            "last_namespace": max(namespaces)
+        })
+        self._file.write(data)
+
+    def close(self):
+        """Write the remaining chunks and the index, and move the file into place."""
+        for kind, pending in self._pending.items():
+            if pending:
+                self._write_chunk(kind, pending)
+        self._pending = {}
+
+        offset = self._file.tell()
+        self._file.write(zlib.compress(json.dumps(self.index).encode()))
+        self._file.write(_trailer.pack(offset) + MAGIC)
+        self._file.close()
+        os.replace(self.path + ".tmp", self.path)
+
+    def abort(self):
+        """Discard the partly written file."""
+        self._file.close()
+        os.remove(self.path + ".tmp")
+
+class Snapshot:
+    """Read-only access to a snapshot file through a memory map.
+
+    Decoded chunks are kept in an LRU of max_cached_chunks chunks, so
+    repeated queries of the same kind don't decode it again. Safe to use
+    from the scanner's executor threads.
+    """
+
+    def __init__(self, path: str, max_cached_chunks: int = 256):
+        """Open a snapshot file. Raises ValueError if it is not a readable snapshot."""
+        self.path = os.path.expanduser(path)
+        self.max_cached_chunks = max_cached_chunks
+        self._chunks: "collections.OrderedDict[tuple, List[ObjectView]]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is empty")
+
+        trailer_size = _trailer.size + len(MAGIC)
+        if len(self._map) < len(MAGIC) + trailer_size or self._map[:len(MAGIC)] != MAGIC or self._map[-len(MAGIC):] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a Groot snapshot or is incomplete")
+
+        (offset,) = _trailer.unpack(self._map[-trailer_size:-len(MAGIC)])
+        self.index = json.loads(zlib.decompress(self._map[offset:-trailer_size]))
+
+        if self.index["encoding"] == "msgpack" and not msgpack_available:
+            self.close()
+            raise ValueError(f"{path} needs the msgpack package")
+        if self.index["compression"] == "zstd" and not zstd_available:
+            self.close()
+            raise ValueError(f"{path} needs the zstandard package")
+        self._decompressor = zstandard.ZstdDecompressor() if self.index["compression"] == "zstd" else None
+
+    @property
+    def kinds(self) -> List[str]:
+        """Kinds in the snapshot."""
+        return list(self.index["kinds"])
+
+    @property
+    def created(self) -> datetime.datetime:
+        """When the snapshot was taken."""
+        return datetime.datetime.fromisoformat(self.index["created"])
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """What the capture recorded about itself, such as the context and namespace."""
+        return self.index.get("metadata") or {}
+
+    def _chunk(self, kind: str, position: int) -> List[ObjectView]:
+        """Decode a chunk, or take it from the LRU."""
+        key = (kind, position)
+        # One lock covers the LRU and the decode, so a chunk is decoded once however many threads ask
+        with self._lock:
+            items = self._chunks.get(key)
+            if items is not None:
+                self._chunks.move_to_end(key)
+                return items
+
+            entry = self.index["kinds"][kind][position]
+            data = self._map[entry["offset"]:entry["offset"] + entry["length"]]
+            data = self._decompressor.decompress(data) if self._decompressor else zlib.decompress(data)
+
+            # Decoding allocates only containers that outlive it, so cyclic GC passes
+            # over them find nothing and dominate the decode time of large snapshots
+            with _gc_paused():
+                decoded = msgpack.unpackb(data) if self.index["encoding"] == "msgpack" else loads(data)
+                items = [ObjectView(item) for item in decoded]
+
+            self._chunks[key] = items
+            if len(self._chunks) > self.max_cached_chunks:
+                self._chunks.popitem(last=False)
+            return items
+
+    def iter(self, kind: str, namespace: str = None) -> Iterator[ObjectView]:
+        """Stream objects of a kind, optionally in one namespace."""
+        if namespace == "all":
+            namespace = None
+
+        for position, entry in enumerate(self.index["kinds"].get(kind) or []):
+            if namespace is not None and not entry["first_namespace"] <= namespace <= entry["last_namespace"]:
+                continue
+            for item in self._chunk(kind, position):
+                if namespace is None or _namespace(item) == namespace:
+                    yield item
+
+    def list(self, kind: str, namespace: str = None) -> List[ObjectView]:
+        """List objects of a kind, optionally in one namespace."""
+        return list(self.iter(kind, namespace))
+
+    def get(self, kind: str, namespace: Optional[str], name: str) -> Optional[ObjectView]:
+        """Find one object by namespace and name."""
+        for item in self.iter(kind, namespace):
+            if item.metadata.name == name:
+                return item
+        return None
+
+    def count(self, kind: str, namespace: str = None) -> int:
+        """Count objects of a kind; counting all namespaces decodes nothing."""
+        if namespace is None or namespace == "all":
+            return sum(entry["count"] for entry in self.index["kinds"].get(kind) or [])
+        return sum(1 for _ in self.iter(kind, namespace))
+
+    def close(self):
+        """Release the memory map."""
+        self._chunks.clear()
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+def _path_value(obj: Dict[str, Any], path: str) -> Any:
+    """Read a dotted JSON path such as involvedObject.kind."""
+    for key in path.split("."):
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(key)
+    return obj
+
+def match_field_selector(obj: Dict[str, Any], selector: str) -> bool:
+    """Evaluate a field selector (path=value, path==value, path!=value, comma-separated) locally."""
+    for requirement in (part.strip() for part in (selector or "").split(",")):
+        if not requirement:
+            continue
+        if "!=" in requirement:
+            path, value = requirement.split("!=", 1)
+            if str(_path_value(obj, path.strip()) or "") == value.strip():
+                return False
+        else:
+            path, value = requirement.replace("==", "=").split("=", 1)
+            if str(_path_value(obj, path.strip()) or "") != value.strip():
+                return False
+    return True
+
+def match_label_selector(labels: Optional[Dict[str, str]], selector: str) -> bool:
+    """Evaluate an equality-based label selector (key=value, key!=value, key, !key) locally."""
+    labels = labels or {}
+    for requirement in (part.strip() for part in (selector or "").split(",")):
+        if not requirement:
+            continue
+        if "!=" in requirement:
+            key, value = requirement.split("!=", 1)
+            if labels.get(key.strip()) == value.strip():
+                return False
+        elif "=" in requirement:
+            key, value = requirement.replace("==", "=").split("=", 1)
+            if labels.get(key.strip()) != value.strip():
+                return False
+        elif requirement.startswith("!"):
+            if requirement[1:].strip() in labels:
+                return False
+        elif requirement not in labels:
+            return False
+    return True
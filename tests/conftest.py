@@ -0,0 +1,42 @@
+"""Shared fixtures for the Groot CLI tests."""
+
+import asyncio
+import importlib.util
+import pathlib
+import sys
+
+import pytest
+
+# The repository root is the groot package; make it importable under that name
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+if "groot" not in sys.modules:
+    spec = importlib.util.spec_from_file_location("groot", ROOT / "__init__.py", submodule_search_locations=[str(ROOT)])
+    groot = importlib.util.module_from_spec(spec)
+    sys.modules["groot"] = groot
+    spec.loader.exec_module(groot)
+
+@pytest.fixture
+def cluster():
+    """A small synthetic cluster."""
+    from groot.loadtest.generator import SyntheticCluster
+    return SyntheticCluster(pods=200, namespaces=4, seed=7)
+
+@pytest.fixture
+def api_server(cluster, tmp_path):
+    """A fake API server for the synthetic cluster, with a kubeconfig pointing at it."""
+    pytest.importorskip("kubernetes")
+    from groot.loadtest.server import FakeApiServer
+
+    with FakeApiServer(cluster) as server:
+        server.kubeconfig_path = server.kubeconfig(str(tmp_path / "kubeconfig"))
+        yield server
+
+@pytest.fixture
+def scanner(api_server):
+    """A K8sScanner talking to the fake API server through the installed kubernetes client."""
+    from groot.k8s_scanner import K8sScanner
+
+    scanner = K8sScanner(kubeconfig=api_server.kubeconfig_path, io_mode="blocking")
+    asyncio.run(scanner.initialize())
+    yield scanner
+    scanner.close()
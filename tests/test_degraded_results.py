@@ -0,0 +1,45 @@
+"""Tests that API errors are reported as degraded results, not as an empty cluster."""
+
+import asyncio
+
+def _failing(scanner, api_server):
+    """Make every following request fail with a server error, without retries."""
+    scanner.max_retries = 0
+    api_server.error_rate = 1.0
+
+def test_namespaces_stale_after_error(scanner, api_server, cluster):
+    namespaces = asyncio.run(scanner.get_namespaces())
+    assert not namespaces.degraded
+    assert len(namespaces) == len(cluster.objects["namespace"])
+
+    _failing(scanner, api_server)
+    namespaces = asyncio.run(scanner.get_namespaces())
+    assert namespaces.stale and not namespaces.partial
+    assert len(namespaces) == len(cluster.objects["namespace"])
+    assert namespaces.errors
+
+def test_lists_partial_without_last_good_result(scanner, api_server):
+    _failing(scanner, api_server)
+
+    for result in (asyncio.run(scanner.get_namespaces()), asyncio.run(scanner.get_deployments()),
+                   asyncio.run(scanner.get_services())):
+        assert result.partial
+        assert result == []
+        assert result.errors
+
+def test_count_is_unknown_on_error(scanner, api_server):
+    _failing(scanner, api_server)
+    assert asyncio.run(scanner.count_resources("pod")) is None
+
+def test_events_partial_on_error(scanner, api_server):
+    _failing(scanner, api_server)
+    events = asyncio.run(scanner.get_events("all"))
+    assert events.partial and events.errors
+
+    errors = []
+
+    async def stream():
+        return [event async for event in scanner.iter_events("all", errors=errors)]
+
+    assert asyncio.run(stream()) == []
+    assert errors
@@ -0,0 +1,71 @@
+"""Tests for cached API discovery."""
+
+import pytest
+
+from groot.discovery import DiscoveryCache
+
+RESOURCE_LISTS = {
+    "/api/v1": {"resources": [
+        {"name": "pods", "singularName": "pod", "namespaced": True, "kind": "Pod", "shortNames": ["po"]},
+        {"name": "pods/log", "singularName": "", "namespaced": True, "kind": "Pod"}
+    ]},
+    "/apis/apps/v1": {"resources": [
+        {"name": "deployments", "singularName": "deployment", "namespaced": True, "kind": "Deployment", "shortNames": ["deploy"]}
+    ]},
+    "/apis/cert-manager.io/v1": {"resources": [
+        {"name": "certificates", "singularName": "certificate", "namespaced": True, "kind": "Certificate", "shortNames": ["cert"]}
+    ]}
+}
+
+GROUPS = ["apps", "metrics.k8s.io", "cert-manager.io"]
+
+class FakeApi:
+    """get_json for a legacy (non-aggregated) discovery API; failing paths raise."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+
+    def __call__(self, path, accept):
+        if path in self.failing:
+            raise RuntimeError(f"503 Service Unavailable: {path}")
+        if path == "/api":
+            return {"kind": "APIVersions", "versions": ["v1"]}
+        if path == "/apis":
+            return {"kind": "APIGroupList", "groups": [
+                {"name": name, "preferredVersion": {"version": "v1beta1" if name == "metrics.k8s.io" else "v1"}}
+                for name in GROUPS
+            ]}
+        return RESOURCE_LISTS.get(path, {"resources": []})
+
+def test_refresh_resolves_every_name(tmp_path):
+    cache = DiscoveryCache("https://cluster", cache_dir=str(tmp_path))
+    cache.refresh(FakeApi())
+
+    assert cache.lookup("po").plural == "pods"
+    assert cache.lookup("pods/log") is None
+    assert cache.lookup("deploy").prefix == "/apis/apps/v1"
+    assert cache.lookup("certificates.cert-manager.io").kind == "Certificate"
+    assert not cache.stale
+
+def test_failing_group_is_skipped(tmp_path):
+    cache = DiscoveryCache("https://cluster", cache_dir=str(tmp_path))
+    cache.refresh(FakeApi(failing={"/apis/metrics.k8s.io/v1beta1"}))
+
+    assert cache.lookup("deployments") is not None
+    assert cache.lookup("cert").group == "cert-manager.io"
+    # The skipped group is retried on the next refresh
+    assert cache.stale
+
+def test_failing_group_keeps_known_resources(tmp_path):
+    cache = DiscoveryCache("https://cluster", cache_dir=str(tmp_path))
+    cache.refresh(FakeApi())
+    cache.refresh(FakeApi(failing={"/apis/cert-manager.io/v1"}))
+
+    assert cache.lookup("cert").plural == "certificates"
+    assert cache.lookup("deploy") is not None
+    assert cache.stale
+
+def test_failing_core_api_raises(tmp_path):
+    cache = DiscoveryCache("https://cluster", cache_dir=str(tmp_path))
+    with pytest.raises(RuntimeError):
+        cache.refresh(FakeApi(failing={"/api"}))
@@ -0,0 +1,39 @@
+"""Tests for archived event queries."""
+
+import asyncio
+import datetime
+
+from groot.event_archive import EventArchive
+from groot.utils.k8s_objects import ObjectView
+
+def _event(uid, name, reason, event_type, minutes_ago):
+    seen = (datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(minutes=minutes_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return ObjectView({
+        "metadata": {"uid": uid, "namespace": "shop", "name": f"{name}.{uid}"},
+        "involvedObject": {"kind": "Pod", "name": name, "namespace": "shop"},
+        "reason": reason,
+        "type": event_type,
+        "message": f"{reason} on {name}",
+        "count": 1,
+        "firstTimestamp": seen,
+        "lastTimestamp": seen
+    })
+
+def test_archived_events_honour_field_selector(scanner, tmp_path):
+    archive = EventArchive(str(tmp_path / "events.db"))
+    archive.write([
+        _event("1", "web-1", "BackOff", "Warning", 5),
+        _event("2", "web-2", "BackOff", "Warning", 4),
+        _event("3", "web-1", "Pulled", "Normal", 3)
+    ])
+    scanner.event_archive = archive
+    since = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=1)
+
+    def reasons(field_selector):
+        events = asyncio.run(scanner.get_events("shop", field_selector, since=since))
+        return sorted((event["involvedObject"]["name"], event["reason"]) for event in events)
+
+    assert len(reasons(None)) == 3
+    assert reasons("involvedObject.name=web-1") == [("web-1", "BackOff"), ("web-1", "Pulled")]
+    assert reasons("involvedObject.name=web-1,type!=Normal") == [("web-1", "BackOff")]
+    assert reasons("reason=BackOff") == [("web-1", "BackOff"), ("web-2", "BackOff")]
@@ -0,0 +1,36 @@
+"""Tests for the in-memory event index."""
+
+import datetime
+
+from groot.event_index import EventIndex
+
+def _event(name, reason, **times):
+    event = {
+        "type": "Warning",
+        "reason": reason,
+        "message": f"{reason} on {name}",
+        "count": None,
+        "firstTimestamp": None,
+        "lastTimestamp": None,
+        "eventTime": None,
+        "series": None,
+        "involvedObject": {"kind": "Pod", "name": name, "namespace": "shop"}
+    }
+    event.update(times)
+    return event
+
+def test_events_without_legacy_timestamps_are_indexed():
+    now = datetime.datetime.now(datetime.timezone.utc)
+    index = EventIndex()
+    index.add(_event("web-1", "FailedScheduling", eventTime=now - datetime.timedelta(minutes=2)))
+    index.add(_event("web-2", "BackOff", eventTime=now - datetime.timedelta(hours=2),
+                     series={"count": 7, "lastObservedTime": now - datetime.timedelta(minutes=1)}))
+
+    since = now - datetime.timedelta(minutes=15)
+    assert [group.object[2] for group in index.latest(since=since)] == ["web-2", "web-1"]
+    assert index.noisiest(since=since) == [(("Pod", "shop", "web-2"), 7), (("Pod", "shop", "web-1"), 1)]
+    assert sum(count for _, count in index.histogram(since=since)) == 8
+
+    group = index.latest(limit=1)[0]
+    assert group.first_timestamp == now - datetime.timedelta(hours=2)
+    assert group.last_timestamp == now - datetime.timedelta(minutes=1)
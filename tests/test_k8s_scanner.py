@@ -0,0 +1,48 @@
+"""Tests for the Kubernetes scanner against the fake API server."""
+
+import asyncio
+
+import pytest
+
+def test_get_json_uses_installed_client(scanner, cluster):
+    """_get_json goes through the real ApiClient, whatever its call_api signature."""
+    namespace = cluster.objects["namespace"][0]["metadata"]["name"]
+    expected = sum(1 for pod in cluster.objects["pod"] if pod["metadata"]["namespace"] == namespace)
+
+    pods = scanner._get_json(f"/api/v1/namespaces/{namespace}/pods")
+
+    assert pods["kind"] == "PodList"
+    assert len(pods["items"]) == expected
+
+def test_get_json_query_and_accept(scanner):
+    table = scanner._get_json("/api/v1/pods", [("limit", 5)], "application/json;as=Table;g=meta.k8s.io;v=v1")
+
+    assert table["kind"] == "Table"
+    assert len(table["rows"]) == 5
+
+def test_get_json_raises_on_error_status(scanner):
+    from kubernetes.client.rest import ApiException
+
+    with pytest.raises(ApiException) as error:
+        scanner._get_json("/api/v1/namespaces/default/pods/does-not-exist")
+    assert error.value.status == 404
+
+def test_count_resources(scanner, cluster):
+    assert asyncio.run(scanner.count_resources("pod")) == len(cluster.objects["pod"])
+
+def _pod_workloads(issues):
+    return {(issue["namespace"], issue["name"]): issue.get("workload")
+            for issue in issues if issue["resource_type"] == "pod"}
+
+def test_analyze_all_namespaces_rolls_pod_issues_up_to_workloads(scanner, cluster):
+    issues = asyncio.run(scanner.analyze_resources("all"))
+    workloads = _pod_workloads(issues)
+
+    assert workloads
+    assert any(workload and workload.startswith("deployment/") for workload in workloads.values())
+
+    # Every namespace scanned on its own rolls up the same way
+    for namespace in cluster.objects["namespace"]:
+        name = namespace["metadata"]["name"]
+        for key, workload in _pod_workloads(asyncio.run(scanner.analyze_resources(name))).items():
+            assert workloads[key] == workload
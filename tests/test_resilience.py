@@ -0,0 +1,79 @@
+"""Tests for retries and circuit breaking of scanner API calls."""
+
+import asyncio
+import time
+
+import pytest
+
+from groot.resilience import CircuitBreaker, Resilience
+
+def test_breaker_opens_and_recovers():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+def test_released_trial_lets_next_call_try():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+
+def test_cancelled_trial_does_not_hold_circuit_open():
+    pytest.importorskip("kubernetes")
+    from kubernetes.client.rest import ApiException
+    from groot.k8s_scanner import K8sScanner
+
+    scanner = K8sScanner(io_mode="executor")
+    scanner.resilience = Resilience(failure_threshold=1, reset_timeout=0.05, hedge_delay=0)
+    scanner.max_retries = 0
+    behaviour = {"mode": "fail"}
+
+    def read():
+        if behaviour["mode"] == "fail":
+            raise ApiException(status=503, reason="Service Unavailable")
+        if behaviour["mode"] == "slow":
+            time.sleep(0.3)
+        return "ok"
+
+    async def scenario():
+        with pytest.raises(ApiException):
+            await scanner._call(read)
+        await asyncio.sleep(0.06)
+
+        # The half-open trial is cancelled, as FleetScanner's timeouts do
+        behaviour["mode"] = "slow"
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(scanner._call(read), 0.05)
+
+        behaviour["mode"] = "ok"
+        return await scanner._call(read)
+
+    try:
+        assert asyncio.run(scenario()) == "ok"
+    finally:
+        scanner.close()
+
+@pytest.mark.parametrize("path, expected", [
+    ("/api/v1/namespaces/default/pods", "list v1/pods"),
+    ("/api/v1/pods", "list v1/pods"),
+    ("/api/v1/namespaces/team-a/pods/web-1", "get v1/pods"),
+    ("/api/v1/namespaces/team-a/pods/web-1/log", "get v1/pods/log"),
+    ("/apis/apps/v1/namespaces/team-a/deployments/api", "get apps/v1/deployments"),
+    ("/api/v1/namespaces", "list v1/namespaces"),
+    ("/api/v1/namespaces/team-a", "get v1/namespaces"),
+    ("/apis", "get /apis")
+])
+def test_path_endpoint_drops_namespace_and_name(path, expected):
+    from groot.k8s_scanner import _path_endpoint
+    assert _path_endpoint(path) == expected
@@ -0,0 +1,25 @@
+"""Tests for offline cluster snapshots."""
+
+import gc
+from concurrent.futures import ThreadPoolExecutor
+
+from groot.loadtest.generator import SyntheticCluster
+from groot.snapshot import Snapshot
+
+def test_concurrent_reads_share_the_chunk_cache(tmp_path):
+    cluster = SyntheticCluster(pods=3000, namespaces=6, seed=3)
+    path = cluster.write_snapshot(str(tmp_path / "cluster.snapshot"))
+    expected = {kind: len(cluster.objects.get(kind, [])) for kind in ("pod", "replicaset", "service", "event")}
+
+    # A one-chunk LRU makes the threads evict each other's chunks all the time
+    snapshot = Snapshot(path, max_cached_chunks=1)
+    gc_enabled = gc.isenabled()
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            kinds = list(expected) * 10
+            counts = list(executor.map(lambda kind: (kind, len(snapshot.list(kind))), kinds))
+    finally:
+        snapshot.close()
+
+    assert all(count == expected[kind] for kind, count in counts)
+    assert gc.isenabled() == gc_enabled
@@ -1,6 +1,7 @@
 """Helper functions for Groot CLI."""
 
 import datetime
+import re
 from typing import Any, Dict, List, Optional
 
 def format_age(timestamp: datetime.datetime) -> str:
@@ -93,4 +94,35 @@ def parse_duration(duration_str: str) -> Optional[datetime.timedelta]:
     elif unit == 'd':
         return datetime.timedelta(days=value)
     else:
-        return None
\ No newline at end of file
+        return None
+
+def parse_bool(value: Any, default: bool = False) -> bool:
+    """Parse a boolean from a config value or environment string."""
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return bool(value)
+
+    value = str(value).strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return True
+    elif value in ("0", "false", "no", "off", ""):
+        return False
+    else:
+        return default
+
+RFC3339_PATTERN = re.compile(r"(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)(?:\.(\d+))?(Z|[+-]\d\d:\d\d)?$")
+
+def timestamp_sort_key(timestamp: str) -> str:
+    """Sortable form of an RFC 3339 timestamp, whatever its fractional-second precision or UTC offset."""
+    match = RFC3339_PATTERN.match(timestamp)
+    if not match:
+        return timestamp
+
+    seconds, fraction, offset = match.groups()
+    if offset and offset != "Z":
+        utc = datetime.datetime.fromisoformat(seconds + offset).astimezone(datetime.timezone.utc)
+        seconds = utc.strftime("%Y-%m-%dT%H:%M:%S")
+    return f"{seconds}.{fraction or '':0<9}"
@@ -0,0 +1,88 @@
+"""Lightweight views over raw Kubernetes JSON for Groot CLI."""
+
+import datetime
+import json
+import re
+from typing import Any, Dict
+
+try:
+    import orjson
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
+# Attribute names that are already converted to their JSON keys
+_json_keys: Dict[str, str] = {}
+
+_camel_re = re.compile(r"_([a-z0-9])")
+
+# Snake-case suffixes of fields the kubernetes client deserializes as datetimes
+_datetime_suffixes = ("_timestamp", "_time", "_at")
+
+def loads(data: Any) -> Any:
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson_available:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_key(name: str) -> str:
+    """Convert a kubernetes client attribute name to its JSON key (e.g. restart_count -> restartCount)."""
+    key = _json_keys.get(name)
+    if key is None:
+        # The client prefixes Python keywords with an underscore (_continue, _from, _exec)
+        key = _camel_re.sub(lambda m: m.group(1).upper(), name.lstrip("_"))
+        _json_keys[name] = key
+    return key
+
+def parse_timestamp(value: str) -> datetime.datetime:
+    """Parse an RFC 3339 timestamp as sent by the API server."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.datetime.fromisoformat(value)
+
+class ObjectView(dict):
+    """A decoded Kubernetes object that also supports the client's attribute access.
+
+    pod.status.container_statuses[0].restart_count reads
+    pod["status"]["containerStatuses"][0]["restartCount"]. Nested objects are
+    wrapped lazily on first access, timestamps are parsed to datetimes, and
+    missing fields read as None, so code written against the kubernetes
+    client models works unchanged. Map fields such as labels stay plain dicts
+    in behaviour since ObjectView is itself a dict.
+
+    Fields whose names collide with dict methods (items, values, keys) must be
+    read with get_field().
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return get_field(self, name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the object as decoded JSON."""
+        return self
+
+def get_field(obj: Any, name: str) -> Any:
+    """Read a field by client attribute name from a model object or an ObjectView."""
+    if not isinstance(obj, dict):
+        return getattr(obj, name, None)
+
+    key = json_key(name)
+    value = obj.get(key)
+
+    if type(value) is dict:
+        value = ObjectView(value)
+        obj[key] = value
+    elif type(value) is list and value and type(value[0]) is dict:
+        value = [ObjectView(item) if type(item) is dict else item for item in value]
+        obj[key] = value
+    elif type(value) is str and name.endswith(_datetime_suffixes):
+        try:
+            return parse_timestamp(value)
+        except ValueError:
+            return value
+
+    return value
@@ -52,11 +52,32 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop background Kubernetes watches."""
+    k8s_scanner.close()
+
 # Models
 class Query(BaseModel):
     query: str
     namespace: str = "default"
 
+async def collect_cluster_status() -> Dict[str, Any]:
+    """Count pods by phase from a compact snapshot; deployments and services are counted from metadata.
+
+    Counts that could not be read are null, and errors lists what failed.
+    """
+    errors = []
+    snapshot = await k8s_scanner.get_pod_snapshot(errors=errors)
+
+    return {
+        "pod_count": len(snapshot),
+        "deployment_count": await k8s_scanner.count_resources("deployment"),
+        "service_count": await k8s_scanner.count_resources("service"),
+        "pod_statuses": snapshot.phase_counts(),
+        "errors": errors
+    }
+
 # Routes
 @app.get("/", response_class=HTMLResponse)
 async def get_home(request: Request):
@@ -73,7 +94,8 @@ async def get_namespaces():
     """Get all namespaces in the cluster."""
     try:
         namespaces = await k8s_scanner.get_namespaces()
-        return {"namespaces": namespaces}
+        return {"namespaces": list(namespaces), "partial": namespaces.partial, "stale": namespaces.stale,
+                "errors": namespaces.errors}
     except Exception as e:
         return {"error": str(e)}
 
@@ -81,25 +103,19 @@ async def get_namespaces():
 async def get_cluster_status():
     """Get cluster status information."""
     try:
-        pods = await k8s_scanner.get_pods()
-        deployments = await k8s_scanner.get_deployments()
-        services = await k8s_scanner.get_services()
-
-        # Count pod statuses
-        pod_status_counts = {}
-        for pod in pods:
-            status = pod.status.phase
-            pod_status_counts[status] = pod_status_counts.get(status, 0) + 1
-
-        return {
-            "pod_count": len(pods),
-            "deployment_count": len(deployments),
-            "service_count": len(services),
-            "pod_statuses": pod_status_counts
-        }
+        return await collect_cluster_status()
     except Exception as e:
         return {"error": str(e)}
 
+@app.get("/api/requests")
+async def get_request_stats():
+    """Get API request stats: queue depth and wait times per priority lane, retries and open circuits."""
+    return dict(
+        k8s_scanner.scheduler.stats(),
+        resilience=k8s_scanner.resilience.stats,
+        open_circuits=k8s_scanner.resilience.open_circuits()
+    )
+
 @app.post("/api/query")
 async def process_query(query: Query):
     """Process a natural language query."""
@@ -109,8 +125,8 @@ async def process_query(query: Query):
             k8s_context = {
                 "current_namespace": query.namespace,
                 "namespaces": await k8s_scanner.get_namespaces(),
-                "pod_count": len(await k8s_scanner.get_pods()),
-                "deployment_count": len(await k8s_scanner.get_deployments())
+                "pod_count": await k8s_scanner.count_resources("pod"),
+                "deployment_count": await k8s_scanner.count_resources("deployment")
             }
         except Exception:
             k8s_context = {"current_namespace": query.namespace}
@@ -126,6 +142,24 @@ async def process_query(query: Query):
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time communication."""
     await manager.connect(websocket)
+
+    # At most one log stream per connection
+    log_task = None
+
+    async def send_logs(pod: str, namespace: str, container: str = None, since_seconds: int = None):
+        async for line in k8s_scanner.stream_pod_logs(pod, namespace, container=container,
+                                                      since_seconds=since_seconds, tail_lines=100):
+            await manager.send_message(json.dumps({
+                "type": "log_line",
+                "pod": pod,
+                "line": line
+            }), websocket)
+
+        await manager.send_message(json.dumps({
+            "type": "logs_end",
+            "pod": pod
+        }), websocket)
+
     try:
         while True:
             data = await websocket.receive_text()
@@ -141,8 +175,8 @@ async def websocket_endpoint(websocket: WebSocket):
                     k8s_context = {
                         "current_namespace": namespace,
                         "namespaces": await k8s_scanner.get_namespaces(),
-                        "pod_count": len(await k8s_scanner.get_pods()),
-                        "deployment_count": len(await k8s_scanner.get_deployments())
+                        "pod_count": await k8s_scanner.count_resources("pod"),
+                        "deployment_count": await k8s_scanner.count_resources("deployment")
                     }
                 except Exception:
                     k8s_context = {"current_namespace": namespace}
@@ -159,22 +193,7 @@ async def websocket_endpoint(websocket: WebSocket):
             elif data_json.get("type") == "status_update":
                 # Get cluster status
                 try:
-                    pods = await k8s_scanner.get_pods()
-                    deployments = await k8s_scanner.get_deployments()
-                    services = await k8s_scanner.get_services()
-
-                    # Count pod statuses
-                    pod_status_counts = {}
-                    for pod in pods:
-                        status = pod.status.phase
-                        pod_status_counts[status] = pod_status_counts.get(status, 0) + 1
-
-                    status_data = {
-                        "pod_count": len(pods),
-                        "deployment_count": len(deployments),
-                        "service_count": len(services),
-                        "pod_statuses": pod_status_counts
-                    }
+                    status_data = await collect_cluster_status()
 
                     # Send status update
                     await manager.send_message(json.dumps({
@@ -187,8 +206,28 @@ async def websocket_endpoint(websocket: WebSocket):
                         "error": str(e)
                     }), websocket)
 
+            elif data_json.get("type") == "logs":
+                # Follow pod logs; a new request replaces the current stream
+                if log_task:
+                    log_task.cancel()
+                log_task = asyncio.create_task(send_logs(
+                    data_json.get("pod", ""),
+                    data_json.get("namespace", "default"),
+                    data_json.get("container"),
+                    data_json.get("since_seconds")
+                ))
+
+            elif data_json.get("type") == "logs_stop":
+                if log_task:
+                    log_task.cancel()
+                    log_task = None
+
     except WebSocketDisconnect:
         manager.disconnect(websocket)
+    finally:
+        # Cancelling the task closes the log stream to the API server
+        if log_task:
+            log_task.cancel()
 
 def start_web_app(host: str = "0.0.0.0", port: int = 8000):
     """Start the web application."""